@@ -10,19 +10,23 @@ logger = logging.getLogger(__name__)
 
 from network_intelligence import config
 from network_intelligence.identity.resolver import IdentityResolver
+from network_intelligence.identity.store import ResolutionStore
 from network_intelligence.graph.builder import GraphBuilder
 from network_intelligence.graph.exporter import GraphExporter
-from network_intelligence.data_sources.edge_list import EdgeListLoader
+from network_intelligence.graph.streaming import stream_edge_list
+from network_intelligence.data_sources.edge_list import EdgeArrays, EdgeListLoader
 from network_intelligence.data_sources.facebook import FacebookLoader
 from network_intelligence.data_sources.linkedin import LinkedInLoader
 from network_intelligence.data_sources.twitter import TwitterLoader
 from network_intelligence.data_sources.powermem import PowerMemClient
 from network_intelligence.data_sources.csv_loader import CSVLoader
+from network_intelligence.data_sources.parallel import run_loaders
 from network_intelligence.analysis.centrality import CentralityAnalyzer
 from network_intelligence.analysis.metrics import NetworkMetrics
 from network_intelligence.analysis.community import CommunityDetector
 from network_intelligence.analysis.pathfinding import PathFinder
 from network_intelligence.analysis.platform_analysis import PlatformAnalyzer
+from network_intelligence.analysis.cache import AnalysisCache
 from network_intelligence.visualization.graph_viz import NetworkVisualizer
 from network_intelligence.visualization.community_viz import CommunityVisualizer
 from network_intelligence.visualization.path_viz import PathVisualizer
@@ -32,11 +36,23 @@ from network_intelligence.output.json_output import JSONOutputGenerator
 from network_intelligence.output.markdown_output import MarkdownOutputGenerator
 from network_intelligence.output.powermem_writer import PowerMemWriter
 
+def _load_edge_list(filepath: str):
+    """Integer SNAP lists take the array fast path; anything else the generic loader."""
+    loader = EdgeListLoader()
+    try:
+        return loader.load_arrays(filepath)
+    except ValueError:
+        return loader.load(filepath)
+
 def main():
     parser = argparse.ArgumentParser(description="Network Intelligence Engine")
 
     # Data Sources
     parser.add_argument("--from-edge-list", help="Load from SNAP edge list file")
+    parser.add_argument("--stream", action="store_true",
+                        help="Ingest --from-edge-list in chunks of CHUNK_SIZE edges, checkpointing byte offsets")
+    parser.add_argument("--checkpoint", help="Streaming checkpoint file (default: <output-dir>/stream_checkpoint.json); "
+                                             "resuming also needs --identity-store")
     parser.add_argument("--from-facebook", help="Load from Facebook data directory")
     parser.add_argument("--from-linkedin", help="Load from LinkedIn export directory")
     parser.add_argument("--from-twitter", help="Load from Twitter archive directory")
@@ -51,9 +67,12 @@ def main():
     # Operations
     parser.add_argument("--health-check", action="store_true", help="Check PowerMem connection")
     parser.add_argument("--resolve-identities", action="store_true", help="Run identity resolution explicitly")
+    parser.add_argument("--identity-store", default=config.IDENTITY_STORE_PATH or None,
+                        help="SQLite file keeping resolved identities between runs; only new identities are resolved")
 
     # Analysis
     parser.add_argument("--all-centrality", action="store_true", help="Compute all centrality measures")
+    parser.add_argument("--no-cache", action="store_true", help="Recompute analysis instead of reusing cached results")
 
     # Visualization
     parser.add_argument("--visualize", choices=["full", "communities", "path", "centrality", "platforms", "ego"], help="Generate visualization")
@@ -77,49 +96,59 @@ def main():
 
     # Initialize components
     resolver = IdentityResolver()
+    store = None
+    if args.identity_store:
+        store = ResolutionStore(args.identity_store)
+        known = store.load(resolver)
+        logger.info(f"Identity store: {known} identities restored from {args.identity_store}")
     builder = GraphBuilder(resolver)
 
-    # Load Data
-    data_loaded = False
+    # Load Data (resolution is deferred until builder.build()). The loaders read unrelated
+    # inputs, so they run concurrently; results are taken in this (fixed) order.
+    jobs = []
 
-    if args.from_edge_list:
-        loader = EdgeListLoader()
-        # If filename matches standard SNAP name, use ensure_dataset logic inside loader if path is simple name
-        nodes, edges = loader.load(args.from_edge_list)
-        builder.add_data_source(nodes, edges, "facebook_snap")
-        data_loaded = True
+    if args.from_edge_list and args.stream:
+        checkpoint = args.checkpoint or os.path.join(args.output_dir, "stream_checkpoint.json")
+        # Streams straight into the builder and saves the (thread-bound) SQLite store, so it
+        # runs on this thread once the pooled loaders are done
+        jobs.append(("stream", lambda: stream_edge_list(builder, args.from_edge_list, checkpoint, store)))
+    elif args.from_edge_list:
+        jobs.append(("facebook_snap", lambda: _load_edge_list(args.from_edge_list)))
 
     if args.from_facebook:
-        loader = FacebookLoader()
-        nodes, edges = loader.load_data_export(args.from_facebook)
-        builder.add_data_source(nodes, edges, "facebook")
-        data_loaded = True
+        jobs.append(("facebook", lambda: FacebookLoader().load_data_export(args.from_facebook)))
 
     if args.from_linkedin:
-        loader = LinkedInLoader()
-        nodes, edges = loader.load_export(args.from_linkedin)
-        builder.add_data_source(nodes, edges, "linkedin")
-        data_loaded = True
+        jobs.append(("linkedin", lambda: LinkedInLoader().load_export(args.from_linkedin)))
 
     if args.from_twitter:
-        loader = TwitterLoader()
-        nodes, edges = loader.load_archive(args.from_twitter)
-        builder.add_data_source(nodes, edges, "twitter")
-        data_loaded = True
+        jobs.append(("twitter", lambda: TwitterLoader().load_archive(args.from_twitter)))
 
     if args.from_powermem and args.company:
-        client = PowerMemClient()
-        nodes, edges = client.load_company_graph(args.company)
-        builder.add_data_source(nodes, edges, "powermem")
-        data_loaded = True
+        jobs.append(("powermem", lambda: PowerMemClient().load_company_graph(args.company)))
 
     if args.from_file:
-        loader = CSVLoader()
-        nodes, edges = loader.load(args.from_file)
-        builder.add_data_source(nodes, edges, "csv")
-        data_loaded = True
+        jobs.append(("csv", lambda: CSVLoader().load(args.from_file)))
+
+    sources = []
+    edge_arrays = []
+    streamed = None
+    for name, result, _ in run_loaders(jobs, inline=("stream",)):
+        if name == "stream":
+            streamed = result
+            logger.info(f"Streamed {streamed['edges']} edges in {streamed['seconds']:.1f}s "
+                        f"(resumed from byte {streamed['resumed_from']})")
+        elif isinstance(result, EdgeArrays):
+            edge_arrays.append(result)
+        else:
+            nodes, edges = result
+            sources.append((nodes, edges, name))
+
+    for arrays in edge_arrays:
+        builder.add_edge_arrays(arrays)
+        logger.info(f"Edge arrays from {arrays.origin}: {len(arrays)} edges, {arrays.number_of_nodes} nodes")
 
-    if not data_loaded:
+    if not sources and not edge_arrays and streamed is None:
         logger.warning("No data sources specified or loaded.")
         if not args.health_check:
             parser.print_help()
@@ -127,8 +156,19 @@ def main():
 
     # Build Graph
     logger.info("Building graph...")
+    builder.add_data_sources(sources)
     G = builder.build()
-    simple_G = builder.get_simplified_graph()
+    logger.info("Build timings: " + ", ".join(f"{phase}={secs:.2f}s" for phase, secs in builder.timings.items()))
+    blocking = resolver.blocking.stats
+    if blocking:
+        logger.info(f"Identity blocking (last batch): {blocking['candidate_pairs']} candidate pairs of "
+                    f"{blocking['exhaustive_pairs']} ({blocking['reduction_ratio']:.2%} pruned), "
+                    f"{blocking['oversized_blocks']} oversized blocks, largest {blocking['largest_block']}, "
+                    f"pairs by key {blocking['pairs_per_key_type']}")
+    if store:
+        store.save(resolver)
+        store.close()
+    csr_G = builder.get_csr_graph()
     logger.info(f"Graph built: {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
 
     if G.number_of_nodes() == 0:
@@ -146,20 +186,24 @@ def main():
 
     # Run Analysis
     logger.info("Running analysis...")
+    # Results for an unchanged graph are reused across runs
+    cache = None if args.no_cache else AnalysisCache()
 
     # Metrics
-    metrics_analyzer = NetworkMetrics()
-    results["metrics"] = metrics_analyzer.compute_all(simple_G)
+    metrics_analyzer = NetworkMetrics(cache)
+    results["metrics"] = metrics_analyzer.compute_all(csr_G)
 
     # Centrality
-    cent_analyzer = CentralityAnalyzer()
-    results["centrality"] = cent_analyzer.compute_all(simple_G)
-    results["gatekeepers"] = cent_analyzer.find_gatekeepers(simple_G)
+    cent_analyzer = CentralityAnalyzer(cache)
+    results["centrality"] = cent_analyzer.compute_all(csr_G)
+    results["gatekeepers"] = cent_analyzer.find_gatekeepers(csr_G)
 
     # Communities
-    comm_detector = CommunityDetector()
-    comm_results = comm_detector.detect_communities(simple_G, method="greedy_modularity") # Default fast
+    comm_detector = CommunityDetector(cache)
+    comm_results = comm_detector.detect_communities(csr_G, method="greedy_modularity") # Default fast
     results["communities"] = comm_results
+    if cache:
+        logger.info(f"Analysis cache: {cache.hits} hits, {cache.misses} misses")
 
     # Path Analysis
     if args.client and args.target:
@@ -202,6 +246,7 @@ def main():
     if args.visualize:
         logger.info(f"Generating visualization: {args.visualize}...")
         viz_path = os.path.join(args.output_dir, f"{args.visualize}_viz.png")
+        simple_G = csr_G.to_networkx() # NetworkX export for the plotting code
 
         if args.visualize == "full":
             viz = NetworkVisualizer()
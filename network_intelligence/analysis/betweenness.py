@@ -0,0 +1,128 @@
+"""
+Sampled betweenness centrality over the CSR arrays, split across worker processes.
+Each worker runs Brandes' accumulation for a slice of the source sample, a batch of
+sources at a time as sparse-matrix BFS; the partial dependency sums are added up and
+rescaled exactly as nx.betweenness_centrality(G, k=...) does (normalized, no endpoints).
+Results are memoized per graph object so gatekeepers and resilience reuse them.
+"""
+import multiprocessing
+import weakref
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from scipy import sparse
+from typing import Any, Dict, List, Optional
+from network_intelligence import config
+from network_intelligence.graph.csr import AnyGraph, ensure_csr
+
+# Below this many (source x stored edge) visits a pool costs more than it saves
+PARALLEL_MIN_WORK = 20_000_000
+
+# Upper bound on the (nodes x batch) work arrays, in elements
+BATCH_ELEMENTS = 2 ** 22
+
+_memo: "weakref.WeakKeyDictionary[Any, Dict[tuple, Dict[Any, float]]]" = weakref.WeakKeyDictionary()
+
+# Adjacency inherited by forked workers (or passed once to spawned ones)
+_worker_adjacency: Optional[sparse.csr_matrix] = None
+
+def _init_worker(indptr: np.ndarray, indices: np.ndarray, n: int) -> None:
+    global _worker_adjacency
+    _worker_adjacency = sparse.csr_matrix((np.ones(len(indices)), indices, indptr), shape=(n, n))
+
+def _dependency_sums(sources: np.ndarray, adjacency: Optional[sparse.csr_matrix] = None) -> np.ndarray:
+    """Sum of Brandes dependencies delta_s(v) over the given sources, for every node v."""
+    A = adjacency if adjacency is not None else _worker_adjacency
+    n = A.shape[0]
+    totals = np.zeros(n)
+    batch_size = max(1, min(64, BATCH_ELEMENTS // max(n, 1)))
+
+    for start in range(0, len(sources), batch_size):
+        batch = sources[start:start + batch_size]
+        cols = np.arange(len(batch))
+
+        # Forward: level-synchronous BFS counting shortest paths (sigma) per source column
+        dist = np.full((n, len(batch)), -1, dtype=np.int32)
+        sigma = np.zeros((n, len(batch)))
+        dist[batch, cols] = 0
+        sigma[batch, cols] = 1.0
+        level = 0
+        while True:
+            reached = A @ np.where(dist == level, sigma, 0.0)
+            new = (dist < 0) & (reached > 0)
+            if not new.any():
+                break
+            level += 1
+            dist[new] = level
+            sigma[new] = reached[new]
+
+        # Backward: delta(v) = sum over successors w of sigma(v) / sigma(w) * (1 + delta(w))
+        delta = np.zeros((n, len(batch)))
+        safe_sigma = np.where(sigma > 0, sigma, 1.0)
+        for d in range(level, 0, -1):
+            coeff = np.where(dist == d, (1.0 + delta) / safe_sigma, 0.0)
+            delta += np.where(dist == d - 1, sigma * (A @ coeff), 0.0)
+
+        delta[batch, cols] = 0.0
+        totals += delta.sum(axis=1)
+
+    return totals
+
+def _rescale(totals: np.ndarray, n: int, sources: np.ndarray) -> np.ndarray:
+    """NetworkX's normalized, endpoints=False rescaling, including the sampled-source adjustment."""
+    N = n - 1
+    if N < 2:
+        return totals
+    k = len(sources)
+    if k == n:
+        # Every node is a source: plain 1 / ((n - 1)(n - 2))
+        return totals / (N * (N - 1))
+
+    scale = np.full(n, 1.0 / (k * (N - 1)))
+    scale[sources] = 1.0 / ((k - 1) * (N - 1)) if k > 1 else np.nan
+    return totals * scale
+
+def betweenness_scores(G: AnyGraph, k: Optional[int] = None, seed: Optional[int] = None,
+                       workers: Optional[int] = None) -> Dict[Any, float]:
+    """
+    Betweenness centrality, sampling k source nodes (all nodes when k is None or >= n).
+    Memoized per graph object for the same (k, seed).
+    """
+    seed = config.BETWEENNESS_SEED if seed is None else seed
+    memo_key = (k, seed, G.number_of_nodes(), G.number_of_edges())
+    cached = _memo.get(G, {}).get(memo_key)
+    if cached is not None:
+        return cached
+
+    C = ensure_csr(G)
+    n = C.number_of_nodes()
+    if k is None or k >= n:
+        sources = np.arange(n)
+    else:
+        sources = np.sort(np.random.default_rng(seed).choice(n, size=k, replace=False))
+
+    workers = workers or config.MAX_WORKERS
+    work = len(sources) * max(len(C.indices), 1)
+    if workers > 1 and len(sources) > 1 and work >= PARALLEL_MIN_WORK:
+        totals = _parallel_dependency_sums(C.indptr, C.indices, n, sources, workers)
+    else:
+        adjacency = sparse.csr_matrix((np.ones(len(C.indices)), C.indices, C.indptr), shape=(n, n))
+        totals = _dependency_sums(sources, adjacency)
+
+    scores = dict(zip(C.node_ids, _rescale(totals, n, sources).tolist()))
+    _memo.setdefault(G, {})[memo_key] = scores
+    return scores
+
+def _parallel_dependency_sums(indptr: np.ndarray, indices: np.ndarray, n: int,
+                              sources: np.ndarray, workers: int) -> np.ndarray:
+    """Fan source slices out to a process pool and add up the partial sums."""
+    methods = multiprocessing.get_all_start_methods()
+    # fork shares the CSR arrays copy-on-write; other start methods receive them once per worker
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    slices: List[np.ndarray] = [s for s in np.array_split(sources, workers * 4) if len(s)]
+
+    totals = np.zeros(n)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=_init_worker, initargs=(indptr, indices, n)) as pool:
+        for partial in pool.map(_dependency_sums, slices):
+            totals += partial
+    return totals
@@ -0,0 +1,135 @@
+"""
+On-disk cache of analysis results, keyed by a content fingerprint of the simplified graph.
+Per-node scores are stored as float64 arrays in CSR node order (.npy); structured results
+(metrics, communities) are pickled. Reads refresh a file's mtime and writes evict the
+least recently used files once the directory exceeds its size cap.
+"""
+import hashlib
+import logging
+import os
+import pickle
+import weakref
+import numpy as np
+from typing import Any, Callable, Dict, Hashable, List, Optional
+from network_intelligence import config
+from network_intelligence.graph.csr import AnyGraph, CSRGraph, ensure_csr
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored layout or the meaning of a key changes
+CACHE_VERSION = 1
+
+_fingerprints: "weakref.WeakKeyDictionary[Any, tuple]" = weakref.WeakKeyDictionary()
+
+def graph_fingerprint(G: AnyGraph) -> str:
+    """SHA-256 over node IDs and the CSR arrays; parallel MultiGraph edges hash as their summed weight."""
+    size = (G.number_of_nodes(), G.number_of_edges())
+    cached = _fingerprints.get(G)
+    if cached is not None and cached[0] == size:
+        return cached[1]
+
+    C = ensure_csr(G)
+    digest = hashlib.sha256(f"v{CACHE_VERSION}:{C.number_of_nodes()}\n".encode())
+    digest.update("\n".join(repr(node) for node in C.node_ids).encode())
+    for array in (C.indptr, C.indices, C.weights):
+        digest.update(np.ascontiguousarray(array).tobytes())
+    fingerprint = digest.hexdigest()
+    _fingerprints[G] = (size, fingerprint)
+    return fingerprint
+
+def _node_ids(G: AnyGraph) -> List[Hashable]:
+    # Same order CSRGraph.from_networkx uses, so arrays line up with the fingerprint
+    return G.node_ids if isinstance(G, CSRGraph) else list(G.nodes)
+
+class AnalysisCache:
+    def __init__(self, directory: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.directory = directory or config.ANALYSIS_CACHE_DIR
+        self.max_bytes = max_bytes if max_bytes is not None else config.ANALYSIS_CACHE_MAX_MB * 1024 * 1024
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, G: AnyGraph, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, f"{graph_fingerprint(G)}-{key}{suffix}")
+
+    def scores(self, G: AnyGraph, key: str, compute: Callable[[], Dict[Any, float]]) -> Dict[Any, float]:
+        """Per-node scores for `key`, loaded from disk or computed and stored."""
+        path = self._path(G, key, ".npy")
+        node_ids = _node_ids(G)
+        values = self._read(path, lambda f: np.load(f, allow_pickle=False))
+        if values is not None and len(values) == len(node_ids):
+            return dict(zip(node_ids, values.tolist()))
+
+        scores = compute()
+        values = np.array([scores.get(node, 0.0) for node in node_ids], dtype=np.float64)
+        self._write(path, lambda f: np.save(f, values, allow_pickle=False))
+        # Round-trip through the array so hits and misses return the same thing
+        return dict(zip(node_ids, values.tolist()))
+
+    def result(self, G: AnyGraph, key: str, compute: Callable[[], Any]) -> Any:
+        """Arbitrary picklable result for `key`, loaded from disk or computed and stored."""
+        path = self._path(G, key, ".pkl")
+        value = self._read(path, pickle.load)
+        if value is not None:
+            return value
+
+        value = compute()
+        self._write(path, lambda f: pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL))
+        return value
+
+    def _read(self, path: str, load: Callable) -> Any:
+        try:
+            with open(path, "rb") as f:
+                value = load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            # Truncated or foreign file: drop it and recompute
+            logger.warning(f"Discarding unreadable cache entry {path}: {e}")
+            self._remove(path)
+            self.misses += 1
+            return None
+        # Touch on read, so mtime order is least-recently-used order
+        os.utime(path)
+        self.hits += 1
+        return value
+
+    def _write(self, path: str, dump: Callable) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write then rename, so readers never see a partial entry
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                dump(f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry {path}: {e}")
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the directory fits under max_bytes."""
+        stats = self._entries()
+        total = sum(size for _, size, _ in stats)
+        for _, size, path in sorted(stats):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def clear(self) -> None:
+        for _, _, path in self._entries():
+            self._remove(path)
+
+    def _entries(self) -> List[tuple]:
+        try:
+            return [(entry.stat().st_mtime, entry.stat().st_size, entry.path) for entry in os.scandir(self.directory)
+                    if entry.is_file() and entry.name.endswith((".npy", ".pkl"))]
+        except FileNotFoundError:
+            return []
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
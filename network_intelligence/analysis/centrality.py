@@ -1,27 +1,61 @@
 import networkx as nx
 import numpy as np
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any, Optional, Union
 from network_intelligence import config
+from network_intelligence.graph.csr import AnyGraph, CSRGraph, node_attributes
+from network_intelligence.analysis.spectral import SpectralEngine
+from network_intelligence.analysis.betweenness import betweenness_scores
+from network_intelligence.analysis.closeness import closeness_scores
+from network_intelligence.analysis.cache import AnalysisCache
+from network_intelligence.analysis.ranking import ScoreTable
+
+# A SpectralEngine, or a zero-argument callable that returns one (built only when a score is computed)
+EngineSource = Union[SpectralEngine, Callable[[], SpectralEngine]]
+
+def _spectral_engine(G: AnyGraph, engine: Optional[EngineSource]) -> SpectralEngine:
+    if engine is None:
+        return SpectralEngine(G)
+    return engine() if callable(engine) else engine
 
 class CentralityAnalyzer:
-    def compute_all(self, G: nx.Graph) -> Dict[str, List[Dict]]:
+    """Accepts either an nx.Graph or a CSRGraph; CSR inputs stay array-backed where supported."""
+
+    def __init__(self, cache: Optional[AnalysisCache] = None):
+        self.cache = cache
+
+    def _scores(self, G: AnyGraph, key: str, compute) -> Dict[Any, float]:
+        """Per-node scores from the analysis cache when one is configured."""
+        return self.cache.scores(G, key, compute) if self.cache else compute()
+
+    def compute_all(self, G: AnyGraph) -> Dict[str, List[Dict]]:
         """Compute all centrality measures."""
+        # One sparse adjacency build shared by the three spectral measures, made by the first
+        # one the cache cannot answer (none on a full cache hit)
+        engines: List[SpectralEngine] = []
+
+        def engine() -> SpectralEngine:
+            if not engines:
+                engines.append(SpectralEngine(G))
+            return engines[0]
+
         return {
             "degree": self.degree_centrality(G),
             "closeness": self.closeness_centrality(G),
             "betweenness": self.betweenness_centrality(G),
-            "eigenvector": self.eigenvector_centrality(G),
-            "pagerank": self.pagerank(G),
-            "katz": self.katz_centrality(G)
+            "eigenvector": self.eigenvector_centrality(G, engine),
+            "pagerank": self.pagerank(G, engine),
+            "katz": self.katz_centrality(G, engine)
         }
 
-    def _format_results(self, G: nx.Graph, centrality: Dict[Any, float], metric_name: str) -> List[Dict]:
-        """Format centrality results."""
-        sorted_nodes = sorted(centrality.items(), key=lambda x: x[1], reverse=True)
+    def _format_results(self, G: AnyGraph, centrality: Union[Dict[Any, float], ScoreTable],
+                        metric_name: str) -> List[Dict]:
+        """Format the top config.TOP_N_RESULTS entries (O(n) selection, no full sort)."""
+        if not isinstance(centrality, ScoreTable):
+            centrality = ScoreTable.from_dict(centrality)
         results = []
-        for i, (node, score) in enumerate(sorted_nodes[:config.TOP_N_RESULTS]):
+        for i, (node, score) in enumerate(centrality.top(config.TOP_N_RESULTS)):
             # Fetch node attributes
-            attrs = G.nodes[node]
+            attrs = node_attributes(G, node)
             results.append({
                 "node": attrs.get("canonical_name", str(node)),
                 "entity_id": str(node),
@@ -32,55 +66,76 @@ class CentralityAnalyzer:
             })
         return results
 
-    def degree_centrality(self, G: nx.Graph) -> List[Dict]:
-        scores = nx.degree_centrality(G)
-        return self._format_results(G, scores, "degree")
-
-    def closeness_centrality(self, G: nx.Graph) -> List[Dict]:
-        if G.number_of_nodes() > 5000:
-            # Optimization from notebook
-            top_degree = sorted(G.degree, key=lambda x: x[1], reverse=True)[:100]
-            subgraph = G.subgraph([n for n, d in top_degree])
-            scores = nx.closeness_centrality(subgraph)
-        else:
-            scores = nx.closeness_centrality(G)
-        return self._format_results(G, scores, "closeness")
-
-    def betweenness_centrality(self, G: nx.Graph) -> List[Dict]:
-        k = min(1000, G.number_of_nodes())
-        scores = nx.betweenness_centrality(G, k=k)
-        return self._format_results(G, scores, "betweenness")
-
-    def eigenvector_centrality(self, G: nx.Graph) -> List[Dict]:
+    def degree_centrality(self, G: AnyGraph) -> List[Dict]:
+        return self._format_results(G, self._scores(G, "degree", lambda: self._degree_scores(G)), "degree")
+
+    def _degree_scores(self, G: AnyGraph) -> Dict[Any, float]:
+        if isinstance(G, CSRGraph):
+            n = G.number_of_nodes()
+            values = G.degree() / (n - 1) if n > 1 else np.ones(n)
+            return dict(zip(G.node_ids, values.tolist()))
+        return nx.degree_centrality(G)
+
+    def closeness_centrality(self, G: AnyGraph) -> List[Dict]:
+        key = (f"closeness-{config.CLOSENESS_EXACT_MAX_NODES}-{config.CLOSENESS_EPSILON}"
+               f"-{config.CLOSENESS_REFINE_CANDIDATES}-{config.CLOSENESS_SEED}")
+        return self._format_results(G, self._scores(G, key, lambda: self._closeness_scores(G)), "closeness")
+
+    def _closeness_scores(self, G: AnyGraph) -> Dict[Any, float]:
+        if isinstance(G, CSRGraph) or G.number_of_nodes() > config.CLOSENESS_EXACT_MAX_NODES:
+            # Exact BFS on small graphs, pivot-sampled with exact top candidates on large ones
+            return closeness_scores(G)
+        return nx.closeness_centrality(G)
+
+    def _betweenness_scores(self, G: AnyGraph) -> Dict[Any, float]:
+        # Same sample everywhere, so the memoized (and cached) scores are shared
+        k = min(config.BETWEENNESS_SAMPLE_SIZE, G.number_of_nodes())
+        return self._scores(G, f"betweenness-{k}-{config.BETWEENNESS_SEED}", lambda: betweenness_scores(G, k=k))
+
+    def betweenness_centrality(self, G: AnyGraph) -> List[Dict]:
+        return self._format_results(G, self._betweenness_scores(G), "betweenness")
+
+    def eigenvector_centrality(self, G: AnyGraph, engine: Optional[EngineSource] = None) -> List[Dict]:
+        key = f"eigenvector-{config.EIGENVECTOR_MAX_ITER}-{config.EIGENVECTOR_TOLERANCE}"
+        return self._format_results(G, self._scores(G, key, lambda: self._eigenvector_scores(G, engine)), "eigenvector")
+
+    def _eigenvector_scores(self, G: AnyGraph, engine: Optional[EngineSource]) -> Dict[Any, float]:
+        engine = _spectral_engine(G, engine)
         try:
-            scores = nx.eigenvector_centrality(
-                G,
+            values = engine.eigenvector(
                 max_iter=config.EIGENVECTOR_MAX_ITER,
                 tol=config.EIGENVECTOR_TOLERANCE
             )
         except nx.PowerIterationFailedConvergence:
             try:
-                scores = nx.eigenvector_centrality(G, max_iter=config.EIGENVECTOR_MAX_ITER * 2)
+                values = engine.eigenvector(max_iter=config.EIGENVECTOR_MAX_ITER * 2)
             except:
-                scores = nx.eigenvector_centrality_numpy(G)
-        return self._format_results(G, scores, "eigenvector")
+                values = engine.eigenvector_lanczos()
+        return engine.as_dict(values)
 
-    def pagerank(self, G: nx.Graph) -> List[Dict]:
+    def pagerank(self, G: AnyGraph, engine: Optional[EngineSource] = None) -> List[Dict]:
+        return self._format_results(G, self._scores(G, "pagerank", lambda: self._pagerank_scores(G, engine)), "pagerank")
+
+    def _pagerank_scores(self, G: AnyGraph, engine: Optional[EngineSource]) -> Dict[Any, float]:
+        engine = _spectral_engine(G, engine)
         try:
-            scores = nx.pagerank(G)
+            return engine.as_dict(engine.pagerank())
         except:
-             scores = {n: 0.0 for n in G.nodes()}
-        return self._format_results(G, scores, "pagerank")
+            return {n: 0.0 for n in engine.graph.node_ids}
+
+    def katz_centrality(self, G: AnyGraph, engine: Optional[EngineSource] = None) -> List[Dict]:
+        return self._format_results(G, self._scores(G, "katz", lambda: self._katz_scores(G, engine)), "katz")
 
-    def katz_centrality(self, G: nx.Graph) -> List[Dict]:
+    def _katz_scores(self, G: AnyGraph, engine: Optional[EngineSource]) -> Dict[Any, float]:
+        engine = _spectral_engine(G, engine)
         try:
-            scores = nx.katz_centrality(G)
+            return engine.as_dict(engine.katz())
         except:
-             # Fallback or empty if fails (e.g. strict convergence)
-             scores = {n: 0.0 for n in G.nodes()}
-        return self._format_results(G, scores, "katz")
+            # Fallback or empty if fails (e.g. strict convergence)
+            return {n: 0.0 for n in engine.graph.node_ids}
 
-    def find_gatekeepers(self, G: nx.Graph, threshold: float = 0.1) -> List[Dict]:
-        scores = nx.betweenness_centrality(G, k=min(1000, G.number_of_nodes()))
-        gatekeepers = {n: s for n, s in scores.items() if s > threshold}
+    def find_gatekeepers(self, G: AnyGraph, threshold: float = 0.1) -> List[Dict]:
+        # Memoized: reuses the scores from betweenness_centrality() on the same graph
+        scores = ScoreTable.from_dict(self._betweenness_scores(G))
+        gatekeepers = scores.filter(scores.values > threshold)
         return self._format_results(G, gatekeepers, "gatekeeper")
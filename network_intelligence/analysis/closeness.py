@@ -0,0 +1,165 @@
+"""
+Closeness centrality over the CSR arrays, exact or pivot-sampled, split across worker processes.
+Small graphs get exact Wasserman-Faust closeness (nx.closeness_centrality's default) from
+batched multi-source BFS. Above config.CLOSENESS_EXACT_MAX_NODES, total distances are
+estimated from k = ceil(ln n / epsilon^2) sampled pivots per Eppstein-Wang (average distance
+within epsilon * diameter with high probability), and the best candidates are then re-run
+exactly so the reported top-N carry true scores.
+"""
+import math
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from scipy import sparse
+from typing import Any, Dict, List, Optional, Tuple
+from network_intelligence import config
+from network_intelligence.graph.csr import AnyGraph, CSRGraph, ensure_csr
+from network_intelligence.analysis.betweenness import BATCH_ELEMENTS, PARALLEL_MIN_WORK
+
+# Adjacency inherited by forked workers (or passed once to spawned ones)
+_worker_adjacency: Optional[sparse.csr_matrix] = None
+
+def _adjacency(indptr: np.ndarray, indices: np.ndarray, n: int) -> sparse.csr_matrix:
+    return sparse.csr_matrix((np.ones(len(indices), dtype=np.float32), indices, indptr), shape=(n, n))
+
+def _init_worker(indptr: np.ndarray, indices: np.ndarray, n: int) -> None:
+    global _worker_adjacency
+    _worker_adjacency = _adjacency(indptr, indices, n)
+
+def _distance_sums(sources: np.ndarray, adjacency: Optional[sparse.csr_matrix] = None) -> Tuple[np.ndarray, ...]:
+    """
+    BFS from every source, a batch of sources at a time as one sparse-matrix frontier.
+    Returns (per-source distance total, per-source reached count,
+             per-node distance total from the sources, per-node count of sources reaching it).
+    """
+    A = adjacency if adjacency is not None else _worker_adjacency
+    n = A.shape[0]
+    source_totals = np.zeros(len(sources))
+    source_reached = np.zeros(len(sources), dtype=np.int64)
+    node_totals = np.zeros(n)
+    node_hits = np.zeros(n, dtype=np.int64)
+    batch_size = max(1, min(64, BATCH_ELEMENTS // max(n, 1)))
+
+    for start in range(0, len(sources), batch_size):
+        batch = sources[start:start + batch_size]
+        cols = np.arange(len(batch))
+
+        dist = np.full((n, len(batch)), -1, dtype=np.int32)
+        frontier = np.zeros((n, len(batch)), dtype=np.float32)
+        dist[batch, cols] = 0
+        frontier[batch, cols] = 1.0
+        level = 0
+        while True:
+            new = (dist < 0) & ((A @ frontier) > 0)
+            if not new.any():
+                break
+            level += 1
+            dist[new] = level
+            frontier = new.astype(np.float32)
+
+        reached = dist >= 0
+        dist = np.where(reached, dist, 0)
+        source_totals[start:start + len(batch)] = dist.sum(axis=0)
+        source_reached[start:start + len(batch)] = reached.sum(axis=0)
+        node_totals += dist.sum(axis=1)
+        node_hits += reached.sum(axis=1)
+
+    return source_totals, source_reached, node_totals, node_hits
+
+def _run(C: CSRGraph, sources: np.ndarray, workers: int) -> Tuple[np.ndarray, ...]:
+    """_distance_sums over the sources, fanned out to a process pool when the work is large enough."""
+    n = C.number_of_nodes()
+    work = len(sources) * max(len(C.indices), 1)
+    if workers <= 1 or len(sources) <= 1 or work < PARALLEL_MIN_WORK:
+        return _distance_sums(sources, _adjacency(C.indptr, C.indices, n))
+
+    methods = multiprocessing.get_all_start_methods()
+    # fork shares the CSR arrays copy-on-write; other start methods receive them once per worker
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    slices: List[np.ndarray] = [s for s in np.array_split(sources, workers * 4) if len(s)]
+
+    source_parts, reached_parts = [], []
+    node_totals = np.zeros(n)
+    node_hits = np.zeros(n, dtype=np.int64)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=_init_worker, initargs=(C.indptr, C.indices, n)) as pool:
+        # map() yields in slice order, so per-source results line up with sources
+        for totals, reached, partial_totals, partial_hits in pool.map(_distance_sums, slices):
+            source_parts.append(totals)
+            reached_parts.append(reached)
+            node_totals += partial_totals
+            node_hits += partial_hits
+    return np.concatenate(source_parts), np.concatenate(reached_parts), node_totals, node_hits
+
+def _wasserman_faust(totsp: np.ndarray, reached: np.ndarray, n: int) -> np.ndarray:
+    """(r - 1) / totsp * (r - 1) / (n - 1), zero where nothing else is reachable."""
+    others = reached - 1.0
+    values = np.zeros(len(totsp))
+    ok = totsp > 0
+    values[ok] = (others[ok] / totsp[ok]) * (others[ok] / (n - 1))
+    return values
+
+def pivot_count(n: int, epsilon: Optional[float] = None) -> int:
+    """Eppstein-Wang sample size ceil(ln n / epsilon^2), capped at n."""
+    epsilon = epsilon or config.CLOSENESS_EPSILON
+    return min(n, max(1, math.ceil(math.log(max(n, 2)) / epsilon ** 2)))
+
+def closeness_scores(G: AnyGraph, exact: Optional[bool] = None, epsilon: Optional[float] = None,
+                     refine: Optional[int] = None, seed: Optional[int] = None,
+                     workers: Optional[int] = None) -> Dict[Any, float]:
+    """
+    Wasserman-Faust closeness per node. exact=None picks exact BFS up to
+    config.CLOSENESS_EXACT_MAX_NODES nodes and pivot sampling beyond; in sampled mode the
+    `refine` highest estimates (config.CLOSENESS_REFINE_CANDIDATES) are recomputed exactly.
+    """
+    C = ensure_csr(G)
+    n = C.number_of_nodes()
+    workers = workers or config.MAX_WORKERS
+    if n < 2:
+        return dict.fromkeys(C.node_ids, 0.0)
+    if exact is None:
+        exact = n <= config.CLOSENESS_EXACT_MAX_NODES
+
+    if exact:
+        totsp, reached, _, _ = _run(C, np.arange(n), workers)
+        return dict(zip(C.node_ids, _wasserman_faust(totsp, reached, n).tolist()))
+
+    # Component sizes give the exact reachable count r for every node; only the
+    # distance total needs estimating. Pivots are drawn per component in proportion
+    # to its size, so every component gets at least one.
+    _, labels = C.connected_components()
+    sizes = np.bincount(labels)
+    k = pivot_count(n, epsilon)
+    rng = np.random.default_rng(config.CLOSENESS_SEED if seed is None else seed)
+    order = np.argsort(labels, kind="stable")
+    bounds = np.r_[0, np.cumsum(sizes)]
+    pivots = []
+    for label in np.flatnonzero(sizes > 1):
+        members = order[bounds[label]:bounds[label + 1]]
+        quota = min(len(members), math.ceil(k * len(members) / n))
+        pivots.append(members if quota == len(members) else rng.choice(members, size=quota, replace=False))
+    pivots = np.sort(np.concatenate(pivots)) if pivots else np.zeros(0, dtype=np.int64)
+
+    values = np.zeros(n)
+    if len(pivots) == 0:
+        return dict(zip(C.node_ids, values.tolist()))
+    totsp, reached, node_totals, node_hits = _run(C, pivots, workers)
+
+    # Every pivot of a node's component reaches it, so node_hits is that component's pivot count
+    reachable = sizes[labels]
+    estimate = np.zeros(n)
+    has_pivot = node_hits > 0
+    estimate[has_pivot] = reachable[has_pivot] / node_hits[has_pivot] * node_totals[has_pivot]
+    values = _wasserman_faust(estimate, reachable.astype(np.float64), n)
+    values[pivots] = _wasserman_faust(totsp, reached, n)
+
+    # Re-run the best estimates exactly (pivots are exact already)
+    refine = config.CLOSENESS_REFINE_CANDIDATES if refine is None else refine
+    if refine > 0:
+        candidates = np.argpartition(-values, min(refine, n) - 1)[:refine]
+        candidates = np.setdiff1d(candidates, pivots)
+        if len(candidates):
+            totsp, reached, _, _ = _run(C, candidates, workers)
+            values[candidates] = _wasserman_faust(totsp, reached, n)
+
+    return dict(zip(C.node_ids, values.tolist()))
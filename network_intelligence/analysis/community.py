@@ -1,12 +1,27 @@
 import networkx as nx
 from networkx.algorithms import community
 import community as community_louvain # python-louvain
-from typing import Dict, List, Any
+import numpy as np
+from typing import Dict, List, Any, Optional
 from network_intelligence import config
+from network_intelligence.graph.csr import AnyGraph, CSRGraph, ensure_networkx
+from network_intelligence.analysis.cache import AnalysisCache
 
 class CommunityDetector:
-    def detect_communities(self, G: nx.Graph, method: str = "louvain") -> Dict[str, Any]:
+    def __init__(self, cache: Optional[AnalysisCache] = None):
+        self.cache = cache
+
+    def detect_communities(self, G: AnyGraph, method: str = "louvain") -> Dict[str, Any]:
         """Detect communities using specified method."""
+        if self.cache:
+            key = f"communities-{method}-{config.MIN_COMMUNITY_SIZE}"
+            return self.cache.result(G, key, lambda: self._detect_communities(G, method))
+        return self._detect_communities(G, method)
+
+    def _detect_communities(self, G: AnyGraph, method: str) -> Dict[str, Any]:
+        # The modularity optimizers are NetworkX / python-louvain implementations
+        G = ensure_networkx(G)
+
         if method == "louvain":
             # returns partition dict {node: community_id}
             partition = community_louvain.best_partition(G)
@@ -53,8 +68,11 @@ class CommunityDetector:
             "community_count": len(communities_list)
         }
 
-    def analyze_community_structure(self, G: nx.Graph, partition: Dict[str, int]) -> List[Dict]:
+    def analyze_community_structure(self, G: AnyGraph, partition: Dict[str, int]) -> List[Dict]:
         """Analyze each community for leaders and bridges."""
+        if isinstance(G, CSRGraph):
+            return self._analyze_community_structure_csr(G, partition)
+
         communities = {}
         for node, comm_id in partition.items():
             if comm_id not in communities:
@@ -86,3 +104,35 @@ class CommunityDetector:
             })
 
         return sorted(results, key=lambda x: x["size"], reverse=True)
+
+    def _analyze_community_structure_csr(self, G: CSRGraph, partition: Dict[str, int]) -> List[Dict]:
+        """Vectorized analyze_community_structure over the CSR edge arrays."""
+        comm_ids = sorted(set(partition.values()))
+        code = {comm_id: i for i, comm_id in enumerate(comm_ids)}
+        labels = np.array([code[partition[node]] for node in G.node_ids], dtype=np.int64)
+
+        rows = G.edge_rows()
+        internal = labels[rows] == labels[G.indices]
+        loops = rows == G.indices
+        n = G.number_of_nodes()
+        # Degree inside the node's own community (self-loops count twice, as in NetworkX)
+        internal_degree = np.bincount(rows[internal], minlength=n) + np.bincount(rows[loops], minlength=n)
+        is_boundary = np.bincount(rows[~internal], minlength=n) > 0
+
+        results = []
+        for comm_id in comm_ids:
+            members = np.flatnonzero(labels == code[comm_id])
+            size = len(members)
+            if size < config.MIN_COMMUNITY_SIZE:
+                continue
+
+            internal_edges = internal_degree[members].sum() / 2
+            results.append({
+                "community_id": comm_id,
+                "size": size,
+                "leader": G.node_ids[members[np.argmax(internal_degree[members])]],
+                "boundary_nodes_count": int(is_boundary[members].sum()),
+                "density": float(2 * internal_edges / (size * (size - 1))) if size > 1 else 0
+            })
+
+        return sorted(results, key=lambda x: x["size"], reverse=True)
@@ -1,10 +1,26 @@
 import networkx as nx
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from network_intelligence import config
+from network_intelligence.graph.csr import AnyGraph, CSRGraph
+from network_intelligence.analysis.betweenness import betweenness_scores
+from network_intelligence.analysis.cache import AnalysisCache
+from network_intelligence.analysis.ranking import ScoreTable
 
 class NetworkMetrics:
-    def compute_all(self, G: nx.Graph) -> Dict[str, Any]:
+    def __init__(self, cache: Optional[AnalysisCache] = None):
+        self.cache = cache
+
+    def compute_all(self, G: AnyGraph) -> Dict[str, Any]:
         """Compute all network-level metrics."""
+        if self.cache:
+            return self.cache.result(G, "metrics", lambda: self._compute_all(G))
+        return self._compute_all(G)
+
+    def _compute_all(self, G: AnyGraph) -> Dict[str, Any]:
+        if isinstance(G, CSRGraph):
+            return self._compute_all_csr(G)
+
         is_connected = nx.is_connected(G) if G.number_of_nodes() > 0 else False
 
         metrics = {
@@ -35,23 +51,102 @@ class NetworkMetrics:
 
         return metrics
 
-    def analyze_resilience(self, G: nx.Graph, nodes_to_remove: int = 1) -> Dict[str, Any]:
+    def _compute_all_csr(self, G: CSRGraph) -> Dict[str, Any]:
+        """Same metrics as compute_all, computed on the CSR arrays."""
+        n = G.number_of_nodes()
+        m = G.number_of_edges()
+        components, labels = G.connected_components() if n > 0 else (0, np.zeros(0, dtype=np.int32))
+        is_connected = n > 0 and components == 1
+
+        metrics = {
+            "node_count": n,
+            "edge_count": m,
+            "density": 2 * m / (n * (n - 1)) if n > 1 else 0,
+            "is_connected": is_connected,
+            "transitivity": self._transitivity(G),
+            "average_clustering": self._average_clustering(G),
+            "assortativity": self._degree_assortativity(G) if m > 0 else 0.0,
+            "components": components
+        }
+
+        if is_connected and n > 1:
+            metrics["diameter"], metrics["avg_shortest_path"] = self._path_stats(G)
+        else:
+            metrics["diameter"] = None
+            metrics["avg_shortest_path"] = None
+            if n > 0:
+                largest = np.argmax(np.bincount(labels))
+                largest_cc = np.flatnonzero(labels == largest)
+                if len(largest_cc) > 1:
+                    diameter, avg_path = self._path_stats(G.subgraph(largest_cc))
+                    metrics["largest_component_diameter"] = diameter
+                    metrics["largest_component_avg_path"] = avg_path
+                    metrics["largest_component_fraction"] = len(largest_cc) / n
+
+        return metrics
+
+    def _transitivity(self, G: CSRGraph) -> float:
+        triangles = G.triangles().sum()
+        if triangles == 0:
+            return 0.0
+        degree = G.degree() - 2 * G.self_loop_mask()
+        return float(triangles / (degree * (degree - 1)).sum())
+
+    def _average_clustering(self, G: CSRGraph) -> float:
+        if G.number_of_nodes() == 0:
+            raise ZeroDivisionError("average clustering of an empty graph")
+        degree = (G.degree() - 2 * G.self_loop_mask()).astype(np.float64)
+        triads = degree * (degree - 1)
+        clustering = np.divide(G.triangles(), triads, out=np.zeros_like(triads), where=triads > 0)
+        return float(clustering.mean())
+
+    def _degree_assortativity(self, G: CSRGraph) -> float:
+        """Pearson correlation of endpoint degrees over all stored (u, v) entries."""
+        degree = G.degree().astype(np.float64)
+        x = degree[G.edge_rows()]
+        y = degree[G.indices]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cov = (x * y).mean() - x.mean() * y.mean()
+            return float(cov / np.sqrt(x.var() * y.var()))
+
+    def _path_stats(self, G: CSRGraph, batch_size: int = 256) -> tuple:
+        """(diameter, average shortest path length) of a connected graph via batched BFS."""
+        n = G.number_of_nodes()
+        diameter = 0
+        total = 0.0
+        for start in range(0, n, batch_size):
+            dist = G.bfs_distances(np.arange(start, min(start + batch_size, n)))
+            diameter = max(diameter, int(dist.max()))
+            total += dist.sum()
+        return diameter, total / (n * (n - 1))
+
+    def analyze_resilience(self, G: AnyGraph, nodes_to_remove: int = 1) -> Dict[str, Any]:
         """Measure fragmentation after removing top N betweenness nodes."""
         if G.number_of_nodes() <= nodes_to_remove:
             return {"resilience": "collapsed"}
 
-        initial_clustering = nx.average_clustering(G)
-        initial_components = nx.number_connected_components(G)
+        if isinstance(G, CSRGraph):
+            initial_clustering = self._average_clustering(G)
+            initial_components = G.connected_components()[0]
+        else:
+            initial_clustering = nx.average_clustering(G)
+            initial_components = nx.number_connected_components(G)
 
         # Find top betweenness nodes
-        betweenness = nx.betweenness_centrality(G, k=min(100, G.number_of_nodes()))
-        top_nodes = sorted(betweenness, key=betweenness.get, reverse=True)[:nodes_to_remove]
+        # Same sample as CentralityAnalyzer, so the memoized scores are reused
+        betweenness = betweenness_scores(G, k=min(config.BETWEENNESS_SAMPLE_SIZE, G.number_of_nodes()))
+        top_nodes = [node for node, _ in ScoreTable.from_dict(betweenness).top(nodes_to_remove)]
 
-        G_removed = G.copy()
-        G_removed.remove_nodes_from(top_nodes)
+        if isinstance(G, CSRGraph):
+            G_removed = G.remove_nodes(top_nodes)
+            final_clustering = self._average_clustering(G_removed)
+            final_components = G_removed.connected_components()[0]
+        else:
+            G_removed = G.copy()
+            G_removed.remove_nodes_from(top_nodes)
 
-        final_clustering = nx.average_clustering(G_removed)
-        final_components = nx.number_connected_components(G_removed)
+            final_clustering = nx.average_clustering(G_removed)
+            final_components = nx.number_connected_components(G_removed)
 
         return {
             "removed_nodes": top_nodes,
@@ -1,11 +1,17 @@
 import networkx as nx
+import numpy as np
+from scipy.sparse import csgraph
 from typing import List, Dict, Any, Optional
+from network_intelligence.graph.csr import AnyGraph, CSRGraph, ensure_networkx
 
 class PathFinder:
-    def find_shortest_path(self, G: nx.Graph, source: str, target: str) -> Dict[str, Any]:
+    def find_shortest_path(self, G: AnyGraph, source: str, target: str) -> Dict[str, Any]:
         """Unweighted shortest path."""
         try:
-            path = nx.shortest_path(G, source=source, target=target)
+            if isinstance(G, CSRGraph):
+                path = self._csr_path(G, source, target, weighted=False)
+            else:
+                path = nx.shortest_path(G, source=source, target=target)
             return {
                 "source": source,
                 "target": target,
@@ -16,7 +22,7 @@ class PathFinder:
         except nx.NetworkXNoPath:
             return {"source": source, "target": target, "found": False}
 
-    def find_shortest_weighted_path(self, G: nx.Graph, source: str, target: str) -> Dict[str, Any]:
+    def find_shortest_weighted_path(self, G: AnyGraph, source: str, target: str) -> Dict[str, Any]:
         """Weighted shortest path (Dijkstra). weight='weight'."""
         # Note: In our graph, higher weight = stronger connection.
         # Dijkstra minimizes sum of weights.
@@ -30,7 +36,10 @@ class PathFinder:
             return 1.0 / w
 
         try:
-            path = nx.dijkstra_path(G, source, target, weight=weight_func)
+            if isinstance(G, CSRGraph):
+                path = self._csr_path(G, source, target, weighted=True)
+            else:
+                path = nx.dijkstra_path(G, source, target, weight=weight_func)
             return {
                 "source": source,
                 "target": target,
@@ -42,15 +51,40 @@ class PathFinder:
         except nx.NetworkXNoPath:
              return {"source": source, "target": target, "found": False}
 
-    def find_all_paths(self, G: nx.Graph, source: str, target: str, max_length: int = 5) -> List[List[str]]:
+    def _csr_path(self, G: CSRGraph, source: str, target: str, weighted: bool) -> List[str]:
+        """Shortest path on the CSR arrays; weighted paths use distance = 1/weight."""
+        for node in (source, target):
+            if node not in G.index:
+                raise nx.NodeNotFound(f"Node {node} not found in graph")
+        src, tgt = G.index[source], G.index[target]
+
+        matrix = G.to_scipy()
+        if weighted:
+            distances = np.where(G.weights > 0, 1.0 / np.where(G.weights > 0, G.weights, 1.0), 100.0)
+            matrix = matrix.copy()
+            matrix.data = distances
+            _, predecessors = csgraph.dijkstra(matrix, directed=True, indices=src, return_predecessors=True)
+        else:
+            _, predecessors = csgraph.breadth_first_order(matrix, src, directed=True, return_predecessors=True)
+
+        if src != tgt and predecessors[tgt] < 0:
+            raise nx.NetworkXNoPath(f"No path between {source} and {target}.")
+
+        path = [tgt]
+        while path[-1] != src:
+            path.append(predecessors[path[-1]])
+        return [G.node_ids[i] for i in reversed(path)]
+
+    def find_all_paths(self, G: AnyGraph, source: str, target: str, max_length: int = 5) -> List[List[str]]:
         """All simple paths up to max length."""
         try:
-            return list(nx.all_simple_paths(G, source, target, cutoff=max_length))
+            return list(nx.all_simple_paths(ensure_networkx(G), source, target, cutoff=max_length))
         except nx.NetworkXNoPath:
             return []
 
-    def generate_introduction_chain(self, G: nx.Graph, source: str, target: str) -> Dict[str, Any]:
+    def generate_introduction_chain(self, G: AnyGraph, source: str, target: str) -> Dict[str, Any]:
         """Human-readable introduction strategy."""
+        G = ensure_networkx(G)
         path_data = self.find_shortest_weighted_path(G, source, target)
         if not path_data["found"]:
             return {"strategy": "No path found"}
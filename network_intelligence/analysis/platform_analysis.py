@@ -2,6 +2,7 @@ import networkx as nx
 from typing import Dict, List, Any
 from network_intelligence.analysis.centrality import CentralityAnalyzer
 from network_intelligence.analysis.metrics import NetworkMetrics
+from network_intelligence.graph.csr import simplify_multigraph
 
 class PlatformAnalyzer:
     def __init__(self):
@@ -47,21 +48,7 @@ class PlatformAnalyzer:
     def analyze_cross_platform(self, G: nx.MultiGraph) -> Dict[str, Any]:
         """Run full analysis on merged graph."""
         # Need to simplify MultiGraph to Graph for most standard metrics
-        # Builder has get_simplified_graph logic but we don't have builder instance here.
-        # Let's implement simplification logic here or assume G passed is already simple?
-        # The type hint says MultiGraph.
-
-        simple_G = nx.Graph()
-        for u, v, data in G.edges(data=True):
-            w = data.get('weight', 1.0)
-            if simple_G.has_edge(u, v):
-                simple_G[u][v]['weight'] += w
-            else:
-                simple_G.add_edge(u, v, weight=w)
-
-        # Copy node attributes
-        for node, attrs in G.nodes(data=True):
-            simple_G.add_node(node, **attrs)
+        simple_G = simplify_multigraph(G)
 
         return {
             "platform": "cross_platform",
@@ -0,0 +1,73 @@
+"""
+Array-backed per-node scores with O(n) top-N selection and rank queries.
+Top-N uses np.argpartition and only sorts the selected entries; ties keep insertion
+order, so results match sorted(scores.items(), key=score, reverse=True)[:n].
+"""
+import numpy as np
+from typing import Any, Dict, Hashable, List, Sequence, Tuple
+
+class ScoreTable:
+    def __init__(self, node_ids: Sequence[Hashable], values: np.ndarray):
+        self.node_ids = list(node_ids)
+        self.values = np.asarray(values, dtype=np.float64)
+        self._index: Dict[Hashable, int] = {}
+
+    @classmethod
+    def from_dict(cls, scores: Dict[Any, float]) -> "ScoreTable":
+        return cls(list(scores), np.fromiter(scores.values(), dtype=np.float64, count=len(scores)))
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    def top(self, n: int) -> List[Tuple[Hashable, float]]:
+        """The n highest (node, score) pairs, highest first, ties in insertion order."""
+        order = self.top_indices(n)
+        return [(self.node_ids[i], value) for i, value in zip(order.tolist(), self.values[order].tolist())]
+
+    def top_indices(self, n: int) -> np.ndarray:
+        size = len(self.values)
+        n = min(n, size)
+        if n <= 0:
+            return np.zeros(0, dtype=np.int64)
+        # NaN never outranks a real score
+        keys = np.where(np.isnan(self.values), -np.inf, self.values)
+
+        if n < size:
+            cutoff = keys[np.argpartition(-keys, n - 1)[n - 1]]
+            above = np.flatnonzero(keys > cutoff)
+            # Fill the remaining slots with the earliest entries tied at the cutoff
+            tied = np.flatnonzero(keys == cutoff)[:n - len(above)]
+            selected = np.concatenate([above, tied])
+        else:
+            selected = np.arange(size)
+
+        # lexsort: last key is primary -> descending score, then ascending position
+        return selected[np.lexsort((selected, -keys[selected]))]
+
+    def filter(self, mask: np.ndarray) -> "ScoreTable":
+        keep = np.flatnonzero(mask)
+        return ScoreTable([self.node_ids[i] for i in keep.tolist()], self.values[keep])
+
+    def _position(self, node: Hashable) -> int:
+        if not self._index:
+            self._index = {node_id: i for i, node_id in enumerate(self.node_ids)}
+        return self._index[node]
+
+    def rank(self, node: Hashable) -> int:
+        """1-based competition rank ("1224"): one more than the number of strictly higher scores."""
+        return int((self.values > self.values[self._position(node)]).sum()) + 1
+
+    def percentile(self, node: Hashable) -> float:
+        """Percentile rank in [0, 100]: share of scores below, counting ties as half."""
+        return float(self.percentiles([node])[0])
+
+    def percentiles(self, nodes: Sequence[Hashable]) -> np.ndarray:
+        """Percentile ranks for several nodes, one O(n) comparison pass each instead of a sort."""
+        size = len(self.values)
+        result = np.zeros(len(nodes))
+        for j, node in enumerate(nodes):
+            value = self.values[self._position(node)]
+            below = np.count_nonzero(self.values < value)
+            equal = np.count_nonzero(self.values == value)
+            result[j] = 100.0 * (below + 0.5 * equal) / size
+        return result
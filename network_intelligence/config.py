@@ -7,6 +7,15 @@ import os
 # PowerMem
 POWERMEM_URL = os.getenv("POWERMEM_URL", "http://127.0.0.1:43117")
 POWERMEM_TIMEOUT = int(os.getenv("POWERMEM_TIMEOUT", "10"))
+# Pooled keep-alive connections, and retries (exponential backoff) on connection errors and 429/503
+POWERMEM_POOL_SIZE = int(os.getenv("POWERMEM_POOL_SIZE", "8"))
+POWERMEM_RETRIES = int(os.getenv("POWERMEM_RETRIES", "3"))
+POWERMEM_BACKOFF = float(os.getenv("POWERMEM_BACKOFF", "0.2"))
+# Search results per page, and pages fetched at once when the service reports a total
+POWERMEM_PAGE_SIZE = int(os.getenv("POWERMEM_PAGE_SIZE", "500"))
+POWERMEM_CONCURRENCY = int(os.getenv("POWERMEM_CONCURRENCY", "8"))
+# Memories per bulk write request
+POWERMEM_WRITE_BATCH = int(os.getenv("POWERMEM_WRITE_BATCH", "200"))
 
 # Centrality
 EIGENVECTOR_MAX_ITER = int(os.getenv("EIGENVECTOR_MAX_ITER", "1000"))
@@ -55,3 +64,32 @@ TAGS_NETWORK_ANALYSIS = "network-analysis"
 CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", "50000"))
 PROGRESS_REPORT_INTERVAL = int(os.getenv("PROGRESS_REPORT_INTERVAL", "10000"))
 MAX_WORKERS = int(os.getenv("MAX_WORKERS", "4"))
+
+# Betweenness sampling (shared by centrality, gatekeepers and resilience)
+BETWEENNESS_SAMPLE_SIZE = int(os.getenv("BETWEENNESS_SAMPLE_SIZE", "1000"))
+BETWEENNESS_SEED = int(os.getenv("BETWEENNESS_SEED", "42"))
+
+# Closeness: exact BFS up to this many nodes, pivot-sampled estimates beyond
+CLOSENESS_EXACT_MAX_NODES = int(os.getenv("CLOSENESS_EXACT_MAX_NODES", "5000"))
+# Pivot sampling error bound (fraction of the diameter); pivots = ceil(ln n / epsilon^2)
+CLOSENESS_EPSILON = float(os.getenv("CLOSENESS_EPSILON", "0.1"))
+# Highest estimates recomputed exactly, so the reported top-N carry true scores
+CLOSENESS_REFINE_CANDIDATES = int(os.getenv("CLOSENESS_REFINE_CANDIDATES", "200"))
+CLOSENESS_SEED = int(os.getenv("CLOSENESS_SEED", "42"))
+
+# On-disk analysis cache (keyed by graph fingerprint, least recently used entries evicted past the cap)
+ANALYSIS_CACHE_DIR = os.getenv("ANALYSIS_CACHE_DIR", "./.analysis_cache")
+ANALYSIS_CACHE_MAX_MB = int(os.getenv("ANALYSIS_CACHE_MAX_MB", "512"))
+
+# Identity blocking: keys with more members than this use a sorted neighborhood of BLOCKING_WINDOW
+BLOCKING_MAX_BLOCK_SIZE = int(os.getenv("BLOCKING_MAX_BLOCK_SIZE", "200"))
+BLOCKING_WINDOW = int(os.getenv("BLOCKING_WINDOW", "20"))
+
+# Persistent identity resolution store (SQLite); empty disables it
+IDENTITY_STORE_PATH = os.getenv("IDENTITY_STORE_PATH", "")
+
+# Edge list fast path: bytes read and parsed per block
+EDGE_LIST_CHUNK_MB = int(os.getenv("EDGE_LIST_CHUNK_MB", "16"))
+
+# Binary edge stores written on first load of a text edge list, memory-mapped afterwards (empty disables)
+EDGE_STORE_DIR = os.getenv("EDGE_STORE_DIR", "./.edge_cache")
@@ -0,0 +1,144 @@
+"""
+Columnar CSV ingestion.
+The header is resolved once and the file is read in blocks that become per-column lists
+(one str.split per plain block, the C csv reader plus a zip() transpose otherwise), so
+there is no dict per row and the field count of every line is checked in one vectorized pass. Typed conversion (float weights,
+uint8 category codes, int32 node indices) then runs over whole columns.
+"""
+import csv
+import io
+from itertools import chain, count, islice
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from network_intelligence.data_sources.edge_list import first_appearance_index
+
+# Characters split per block on the fast path, and rows per block on the csv module path
+CSV_BLOCK_CHARS = 1 << 22
+CSV_BLOCK_ROWS = 1 << 16
+# Largest fixed-width string array factorize() builds; wider data takes the dict pass
+FACTORIZE_MAX_BYTES = 1 << 28
+
+def read_columns(filepath: str, columns: Optional[Sequence[str]] = None, encoding: Optional[str] = None,
+                 block_chars: Optional[int] = None) -> Tuple[List[str], Dict[str, List[Optional[str]]]]:
+    """
+    (header, {name: values}) for the named columns (all by default) that the file has.
+    Blocks without quotes and with a full set of fields on every line are split in one
+    str.split() and sliced per column; from the first block that needs it, the csv module
+    parses the rest. Blank lines are skipped; short rows read as None in their missing
+    cells, like DictReader.
+    """
+    block_chars = block_chars or CSV_BLOCK_CHARS
+    with open(filepath, 'r', encoding=encoding, newline='') as f:
+        header = next(csv.reader([f.readline()]), [])
+        wanted = [(name, header.index(name)) for name in (columns or header) if name in header]
+        width = len(header)
+        values: Dict[str, List[Optional[str]]] = {name: [] for name, _ in wanted}
+        while True:
+            block = f.read(block_chars)
+            if not block:
+                break
+            # Whole lines only
+            block += f.readline()
+            body = block.replace("\r\n", "\n") if "\r" in block else block
+            body = body[:-1] if body.endswith("\n") else body
+            lines = body.count("\n") + 1
+            if width > 1 and '"' not in body and "\r" not in body and body.count(",") == (width - 1) * lines \
+                    and _uniform_lines(body, width):
+                flat = body.replace("\n", ",").split(",")
+                for name, i in wanted:
+                    values[name].extend(flat[i::width])
+                continue
+            _read_rows(csv.reader(chain(io.StringIO(block), f)), width, wanted, values)
+            break
+    return header, values
+
+def _uniform_lines(body: str, width: int) -> bool:
+    """Whether every line of an unquoted block has exactly width - 1 commas (no blank lines)."""
+    # Separators in order must be width - 1 commas, a newline, width - 1 commas, ... (UTF-8
+    # continuation bytes never equal "," or "\n", so the encoded bytes can be scanned)
+    data = np.frombuffer(body.encode("utf-8"), dtype=np.uint8)
+    separators = data[(data == 10) | (data == 44)]
+    return np.array_equal(np.flatnonzero(separators == 10), np.arange(width - 1, len(separators), width))
+
+def _read_rows(reader, width: int, wanted: List[Tuple[str, int]], values: Dict[str, List[Optional[str]]]) -> None:
+    while True:
+        rows = list(islice(reader, CSV_BLOCK_ROWS))
+        if not rows:
+            return
+        if any(len(row) != width for row in rows):
+            rows = [row[:width] + [None] * (width - len(row)) for row in rows if row]
+            if not rows:
+                continue
+        transposed = list(zip(*rows))
+        for name, i in wanted:
+            values[name].extend(transposed[i])
+
+def categorical(values: Optional[Sequence[Optional[str]]], n: int, default: str) -> Tuple[List[str], np.ndarray]:
+    """(names, uint8 codes) for a column; a missing column or cell takes `default`."""
+    if values is None:
+        return [default], np.zeros(n, dtype=np.uint8)
+    lookup: Dict[str, int] = {}
+    codes = np.fromiter((lookup.setdefault(default if v is None else v, len(lookup)) for v in values),
+                        dtype=np.int64, count=n)
+    if len(lookup) > 256:
+        raise ValueError(f"At most 256 distinct categories per column, got {len(lookup)}")
+    return list(lookup) or [default], codes.astype(np.uint8)
+
+def float_column(values: Optional[Sequence[Optional[str]]], n: int, default: float = 1.0,
+                 dtype=np.float64) -> np.ndarray:
+    """A numeric column parsed in one C-level pass; empty or missing cells take `default`."""
+    if values is None:
+        return np.full(n, default, dtype=dtype)
+    try:
+        return np.fromiter(map(float, values), dtype=np.float64, count=n).astype(dtype, copy=False)
+    except (TypeError, ValueError):
+        return np.array([float(v) if v else default for v in values], dtype=dtype)
+
+def factorize(values: Sequence[Optional[str]]) -> Tuple[List[Optional[str]], np.ndarray]:
+    """
+    Distinct values in first-appearance order, and the int64 label of every value.
+    Strings are hashed as fixed-width numpy rows and grouped with one sort; the grouping is
+    then checked exactly (a hash collision falls back to a dict pass).
+    """
+    n = len(values)
+    if n and None not in values:
+        text = np.array(values, dtype=np.str_)
+        if text.dtype.itemsize * n <= FACTORIZE_MAX_BYTES:
+            chars = text.dtype.itemsize // 4
+            if chars % 2:
+                text = text.astype(f"<U{chars + 1}")
+            words = text.view(np.uint64).reshape(n, -1)
+            hashed = words[:, 0].copy()
+            for k in range(1, words.shape[1]):
+                hashed *= np.uint64(0x9E3779B97F4A7C15)
+                hashed ^= words[:, k]
+            _, first, labels = np.unique(hashed, return_index=True, return_inverse=True)
+            labels = labels.ravel()
+            if np.array_equal(text, text[first[labels]]):
+                order = np.argsort(first, kind="stable")
+                rank = np.empty(len(order), dtype=np.int64)
+                rank[order] = np.arange(len(order))
+                return [values[i] for i in first[order].tolist()], rank[labels]
+    lookup = dict(zip(dict.fromkeys(values), count()))
+    return list(lookup), np.fromiter(map(lookup.__getitem__, values), dtype=np.int64, count=n)
+
+def index_nodes(sources: Sequence[str], targets: Sequence[str],
+                platform_codes: Optional[np.ndarray] = None) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Number the handles of an edge list in first-appearance order (source before target per
+    edge). With platform codes, a handle on two platforms is two nodes. Returns
+    (node handles, int32 source indices, int32 target indices).
+    """
+    m = len(sources)
+    keys: List[Optional[str]] = [None] * (2 * m)
+    keys[0::2] = sources
+    keys[1::2] = targets
+    handles, index = factorize(keys)
+    if platform_codes is not None and platform_codes.any():
+        # (handle, platform) pairs as dense integers, relabeled in first-appearance order
+        platforms = int(platform_codes.max()) + 1
+        combined = index * platforms + np.repeat(platform_codes.astype(np.int64), 2)
+        node_keys, index = first_appearance_index(combined)
+        handles = [handles[h] for h in (node_keys // platforms).tolist()]
+    index = index.astype(np.int32, copy=False)
+    return handles, np.ascontiguousarray(index[0::2]), np.ascontiguousarray(index[1::2])
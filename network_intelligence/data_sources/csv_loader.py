@@ -1,7 +1,13 @@
-import csv
 import os
-from typing import List, Tuple, Dict, Any
+from itertools import repeat
+from typing import List, Tuple, Dict, Any, Optional
+from network_intelligence.data_sources.csv_columns import categorical, float_column, index_nodes, read_columns
+from network_intelligence.data_sources.edge_list import EdgeArrays, load_cached_arrays
 from network_intelligence.identity.entity import PlatformIdentity
+from network_intelligence.identity.table import IdentityTable
+
+# Columns of the relationship layout
+EDGE_COLUMNS = ("source", "target", "platform", "relationship", "weight")
 
 class CSVLoader:
     def load(self, filepath: str) -> Tuple[List[PlatformIdentity], List[Dict]]:
@@ -13,38 +19,102 @@ class CSVLoader:
         """
         if not os.path.exists(filepath):
             return [], []
-
+        header, columns = read_columns(filepath)
         identities = []
-        edges = []
-
-        with open(filepath, 'r') as f:
-            reader = csv.DictReader(f)
-            headers = reader.fieldnames
-
-            for row in reader:
-                # Relationship format
-                if "source" in headers and "target" in headers:
-                    edges.append({
-                        "source": row["source"],
-                        "target": row["target"],
-                        "platform": row.get("platform", "csv"),
-                        "relationship": row.get("relationship", "connected"),
-                        "weight": float(row.get("weight", 1.0)),
-                        "source_data_origin": filepath
-                    })
-
-                # Identity format
-                if "id" in headers or "name" in headers:
-                    identities.append(PlatformIdentity(
-                        platform=row.get("platform", "csv"),
-                        handle=row.get("id") or row.get("name"),
-                        display_name=row.get("name") or row.get("id"),
-                        profile_url=row.get("url", ""),
-                        numeric_id=row.get("numeric_id"),
-                        title=row.get("title"),
-                        company=row.get("company"),
-                        verified=False,
-                        raw_data=row
-                    ))
-
-        return identities, edges
+        if "id" in header or "name" in header:
+            rows = [dict(zip(header, values)) for values in zip(*(columns[name] for name in header))]
+            identities = [
+                PlatformIdentity(
+                    platform=platform,
+                    handle=handle,
+                    display_name=name,
+                    profile_url=url,
+                    numeric_id=numeric_id,
+                    title=title,
+                    company=company,
+                    verified=False,
+                    raw_data=row
+                )
+                for platform, handle, name, url, numeric_id, title, company, row in zip(
+                    *self._identity_columns(header, columns), rows)
+            ]
+        return identities, self._edges(filepath, header, columns)
+
+    def load_table(self, filepath: str, keep_raw: bool = False) -> Tuple[IdentityTable, List[Dict]]:
+        """
+        load() with the identities in a columnar IdentityTable (repeated titles and companies
+        interned); the CSV rows are only kept as raw_data with keep_raw.
+        """
+        if not os.path.exists(filepath):
+            return IdentityTable(keep_raw), []
+        header, columns = read_columns(filepath)
+        if not ("id" in header or "name" in header):
+            return IdentityTable(keep_raw), self._edges(filepath, header, columns)
+        platforms, handles, names, urls, numeric_ids, titles, companies = (
+            list(column) for column in self._identity_columns(header, columns))
+        rows = None
+        if keep_raw or "email" in header:
+            rows = [dict(zip(header, values)) for values in zip(*(columns[name] for name in header))]
+        table = IdentityTable.from_columns(platforms, handles, names, urls, numeric_ids, titles, companies,
+                                           raw_data=rows, keep_raw=keep_raw)
+        return table, self._edges(filepath, header, columns)
+
+    def _rows(self, columns: Dict[str, List]) -> int:
+        return len(next(iter(columns.values()), []))
+
+    def _column(self, columns: Dict[str, List], name: str, default: Any):
+        return columns[name] if name in columns else repeat(default, self._rows(columns))
+
+    def _identity_columns(self, header: List[str], columns: Dict[str, List]):
+        """platform, handle, display_name, profile_url, numeric_id, title, company columns."""
+        ids = self._column(columns, "id", None)
+        names = self._column(columns, "name", None)
+        ids, names = list(ids), list(names)
+        return (self._column(columns, "platform", "csv"),
+                [i or n for i, n in zip(ids, names)],
+                [n or i for i, n in zip(ids, names)],
+                self._column(columns, "url", ""),
+                self._column(columns, "numeric_id", None),
+                self._column(columns, "title", None),
+                self._column(columns, "company", None))
+
+    def _edges(self, filepath: str, header: List[str], columns: Dict[str, List]) -> List[Dict]:
+        if "source" not in header or "target" not in header:
+            return []
+        weights = float_column(columns.get("weight"), self._rows(columns)).tolist()
+        return [
+            {
+                "source": source,
+                "target": target,
+                "platform": platform,
+                "relationship": relationship,
+                "weight": weight,
+                "source_data_origin": filepath
+            }
+            for source, target, platform, relationship, weight in zip(
+                columns["source"], columns["target"], self._column(columns, "platform", "csv"),
+                self._column(columns, "relationship", "connected"), weights)
+        ]
+
+    def load_edge_arrays(self, filepath: str, cache: bool = True) -> EdgeArrays:
+        """
+        Relationship-format CSV (source, target and no identity columns) as EdgeArrays for
+        GraphBuilder.add_edge_arrays(), memory-mapped from an EdgeStore on repeated runs.
+        Like the SNAP fast path, handles become nodes directly, without identity resolution.
+        Raises ValueError for other layouts.
+        """
+        return load_cached_arrays(filepath, lambda: self._parse_edge_arrays(filepath), cache,
+                                  name_format="{}", url_format="")
+
+    def _parse_edge_arrays(self, filepath: str) -> EdgeArrays:
+        header, columns = read_columns(filepath, EDGE_COLUMNS)
+        if "source" not in header or "target" not in header or "id" in header or "name" in header:
+            raise ValueError(f"{filepath} is not a relationship-only CSV")
+        m = len(columns["source"])
+        platforms, platform_codes = categorical(columns.get("platform"), m, "csv")
+        relationships, relationship_codes = categorical(columns.get("relationship"), m, "connected")
+        # Nodes are keyed per platform, as the builder keys handles
+        weights = float_column(columns.get("weight"), m)
+        handles, src, dst = index_nodes(columns["source"], columns["target"], platform_codes)
+        return EdgeArrays(handles, src, dst, platforms, platform_codes, relationships, relationship_codes, weights,
+                          name_format="{}", url_format="", origin=filepath)
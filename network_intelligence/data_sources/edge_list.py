@@ -2,8 +2,227 @@ import os
 import urllib.request
 import gzip
 import shutil
-from typing import List, Tuple, Dict
+import warnings
+import numpy as np
+from itertools import repeat
+from typing import Callable, List, Tuple, Dict, Optional, Sequence
+from network_intelligence import config
 from network_intelligence.identity.entity import PlatformIdentity
+from network_intelligence.identity.table import IdentityTable
+from network_intelligence.graph.edge_store import EdgeStore, cache_path, open_cached, source_fingerprint
+
+def _two_fields_per_line(data: bytes) -> bool:
+    """Whether every line of a block of whole lines holds exactly two whitespace-separated fields."""
+    chars = np.frombuffer(data, dtype=np.uint8)
+    newline = chars == 10
+    # Common layout: one space or tab between the fields, so separators alternate gap, newline
+    marks = chars[newline | (chars == 32) | (chars == 9)]
+    if len(marks) % 2 == 0 and (marks[1::2] == 10).all() and not (marks[0::2] == 10).any():
+        return True
+    # Otherwise field starts and line ends, in order, must run field, field, newline, ...
+    space = newline | (chars == 32) | ((chars >= 9) & (chars <= 13))
+    starts = ~space
+    starts[1:] &= space[:-1]
+    events = newline[starts | newline]
+    return np.array_equal(np.flatnonzero(events), np.arange(2, len(events), 3))
+
+def _parse_block(data: bytes) -> np.ndarray:
+    """Node IDs of a block of whole lines, flattened as src, dst, src, dst, ..."""
+    # Fast path: NumPy's C text parser, taken when every line holds two integer fields
+    # (it raises on anything else that is not whitespace, such as comments)
+    values = None
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            values = np.fromstring(data, dtype=np.int64, sep=" ")
+        except (DeprecationWarning, ValueError):
+            pass
+    # The count alone would accept a 3-field line next to a 1-field one, pairing IDs across lines
+    if values is not None and len(values) == 2 * data.count(b"\n") and _two_fields_per_line(data):
+        return values
+
+    # Comments, blank lines or lines with another field count: line by line, skipping like load()
+    pairs = []
+    for line in data.split(b"\n"):
+        parts = line.split()
+        if len(parts) != 2 or line.lstrip().startswith(b"#"):
+            continue
+        try:
+            pairs.extend((int(parts[0]), int(parts[1])))
+        except ValueError:
+            raise ValueError(f"Non-integer node ID in edge list line: {line[:80]!r}")
+    return np.array(pairs, dtype=np.int64)
+
+def parse_edge_list(filepath: str, chunk_bytes: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse a whitespace-separated edge list with integer node IDs into (src, dst) int64 arrays,
+    reading buffered blocks of whole lines instead of one Python string per line.
+    """
+    chunk_bytes = chunk_bytes or config.EDGE_LIST_CHUNK_MB * 1024 * 1024
+    blocks = []
+    tail = b""
+    with open(filepath, "rb") as f:
+        while True:
+            data = f.read(chunk_bytes)
+            if not data:
+                break
+            data = tail + data
+            cut = data.rfind(b"\n") + 1
+            data, tail = data[:cut], data[cut:]
+            if data:
+                blocks.append(_parse_block(data))
+    if tail.strip():
+        blocks.append(_parse_block(tail + b"\n"))
+
+    values = np.concatenate(blocks) if blocks else np.zeros(0, dtype=np.int64)
+    return values[0::2], values[1::2]
+
+def first_appearance_index(flat: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Relabel integer IDs as 0..k-1 in order of first appearance.
+    Returns (the distinct IDs in that order, int32 labels of flat).
+    """
+    if len(flat) and flat.min() >= 0 and flat.max() < 4 * len(flat):
+        # Typical SNAP IDs are dense: position tables indexed by node ID, no sort over edges
+        first = np.full(int(flat.max()) + 1, len(flat), dtype=np.int64)
+        np.minimum.at(first, flat, np.arange(len(flat)))
+        present = np.flatnonzero(first < len(flat))
+        node_ids = present[np.argsort(first[present], kind="stable")]
+        table = np.empty(len(first), dtype=np.int32)
+        table[node_ids] = np.arange(len(node_ids), dtype=np.int32)
+        return node_ids, table[flat]
+    unique, first, inverse = np.unique(flat, return_index=True, return_inverse=True)
+    order = np.argsort(first, kind="stable")
+    rank = np.empty(len(order), dtype=np.int32)
+    rank[order] = np.arange(len(order), dtype=np.int32)
+    return unique[order], rank[inverse.ravel()]
+
+class EdgeArrays:
+    """
+    An edge list held as arrays: a node-ID table, per-edge int32 indices into it, weights and
+    per-edge platform / relationship codes. Identities and edge dicts are only built on request.
+    A node belongs to the platform of its edges.
+    """
+
+    def __init__(self, node_ids: Sequence, src: np.ndarray, dst: np.ndarray, platforms: List[str],
+                 platform_codes: Optional[np.ndarray] = None, relationships: Sequence[str] = ("friend",),
+                 relationship_codes: Optional[np.ndarray] = None, weights: Optional[np.ndarray] = None,
+                 name_format: str = "Node {}", url_format: str = "http://facebook.com/{}",
+                 origin: Optional[str] = None):
+        self.node_ids = node_ids
+        self.src = src
+        self.dst = dst
+        self.platforms = list(platforms)
+        self.platform_codes = platform_codes if platform_codes is not None else np.zeros(len(src), dtype=np.uint8)
+        self.relationships = list(relationships)
+        self.relationship_codes = (relationship_codes if relationship_codes is not None
+                                   else np.zeros(len(src), dtype=np.uint8))
+        # None: every edge weighs 1.0
+        self.weights = weights
+        self.name_format = name_format
+        self.url_format = url_format
+        self.origin = origin
+
+    @classmethod
+    def from_pairs(cls, src_ids: np.ndarray, dst_ids: np.ndarray, platform: str, **kwargs) -> "EdgeArrays":
+        """Number raw integer node IDs in first-appearance order, the order load() creates identities in."""
+        node_ids, index = first_appearance_index(np.stack([src_ids, dst_ids], axis=1).ravel())
+        return cls(node_ids, np.ascontiguousarray(index[0::2]), np.ascontiguousarray(index[1::2]),
+                   [platform], **kwargs)
+
+    @classmethod
+    def from_store(cls, store: EdgeStore, **kwargs) -> "EdgeArrays":
+        """Arrays backed by a memory-mapped EdgeStore (no copy until they are used)."""
+        return cls(store.node_ids(), store.src, store.dst, store.categories["platform"], store.codes("platform"),
+                   store.categories["relationship"], store.codes("relationship"),
+                   store.weights if store.weighted else None,
+                   origin=kwargs.pop("origin", (store.source or {}).get("path")), **kwargs)
+
+    def to_store(self, path: str, source: Optional[Dict] = None) -> None:
+        EdgeStore.write(path, self.handles(), self.src, self.dst, self.weights,
+                        {"platform": (self.platforms, self.platform_codes),
+                         "relationship": (self.relationships, self.relationship_codes)},
+                        source)
+
+    def __len__(self) -> int:
+        return len(self.src)
+
+    @property
+    def number_of_nodes(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def platform(self) -> str:
+        """The platform of a single-platform list (e.g. SNAP)."""
+        return self.platforms[0]
+
+    def handles(self) -> List[str]:
+        node_ids = self.node_ids.tolist() if isinstance(self.node_ids, np.ndarray) else self.node_ids
+        return [str(node) for node in node_ids]
+
+    def node_platforms(self) -> List[str]:
+        """Platform name per node, taken from its edges."""
+        if len(self.platforms) == 1:
+            return self.platforms * self.number_of_nodes
+        codes = np.zeros(self.number_of_nodes, dtype=np.uint8)
+        codes[self.src] = self.platform_codes
+        codes[self.dst] = self.platform_codes
+        return [self.platforms[code] for code in codes.tolist()]
+
+    def identities(self) -> List[PlatformIdentity]:
+        """The node table as PlatformIdentity objects, as load() returns it."""
+        return [
+            PlatformIdentity(
+                platform=platform,
+                handle=handle,
+                display_name=self.name_format.format(handle),
+                profile_url=self.url_format.format(handle), # Fake URL
+                numeric_id=handle,
+                title=None,
+                company=None,
+                verified=False,
+                raw_data={"id": handle}
+            )
+            for handle, platform in zip(self.handles(), self.node_platforms())
+        ]
+
+    def identity_table(self, keep_raw: bool = False) -> IdentityTable:
+        """identities() as a columnar IdentityTable; raw_data ({"id": handle}) only when keep_raw."""
+        table = IdentityTable(keep_raw)
+        for handle, platform in zip(self.handles(), self.node_platforms()):
+            table.add_row(platform, handle, self.name_format.format(handle), self.url_format.format(handle),
+                          numeric_id=handle, raw_data={"id": handle} if keep_raw else None)
+        return table
+
+    def edges(self) -> List[Dict]:
+        """Per-edge dicts, as load() returns them."""
+        handles = self.handles()
+        weights = self.weights.tolist() if self.weights is not None else repeat(1.0)
+        return [
+            {
+                "source": handles[u],
+                "target": handles[v],
+                "platform": self.platforms[p],
+                "relationship": self.relationships[r],
+                "weight": w,
+                "source_data_origin": self.origin
+            }
+            for u, v, p, r, w in zip(self.src.tolist(), self.dst.tolist(), self.platform_codes.tolist(),
+                                     self.relationship_codes.tolist(), weights)
+        ]
+
+def load_cached_arrays(filepath: str, parse: Callable[[], EdgeArrays], cache: bool = True,
+                       **kwargs) -> EdgeArrays:
+    """EdgeArrays for a source file: from its current EdgeStore if any, else parse() and store."""
+    cache = cache and bool(config.EDGE_STORE_DIR)
+    if cache:
+        store = open_cached(filepath)
+        if store is not None:
+            return EdgeArrays.from_store(store, origin=filepath, **kwargs)
+    arrays = parse()
+    if cache:
+        arrays.to_store(cache_path(filepath), source_fingerprint(filepath))
+    return arrays
 
 class EdgeListLoader:
     SNAP_URL = "https://snap.stanford.edu/data/facebook_combined.txt.gz"
@@ -84,3 +303,16 @@ class EdgeListLoader:
                 })
 
         return identities, edges
+
+    def load_arrays(self, filepath: str = None, chunk_bytes: Optional[int] = None, cache: bool = True) -> EdgeArrays:
+        """
+        Fast path for SNAP-scale files with integer node IDs: parsed in buffered chunks straight
+        into arrays, for GraphBuilder.add_edge_arrays(). No per-node or per-edge objects.
+        With cache, the arrays are written to a binary EdgeStore on first load and memory-mapped
+        from it while the source file is unchanged.
+        """
+        if filepath is None:
+            filepath = self.ensure_dataset()
+        return load_cached_arrays(filepath, lambda: EdgeArrays.from_pairs(*parse_edge_list(filepath, chunk_bytes),
+                                                                         "facebook_snap", origin=filepath),
+                                  cache)
@@ -1,7 +1,10 @@
 import json
 import os
-from typing import List, Tuple, Dict, Generator, Any
+from typing import Iterator, List, Tuple, Dict, Generator, Any, Optional
+from network_intelligence import config
 from network_intelligence.identity.entity import PlatformIdentity
+from network_intelligence.data_sources.edge_list import EdgeArrays, load_cached_arrays, parse_edge_list
+from network_intelligence.data_sources.json_stream import iter_json_records
 
 class FacebookLoader:
     def load_edge_list(self, filepath: str) -> Tuple[List[PlatformIdentity], List[Dict]]:
@@ -42,6 +45,15 @@ class FacebookLoader:
                 })
         return identities, edges
 
+    def load_edge_arrays(self, filepath: str, chunk_bytes: Optional[int] = None, cache: bool = True) -> EdgeArrays:
+        """load_edge_list() for integer node IDs, as arrays for GraphBuilder.add_edge_arrays()."""
+        formats = {"name_format": "User {}", "url_format": "https://facebook.com/{}"}
+        return load_cached_arrays(
+            filepath,
+            lambda: EdgeArrays.from_pairs(*parse_edge_list(filepath, chunk_bytes), "facebook", origin=filepath, **formats),
+            cache, **formats
+        )
+
     def load_data_export(self, directory: str) -> Tuple[List[PlatformIdentity], List[Dict]]:
         """Load Facebook 'Download Your Information' export (JSON)."""
         # Placeholder for actual JSON structure parsing
@@ -81,14 +93,20 @@ class FacebookLoader:
 
     def load_scraped_profiles(self, filepath: str) -> Tuple[List[PlatformIdentity], List[Dict]]:
         """Load JSON of scraped profiles."""
-        with open(filepath, 'r') as f:
-            profiles = json.load(f)
-
         identities = []
         edges = []
+        for identity, profile_edges in self.iter_scraped_profiles(filepath):
+            identities.append(identity)
+            edges.extend(profile_edges)
+        return identities, edges
 
-        for p in profiles:
-            identities.append(PlatformIdentity(
+    def iter_scraped_profiles(self, filepath: str) -> Iterator[Tuple[PlatformIdentity, List[Dict]]]:
+        """
+        load_scraped_profiles() as a generator of (identity, edges) per profile, decoding one
+        profile at a time (JSON array, single object or NDJSON).
+        """
+        for p in iter_json_records(filepath):
+            identity = PlatformIdentity(
                 platform="facebook",
                 handle=p.get("id") or p.get("username") or p.get("name"),
                 display_name=p.get("name"),
@@ -98,61 +116,84 @@ class FacebookLoader:
                 company=p.get("work", [{}])[0].get("company") if p.get("work") else None,
                 verified=False,
                 raw_data=p
-            ))
+            )
 
             # Assume friends list in profile
-            for friend in p.get("friends", []):
-                edges.append({
-                    "source": p.get("id") or p.get("name"),
-                    "target": friend.get("id") or friend.get("name"),
-                    "platform": "facebook",
-                    "relationship": "friend",
-                    "weight": 1.0,
-                    "source_data_origin": filepath
-                })
-
-        return identities, edges
-
-    def load_chunked(self, filepath: str, chunk_size: int = None, resume_from: int = 0) -> Generator[Tuple[List[PlatformIdentity], List[Dict]], None, None]:
-        """Generator that yields chunks for massive files."""
-        # Simplified implementation for line-based files like edge lists or NDJSON
-        count = 0
+            edges = [{
+                "source": p.get("id") or p.get("name"),
+                "target": friend.get("id") or friend.get("name"),
+                "platform": "facebook",
+                "relationship": "friend",
+                "weight": 1.0,
+                "source_data_origin": filepath
+            } for friend in p.get("friends", [])]
+
+            yield identity, edges
+
+    def load_chunked(self, filepath: str, chunk_size: int = None,
+                     resume_from: int = 0) -> Generator[Tuple[List[PlatformIdentity], List[Dict], int], None, None]:
+        """
+        Generator over a SNAP edge list in chunks of chunk_size edges (config.CHUNK_SIZE by default).
+        Yields (identities, edges, offset): the chunk's edges, identities for the nodes first seen
+        in the chunk (the resolver skips ones it already knows) and the byte offset just past the
+        chunk. Passing that offset back as resume_from continues with a seek.
+        """
+        chunk_size = chunk_size or config.CHUNK_SIZE
         chunk_identities = []
         chunk_edges = []
+        seen_nodes = set()
 
-        with open(filepath, 'r') as f:
-            for i, line in enumerate(f):
-                if i < resume_from:
+        with open(filepath, 'rb') as f:
+            f.seek(resume_from)
+            offset = resume_from
+            for line in f:
+                offset += len(line)
+                parts = line.split()
+                if len(parts) != 2 or parts[0].startswith(b"#"):
                     continue
+                u, v = parts[0].decode(), parts[1].decode()
 
-                # Assume edge list format for chunking example
-                parts = line.strip().split()
-                if len(parts) == 2:
-                    u, v = parts
-                    chunk_edges.append({
-                        "source": u,
-                        "target": v,
-                        "platform": "facebook",
-                        "relationship": "friend",
-                        "weight": 1.0,
-                        "source_data_origin": filepath
-                    })
-                    # Add identities logic (omitted for brevity in chunking, usually handled by checking existence)
-
-                count += 1
-                if chunk_size and count >= chunk_size:
-                    yield chunk_identities, chunk_edges
+                for node_id in (u, v):
+                    if node_id not in seen_nodes:
+                        chunk_identities.append(PlatformIdentity(
+                            platform="facebook",
+                            handle=node_id,
+                            display_name=f"User {node_id}",
+                            profile_url=f"https://facebook.com/{node_id}",
+                            numeric_id=node_id,
+                            title=None,
+                            company=None,
+                            verified=False,
+                            raw_data={"id": node_id}
+                        ))
+                        seen_nodes.add(node_id)
+
+                chunk_edges.append({
+                    "source": u,
+                    "target": v,
+                    "platform": "facebook",
+                    "relationship": "friend",
+                    "weight": 1.0,
+                    "source_data_origin": filepath
+                })
+                if len(chunk_edges) >= chunk_size:
+                    yield chunk_identities, chunk_edges, offset
                     chunk_identities = []
                     chunk_edges = []
-                    count = 0
+                    seen_nodes = set()
 
             if chunk_edges:
-                yield chunk_identities, chunk_edges
+                yield chunk_identities, chunk_edges, offset
 
     def save_checkpoint(self, filepath: str, state: Dict[str, Any]) -> None:
-        """Save processing checkpoint for resumable loading."""
-        with open(filepath, 'w') as f:
+        """Save processing checkpoint for resumable loading (atomically: temp file, then rename)."""
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp = f"{filepath}.tmp"
+        with open(tmp, 'w') as f:
             json.dump(state, f)
+        os.replace(tmp, filepath)
 
     def load_checkpoint(self, filepath: str) -> Optional[Dict[str, Any]]:
         """Load previous checkpoint if exists."""
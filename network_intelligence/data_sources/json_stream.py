@@ -0,0 +1,121 @@
+"""
+Incremental JSON reading for large scrape dumps and archives.
+Records are decoded one at a time with JSONDecoder.raw_decode over a buffer refilled in
+blocks, so memory holds one block plus the record being decoded rather than the whole file
+and its parsed tree. Accepted layouts: a top-level array, a single object, concatenated or
+newline-delimited values (NDJSON), and JS-wrapped archives ("window.YTD.x.part0 = [...]").
+"""
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from network_intelligence import config
+from network_intelligence.identity.entity import PlatformIdentity
+
+# Characters read per block
+JSON_BLOCK_CHARS = 1 << 20
+
+_WHITESPACE = " \t\r\n"
+# What may follow a complete record
+_DELIMITERS = _WHITESPACE + ",]};"
+
+class _Reader:
+    """A text buffer over a file that grows geometrically while one value is incomplete."""
+
+    def __init__(self, f, block: int):
+        self.f = f
+        self.block = block
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Drop consumed text and read at least one more block; False at end of file."""
+        if self.eof:
+            return False
+        # Read as much as is buffered, so a value spanning many blocks is re-scanned O(1) times
+        chunk = self.f.read(max(self.block, len(self.buf) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def skip(self, chars: str) -> Optional[str]:
+        """Skip the given characters; returns the next character (None at end of file)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in chars:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return None
+
+    def decode(self, decoder: json.JSONDecoder) -> Any:
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buf, self.pos)
+                # A value not yet followed by a delimiter (e.g. "6." of "6.25") may continue in the next block
+                if self.eof or (end < len(self.buf) and self.buf[end] in _DELIMITERS):
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            if not self.fill():
+                value, self.pos = decoder.raw_decode(self.buf, self.pos)
+                return value
+
+def iter_json_records(filepath: str, block_chars: Optional[int] = None) -> Iterator[Any]:
+    """
+    Yield the records of a JSON file one by one: the elements of a top-level array (after
+    any JS assignment prefix), or each top-level value of a single-object / NDJSON file.
+    """
+    decoder = json.JSONDecoder()
+    with open(filepath, 'r', encoding='utf-8') as f:
+        reader = _Reader(f, block_chars or JSON_BLOCK_CHARS)
+        first = reader.skip(_WHITESPACE + "\ufeff")
+        if first is None:
+            return
+        if first not in "[{":
+            # JS wrapper: skip the assignment up to the array (or object) it holds
+            while True:
+                starts = [i for i in (reader.buf.find("[", reader.pos), reader.buf.find("{", reader.pos)) if i != -1]
+                if starts:
+                    reader.pos = min(starts)
+                    break
+                reader.pos = len(reader.buf)
+                if not reader.fill():
+                    return
+            first = reader.buf[reader.pos]
+
+        if first == "[":
+            reader.pos += 1
+            while True:
+                char = reader.skip(_WHITESPACE + ",")
+                if char is None:
+                    raise ValueError(f"{filepath}: unterminated JSON array")
+                if char == "]":
+                    return
+                yield reader.decode(decoder)
+        else:
+            while reader.skip(_WHITESPACE + ";") is not None:
+                yield reader.decode(decoder)
+
+def batch_records(records: Iterable[Tuple[PlatformIdentity, List[Dict]]],
+                  chunk_size: Optional[int] = None) -> Iterator[Tuple[List[PlatformIdentity], List[Dict]]]:
+    """
+    Group the per-record (identity, edges) pairs of an iter_* loader method into
+    (identities, edges) chunks of chunk_size identities (config.CHUNK_SIZE by default),
+    e.g. for GraphBuilder.add_chunk().
+    """
+    chunk_size = chunk_size or config.CHUNK_SIZE
+    identities: List[PlatformIdentity] = []
+    edges: List[Dict] = []
+    for identity, record_edges in records:
+        identities.append(identity)
+        edges.extend(record_edges)
+        if len(identities) >= chunk_size:
+            yield identities, edges
+            identities, edges = [], []
+    if identities:
+        yield identities, edges
@@ -1,67 +1,95 @@
 import json
 import os
-import csv
-from typing import List, Tuple, Dict, Any
+from typing import Iterator, List, Tuple, Dict, Any, Optional
+from network_intelligence.data_sources.csv_columns import read_columns
+from network_intelligence.data_sources.json_stream import iter_json_records
 from network_intelligence.identity.entity import PlatformIdentity
+from network_intelligence.identity.table import IdentityTable
 
 class LinkedInLoader:
     def load_export(self, directory: str) -> Tuple[List[PlatformIdentity], List[Dict]]:
         """Load LinkedIn data export CSV files."""
-        # Connections.csv usually contains: First Name, Last Name, Email Address, Company, Position, Connected On
-        filepath = os.path.join(directory, "Connections.csv")
-        if not os.path.exists(filepath):
+        columns = self._export_columns(directory)
+        if columns is None:
             return [], []
+        header, values, names, handles = columns
 
-        identities = []
+        identities = [
+            PlatformIdentity(
+                platform="linkedin",
+                handle=handle,
+                display_name=name,
+                profile_url="", # Export doesn't include URL
+                numeric_id=None,
+                title=title,
+                company=company,
+                verified=False, # Imported connections are just connections
+                raw_data=row
+            )
+            for handle, name, title, company, row in zip(
+                handles, names, self._column(values, "Position", len(handles)),
+                self._column(values, "Company", len(handles)), self._rows(header, values))
+        ]
+        # Assume self connection (need self identity passed in ideally)
         edges = []
+        return identities, edges
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            # Skip first 3 lines if LinkedIn export includes header info
-            # Usually header is line 4
-            reader = csv.DictReader(f)
+    def load_export_table(self, directory: str, keep_raw: bool = False) -> Tuple[IdentityTable, List[Dict]]:
+        """load_export() as a columnar IdentityTable; the CSV rows are only kept with keep_raw."""
+        columns = self._export_columns(directory)
+        if columns is None:
+            return IdentityTable(keep_raw), []
+        header, values, names, handles = columns
+        n = len(handles)
+        table = IdentityTable.from_columns(
+            ["linkedin"] * n, handles, names,
+            titles=self._column(values, "Position", n),
+            companies=self._column(values, "Company", n),
+            raw_data=self._rows(header, values) if keep_raw else None,
+            keep_raw=keep_raw
+        )
+        return table, []
 
-            for row in reader:
-                first_name = row.get("First Name", "")
-                last_name = row.get("Last Name", "")
-                full_name = f"{first_name} {last_name}".strip()
-                company = row.get("Company", "")
-                title = row.get("Position", "")
-                email = row.get("Email Address", "")
+    def _export_columns(self, directory: str) -> Optional[Tuple[List[str], Dict[str, List], List[str], List[str]]]:
+        """Connections.csv read column-wise: (header, columns, full names, handles), None if absent."""
+        # Connections.csv usually contains: First Name, Last Name, Email Address, Company, Position, Connected On
+        filepath = os.path.join(directory, "Connections.csv")
+        if not os.path.exists(filepath):
+            return None
 
-                identities.append(PlatformIdentity(
-                    platform="linkedin",
-                    handle=email if email else full_name.lower().replace(" ", "."),
-                    display_name=full_name,
-                    profile_url="", # Export doesn't include URL
-                    numeric_id=None,
-                    title=title,
-                    company=company,
-                    verified=False, # Imported connections are just connections
-                    raw_data=row
-                ))
+        header, values = read_columns(filepath, encoding='utf-8')
+        n = len(next(iter(values.values()), []))
+        names = [f"{first} {last}".strip() for first, last in zip(self._column(values, "First Name", n),
+                                                                   self._column(values, "Last Name", n))]
+        handles = [email if email else name.lower().replace(" ", ".")
+                   for email, name in zip(self._column(values, "Email Address", n), names)]
+        return header, values, names, handles
 
-                # Assume self connection (need self identity passed in ideally)
-                pass
+    def _column(self, values: Dict[str, List], name: str, n: int) -> List:
+        return values[name] if name in values else [""] * n
 
-        return identities, edges
+    def _rows(self, header: List[str], values: Dict[str, List]) -> List[Dict]:
+        return [dict(zip(header, row)) for row in zip(*(values[name] for name in header))]
 
     def load_scraped(self, filepath: str) -> Tuple[List[PlatformIdentity], List[Dict]]:
         """Load scraped LinkedIn profile data (JSON)."""
-        if not os.path.exists(filepath):
-            return [], []
-
-        with open(filepath, 'r') as f:
-            profiles = json.load(f)
-
         identities = []
         edges = []
+        for identity, profile_edges in self.iter_scraped(filepath):
+            identities.append(identity)
+            edges.extend(profile_edges)
+        return identities, edges
 
-        # Determine if list or single object
-        if isinstance(profiles, dict):
-            profiles = [profiles]
+    def iter_scraped(self, filepath: str) -> Iterator[Tuple[PlatformIdentity, List[Dict]]]:
+        """
+        load_scraped() as a generator of (identity, edges) per profile, decoding one profile
+        at a time (JSON array, single object or NDJSON).
+        """
+        if not os.path.exists(filepath):
+            return
 
-        for p in profiles:
-            identities.append(PlatformIdentity(
+        for p in iter_json_records(filepath):
+            identity = PlatformIdentity(
                 platform="linkedin",
                 handle=p.get("public_identifier") or p.get("urn_id") or p.get("name"),
                 display_name=p.get("name"),
@@ -71,18 +99,16 @@ class LinkedInLoader:
                 company=p.get("company"), # scraping structure varies
                 verified=False,
                 raw_data=p
-            ))
+            )
 
             # Connections if available
-            for connection in p.get("connections", []):
-                # Add edge
-                edges.append({
-                    "source": p.get("urn_id") or p.get("name"),
-                    "target": connection.get("urn_id") or connection.get("name"),
-                    "platform": "linkedin",
-                    "relationship": "connected",
-                    "weight": 1.5,
-                    "source_data_origin": filepath
-                })
+            edges = [{
+                "source": p.get("urn_id") or p.get("name"),
+                "target": connection.get("urn_id") or connection.get("name"),
+                "platform": "linkedin",
+                "relationship": "connected",
+                "weight": 1.5,
+                "source_data_origin": filepath
+            } for connection in p.get("connections", [])]
 
-        return identities, edges
+            yield identity, edges
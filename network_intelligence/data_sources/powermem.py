@@ -1,47 +1,140 @@
 import requests
 import json
 import time
-from typing import List, Tuple, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple, Dict, Any, Optional, Sequence
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from network_intelligence.identity.entity import PlatformIdentity
 from network_intelligence import config
 
+# Statuses retried: throttling and an unavailable service, both answered before the request is
+# processed. 502/504 and read errors are not: the backend may already have stored a POSTed batch.
+RETRY_STATUSES = (429, 503)
+# Statuses of a service without the bulk write endpoint
+_NO_BATCH_STATUSES = (404, 405)
+
+def make_session(pool_size: int = None, retries: int = None, backoff: float = None) -> requests.Session:
+    """
+    A requests Session with a keep-alive connection pool and retry with exponential backoff,
+    limited to failures where the request never reached the service (connection errors,
+    429/503), so non-idempotent writes are never sent twice.
+    """
+    retries = config.POWERMEM_RETRIES if retries is None else retries
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=0,
+        other=0,
+        status=retries,
+        backoff_factor=config.POWERMEM_BACKOFF if backoff is None else backoff,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "POST"}),
+        raise_on_status=False
+    )
+    pool_size = pool_size or config.POWERMEM_POOL_SIZE
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 class PowerMemClient:
-    def __init__(self, base_url: str = None, timeout: int = None):
+    def __init__(self, base_url: str = None, timeout: int = None, session: requests.Session = None):
         self.base_url = base_url or config.POWERMEM_URL
         self.timeout = timeout or config.POWERMEM_TIMEOUT
+        # One pooled session per client: requests reuse connections instead of reconnecting each call
+        self.session = session or make_session()
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> "PowerMemClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
     def health_check(self) -> bool:
         """Ping the PowerMem service."""
         try:
-            resp = requests.get(f"{self.base_url}/health", timeout=self.timeout)
+            resp = self.session.get(f"{self.base_url}/health", timeout=self.timeout)
             return resp.status_code == 200
         except requests.RequestException:
             return False
 
-    def query(self, query: str, tags: List[str] = None, limit: int = 200) -> List[Dict]:
-        """Query PowerMem for memories."""
-        url = f"{self.base_url}/api/search"
+    def _search(self, query: str, tags: Optional[List[str]], limit: int, offset: int = 0) -> Dict[str, Any]:
         payload = {
             "query": query,
             "limit": limit
         }
+        if offset:
+            payload["offset"] = offset
         if tags:
             payload["tags"] = tags
+        resp = self.session.post(f"{self.base_url}/api/search", json=payload, timeout=self.timeout)
+        resp.raise_for_status()
+        return resp.json()
 
+    def query(self, query: str, tags: List[str] = None, limit: int = 200, offset: int = 0) -> List[Dict]:
+        """Query PowerMem for memories (one page of at most `limit` results)."""
         try:
-            resp = requests.post(url, json=payload, timeout=self.timeout)
-            resp.raise_for_status()
-            data = resp.json()
-            return data.get("results", [])
+            return self._search(query, tags, limit, offset).get("results", [])
         except requests.RequestException as e:
             # Log error
             print(f"PowerMem query failed: {e}")
             return []
 
+    def query_all(self, query: str, tags: List[str] = None, page_size: int = None,
+                  concurrency: int = None) -> List[Dict]:
+        """
+        Every result of a search, in service order. When the first page reports a "total",
+        the remaining pages are fetched concurrently over the session's pool; otherwise pages
+        are read one after another until a short page. Results whose id was already seen
+        (offsets shift when memories are added mid-read) are dropped.
+        """
+        page_size = page_size or config.POWERMEM_PAGE_SIZE
+        try:
+            first = self._search(query, tags, page_size)
+            results = list(first.get("results", []))
+            total = first.get("total")
+            if len(results) < page_size:
+                return results
+            if isinstance(total, int):
+                offsets = range(page_size, total, page_size)
+                if offsets:
+                    workers = min(concurrency or config.POWERMEM_CONCURRENCY, len(offsets))
+                    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="powermem") as pool:
+                        for data in pool.map(lambda offset: self._search(query, tags, page_size, offset), offsets):
+                            results.extend(data.get("results", []))
+            else:
+                while True:
+                    page = self._search(query, tags, page_size, len(results)).get("results", [])
+                    # A service that ignores the offset returns the first page again
+                    if not page or page[0] == results[0]:
+                        break
+                    results.extend(page)
+                    if len(page) < page_size:
+                        break
+        except requests.RequestException as e:
+            print(f"PowerMem query failed: {e}")
+            return []
+
+        seen = set()
+        unique = []
+        for r in results:
+            rid = r.get("id")
+            if rid is not None:
+                if rid in seen:
+                    continue
+                seen.add(rid)
+            unique.append(r)
+        return unique
+
     def load_company_graph(self, company: str) -> Tuple[List[PlatformIdentity], List[Dict]]:
-        """Pull all people data for a company from PowerMem."""
+        """Pull all people data for a company from PowerMem (every page of the search)."""
         # Search for company name in content or metadata
-        results = self.query(company, tags=[config.TAGS_PROFILE, config.TAGS_COMPANY_INTEL])
+        results = self.query_all(company, tags=[config.TAGS_PROFILE, config.TAGS_COMPANY_INTEL])
 
         identities = []
         edges = []
@@ -81,16 +174,54 @@ class PowerMemClient:
 
     def write_analysis(self, content: str, tags: List[str], metadata: Dict[str, Any]) -> bool:
         """Store analysis results back to PowerMem."""
-        url = f"{self.base_url}/api/memory"
         payload = {
             "content": content,
             "tags": tags,
             "metadata": metadata
         }
+        return self._write_one(payload)
+
+    def _write_one(self, memory: Dict[str, Any]) -> bool:
         try:
-            resp = requests.post(url, json=payload, timeout=self.timeout)
+            resp = self.session.post(f"{self.base_url}/api/memory", json=memory, timeout=self.timeout)
             resp.raise_for_status()
             return True
         except requests.RequestException as e:
             print(f"PowerMem write failed: {e}")
             return False
+
+    def _write_batch(self, batch: Sequence[Dict[str, Any]]) -> Optional[int]:
+        """Memories written by one bulk request; None when the service has no bulk endpoint."""
+        try:
+            resp = self.session.post(f"{self.base_url}/api/memory/batch", json={"memories": list(batch)},
+                                     timeout=self.timeout)
+            if resp.status_code in _NO_BATCH_STATUSES:
+                return None
+            resp.raise_for_status()
+            return len(batch)
+        except requests.RequestException as e:
+            print(f"PowerMem batch write failed: {e}")
+            return 0
+
+    def write_memories(self, memories: Sequence[Dict[str, Any]], batch_size: int = None,
+                       concurrency: int = None) -> int:
+        """
+        Store many memories ({"content", "tags", "metadata"} dicts) with one request per
+        batch_size of them, batches sent concurrently. A batch the service answers with
+        404/405 (no bulk endpoint) is written one memory per request instead, so every
+        batch is checked on its own. Returns the number written.
+        """
+        memories = list(memories)
+        if not memories:
+            return 0
+        batch_size = batch_size or config.POWERMEM_WRITE_BATCH
+        workers = concurrency or config.POWERMEM_CONCURRENCY
+        batches = [memories[i:i + batch_size] for i in range(0, len(memories), batch_size)]
+        with ThreadPoolExecutor(max_workers=min(workers, len(batches)), thread_name_prefix="powermem") as pool:
+            return sum(pool.map(self._write_batch_or_each, batches))
+
+    def _write_batch_or_each(self, batch: Sequence[Dict[str, Any]]) -> int:
+        written = self._write_batch(batch)
+        if written is None:
+            return sum(map(self._write_one, batch))
+        return written
@@ -1,38 +1,32 @@
 import json
 import os
-from typing import List, Tuple, Dict, Any
+from typing import Iterator, List, Tuple, Dict, Any
+from network_intelligence.data_sources.json_stream import iter_json_records
 from network_intelligence.identity.entity import PlatformIdentity
 
 class TwitterLoader:
     def load_archive(self, directory: str) -> Tuple[List[PlatformIdentity], List[Dict]]:
         """Load Twitter data archive."""
-        # following.js usually contains list of following
-        # data/following.js
-        # Needs stripping "window.YTD.following.part0 = "
+        identities = list(self.iter_archive(directory))
+        edges = []
+        return identities, edges
 
+    def iter_archive(self, directory: str) -> Iterator[PlatformIdentity]:
+        """
+        Identities of an archive's data/following.js, one at a time. The JS wrapper
+        ("window.YTD.following.part0 = ") is skipped while reading, not sliced off a copy.
+        """
         filepath = os.path.join(directory, "data/following.js")
         if not os.path.exists(filepath):
-            return [], []
+            return
 
-        identities = []
-        edges = []
-
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-            # Remove JS wrapper
-            start_index = content.find('[')
-            if start_index != -1:
-                json_data = json.loads(content[start_index:])
-            else:
-                return [], []
-
-        for item in json_data:
+        for item in iter_json_records(filepath):
             following = item.get("following", {})
             account_id = following.get("accountId")
             user_link = following.get("userLink") # usually https://twitter.com/Handle
             handle = user_link.split('/')[-1] if user_link else f"id_{account_id}"
 
-            identities.append(PlatformIdentity(
+            yield PlatformIdentity(
                 platform="twitter",
                 handle=handle,
                 display_name=handle, # Archive often just gives ID/Link
@@ -42,30 +36,30 @@ class TwitterLoader:
                 company=None,
                 verified=False,
                 raw_data=following
-            ))
+            )
 
             # Edges assume self is source
-            pass
-
-        return identities, edges
 
     def load_scraped(self, filepath: str) -> Tuple[List[PlatformIdentity], List[Dict]]:
         """Load scraped Twitter data (JSON)."""
-        if not os.path.exists(filepath):
-            return [], []
-
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-
         identities = []
         edges = []
+        for identity, user_edges in self.iter_scraped(filepath):
+            identities.append(identity)
+            edges.extend(user_edges)
+        return identities, edges
 
-        if isinstance(data, dict):
-            data = [data]
+    def iter_scraped(self, filepath: str) -> Iterator[Tuple[PlatformIdentity, List[Dict]]]:
+        """
+        load_scraped() as a generator of (identity, edges) per user, decoding one user at
+        a time (JSON array, single object or NDJSON).
+        """
+        if not os.path.exists(filepath):
+            return
 
-        for p in data:
+        for p in iter_json_records(filepath):
             handle = p.get("screen_name") or p.get("username")
-            identities.append(PlatformIdentity(
+            identity = PlatformIdentity(
                 platform="twitter",
                 handle=handle,
                 display_name=p.get("name"),
@@ -75,17 +69,16 @@ class TwitterLoader:
                 company=None,
                 verified=p.get("verified", False),
                 raw_data=p
-            ))
+            )
 
             # Followers/Following if present
-            for f_user in p.get("following", []):
-                edges.append({
-                    "source": handle,
-                    "target": f_user.get("screen_name") or f_user.get("username"),
-                    "platform": "twitter",
-                    "relationship": "follows",
-                    "weight": 1.0,
-                    "source_data_origin": filepath
-                })
+            edges = [{
+                "source": handle,
+                "target": f_user.get("screen_name") or f_user.get("username"),
+                "platform": "twitter",
+                "relationship": "follows",
+                "weight": 1.0,
+                "source_data_origin": filepath
+            } for f_user in p.get("following", [])]
 
-        return identities, edges
+            yield identity, edges
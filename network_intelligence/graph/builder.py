@@ -1,120 +1,300 @@
 import networkx as nx
-import uuid
-from typing import List, Dict, Any, Optional
-from network_intelligence.identity.entity import PlatformIdentity, UnifiedEntity
+import time
+from itertools import repeat
+from typing import List, Dict, Any, Optional, Set, Tuple
+from network_intelligence.identity.entity import PlatformIdentity, UnifiedEntity, identity_key, stable_entity_id
 from network_intelligence.identity.resolver import IdentityResolver
+from network_intelligence.graph.csr import CSRGraph, simplify_multigraph
+from network_intelligence.data_sources.edge_list import EdgeArrays
 
 class GraphBuilder:
-    def __init__(self, identity_resolver: IdentityResolver):
+    def __init__(self, identity_resolver: IdentityResolver, incremental: bool = True):
         self.resolver = identity_resolver
+        self.incremental = incremental
         self.graph = nx.MultiGraph()
         self.all_identities: List[PlatformIdentity] = []
         self.all_edges: List[Dict] = []
         self.handle_map: Dict[str, str] = {}
+        self.pending_sources: List[Tuple[List[PlatformIdentity], List[Dict], str]] = []
+        # Integer edge lists added through add_edge_arrays(), re-inserted on rebuild()
+        self.edge_arrays: List[EdgeArrays] = []
+        # Nodes created for edge-array handles no resolved entity claimed yet
+        self.array_nodes: Set[str] = set()
+        # Seconds spent per phase (resolve, node_insert, edge_insert, rescore) by the last materialization
+        self.timings: Dict[str, float] = {}
+
+        # A resolver restored from a ResolutionStore already holds entities: start from them
+        self.all_identities.extend(identity_resolver.identities)
+        for entity in identity_resolver.entities():
+            self._add_entity_node(entity)
 
     def add_data_source(self, nodes: List[PlatformIdentity], edges: List[Dict], platform: str) -> None:
         """Add data from a single platform. Triggers identity resolution."""
-        # Add new data
+        self._materialize(nodes, edges)
+
+    def add_data_sources(self, sources: List[Tuple[List[PlatformIdentity], List[Dict], str]]) -> None:
+        """
+        Register several (nodes, edges, platform) sources without resolving them.
+        Resolution and graph materialization run once, on the next build().
+        """
+        self.pending_sources.extend(sources)
+
+    def add_edge_arrays(self, edges: EdgeArrays) -> None:
+        """
+        Add an anonymous integer edge list (EdgeListLoader.load_arrays) without building
+        identities or per-edge dicts. Its nodes carry no profile data, so they skip resolution:
+        each one gets the ID a singleton entity (or a stub) for platform:id would get, and
+        other sources that mention the same handle land on the same node. When a profile for
+        the handle resolves into an entity with another ID (it merged with other identities),
+        the node and its edges are folded into that entity's node.
+        """
+        self.edge_arrays.append(edges)
+        self._insert_edge_arrays(edges)
+
+    def _insert_edge_arrays(self, edges: EdgeArrays) -> None:
+        entity_ids = []
+        new_nodes = []
+        for handle, platform in zip(edges.handles(), edges.node_platforms()):
+            key = f"{platform}:{handle}"
+            entity_id = self.handle_map.get(key)
+            if entity_id is None:
+                entity_id = self.handle_map[key] = stable_entity_id([key])
+                self.array_nodes.add(entity_id)
+                new_nodes.append((entity_id, {
+                    "canonical_name": edges.name_format.format(handle),
+                    "platforms": [platform],
+                    "confidence": 1.0,
+                    "type": "person",
+                    "entity_id": entity_id
+                }))
+            entity_ids.append(entity_id)
+        self.graph.add_nodes_from(new_nodes)
+
+        sources = map(entity_ids.__getitem__, edges.src.tolist())
+        targets = map(entity_ids.__getitem__, edges.dst.tolist())
+        if len(edges.platforms) == 1 and len(edges.relationships) == 1 and edges.weights is None:
+            # The attributes every edge shares; networkx copies them into its own edge dicts
+            attrs = {"platform": edges.platform, "relationship": edges.relationships[0], "weight": 1.0,
+                     "source_data_origin": edges.origin}
+            self.graph.add_edges_from(zip(sources, targets, repeat(attrs)))
+            return
+        weights = edges.weights.tolist() if edges.weights is not None else repeat(1.0)
+        self.graph.add_edges_from(
+            (u, v, {"platform": edges.platforms[p], "relationship": edges.relationships[r], "weight": w,
+                    "source_data_origin": edges.origin})
+            for u, v, p, r, w in zip(sources, targets, edges.platform_codes.tolist(),
+                                     edges.relationship_codes.tolist(), weights)
+        )
+
+    def rebuild(self) -> None:
+        """Re-resolve every identity loaded so far and rebuild the graph from scratch."""
+        incremental = self.incremental
+        self.incremental = False
+        try:
+            self._materialize([], [])
+        finally:
+            self.incremental = incremental
+
+    def add_chunk(self, nodes: List[PlatformIdentity], edges: List[Dict]) -> None:
+        """
+        Streaming counterpart of add_data_source(): resolve and insert one chunk of a large source.
+        The edge dicts are not retained (rebuild() will not see them), and the mutual-connections
+        rescore runs once, in finish_stream(), instead of after every chunk.
+        """
+        if not self.incremental:
+            raise ValueError("Streaming ingestion needs an incremental GraphBuilder")
+        self._materialize(nodes, edges, stream=True)
+
+    def finish_stream(self) -> None:
+        """Run the deferred mutual-connections rescore after the last add_chunk()."""
+        start = time.perf_counter()
+        self._rescore()
+        self.timings["rescore"] = time.perf_counter() - start
+
+    def restore_connections(self, attrs: Dict[str, Any]) -> int:
+        """
+        Re-insert the connections of a resolver restored from a ResolutionStore as edges with
+        the given attributes (the store keeps endpoints only), e.g. when resuming a stream.
+        Returns the number of edges added.
+        """
+        entity_of = self.resolver.entity_of
+        edges = [(entity_of[u].entity_id, entity_of[v].entity_id, attrs)
+                 for u, v in zip(self.resolver.edge_sources, self.resolver.edge_targets)
+                 if entity_of[u] is not None and entity_of[v] is not None]
+        self.graph.add_edges_from(edges)
+        return len(edges)
+
+    def _materialize(self, nodes: List[PlatformIdentity], edges: List[Dict], stream: bool = False) -> None:
+        """Resolve new data and patch (or rebuild) the graph, recording per-phase timings."""
+        # Add new data (table rows become objects once, shared by the resolver and rebuild())
+        nodes = list(nodes)
         self.all_identities.extend(nodes)
-        self.all_edges.extend(edges)
-
-        # Run resolution
-        unified_entities = self.resolver.resolve(self.all_identities)
-
-        # Rebuild graph
-        self.graph.clear()
-        self.handle_map.clear()
-
-        # Re-populate nodes from resolved entities
-        for entity in unified_entities:
-            attrs = {
-                "canonical_name": entity.canonical_name,
-                "platforms": list(entity.platforms_present),
-                "confidence": entity.overall_confidence,
-                "type": "person",
-                "entity_id": entity.entity_id
-            }
-
-            # Map all identity handles to this entity ID
-            for ident in entity.identities:
-                key = f"{ident.platform}:{ident.handle}"
-                self.handle_map[key] = entity.entity_id
-
-                # Best effort attribute merging
-                if ident.title and "title" not in attrs:
-                    attrs["title"] = ident.title
-                if ident.company and "company" not in attrs:
-                    attrs["company"] = ident.company
-
-            self.graph.add_node(entity.entity_id, **attrs)
-
-        # Add all edges
-        for edge in self.all_edges:
-            src_handle = edge["source"]
-            tgt_handle = edge["target"]
-            plt = edge["platform"]
+        if not stream:
+            self.all_edges.extend(edges)
+
+        start = time.perf_counter()
+        if self.incremental:
+            # Resolve only the new identities against the resolver's entity index
+            # and patch the affected nodes; existing nodes keep their entity IDs.
+            created, updated = self.resolver.resolve_incremental(nodes)
+            self._merge_absorbed_nodes()
+            entities = created + updated
+            new_edges = edges
+        else:
+            # Run resolution
+            entities = self.resolver.resolve(self.all_identities)
+            new_edges = self.all_edges
+
+            # Rebuild graph
+            self.graph.clear()
+            self.handle_map.clear()
+            self.array_nodes.clear()
+            for arrays in self.edge_arrays:
+                self._insert_edge_arrays(arrays)
+        resolved = time.perf_counter()
 
-            src_key = f"{plt}:{src_handle}"
-            tgt_key = f"{plt}:{tgt_handle}"
+        for entity in entities:
+            self._add_entity_node(entity)
+        nodes_inserted = time.perf_counter()
 
-            u = self.handle_map.get(src_key)
-            v = self.handle_map.get(tgt_key)
+        self._add_edges(new_edges)
+        edges_inserted = time.perf_counter()
 
-            # Handle missing nodes (stubs)
-            if not u:
-                u = self._create_stub_entity(src_handle, plt)
-            if not v:
-                v = self._create_stub_entity(tgt_handle, plt)
+        # Second pass: review-queue pairs re-scored with mutual connections
+        self.resolver.add_connections(new_edges)
+        if not stream:
+            self._rescore()
+        rescored = time.perf_counter()
 
+        self.timings = {
+            "resolve": resolved - start,
+            "node_insert": nodes_inserted - resolved,
+            "edge_insert": edges_inserted - nodes_inserted,
+            "rescore": rescored - edges_inserted
+        }
+
+    def _rescore(self) -> None:
+        grown = self.resolver.rescore_review_queue()
+        if grown:
+            self._merge_absorbed_nodes()
+            for entity in grown:
+                self._add_entity_node(entity)
+
+    def _merge_absorbed_nodes(self) -> None:
+        """Fold nodes of entities the resolver merged away into the surviving node, keeping their edges."""
+        mapping = {old: new for old, new in self.resolver.absorbed.items() if old in self.graph}
+        if mapping:
+            nx.relabel_nodes(self.graph, mapping, copy=False)
+
+    def _add_entity_node(self, entity: UnifiedEntity) -> None:
+        """Insert or refresh the node for a resolved entity."""
+        is_stub = all(ident.raw_data.get("stub") for ident in entity.identities)
+        attrs = {
+            "canonical_name": entity.canonical_name,
+            "platforms": list(entity.platforms_present),
+            "confidence": 0.0 if is_stub else entity.overall_confidence,
+            "type": "stub" if is_stub else "person",
+            "entity_id": entity.entity_id
+        }
+
+        # Map all identity handles to this entity ID; edge-array nodes of those handles
+        # under another ID fold into this node, keeping their edges
+        folded = {}
+        for ident in entity.identities:
+            key = identity_key(ident)
+            previous = self.handle_map.get(key)
+            if previous in self.array_nodes:
+                # Claimed by an entity: from here on absorption moves it, like any entity node
+                self.array_nodes.discard(previous)
+                if previous != entity.entity_id:
+                    folded[previous] = entity.entity_id
+            self.handle_map[key] = entity.entity_id
+
+            # Best effort attribute merging
+            if ident.title and "title" not in attrs:
+                attrs["title"] = ident.title
+            if ident.company and "company" not in attrs:
+                attrs["company"] = ident.company
+
+        if folded:
+            nx.relabel_nodes(self.graph, folded, copy=False)
+        self.graph.add_node(entity.entity_id, **attrs)
+
+    def _add_edges(self, edges: List[Dict]) -> None:
+        """Attach edges to entity nodes, creating stubs for unknown handles."""
+        # Handle missing nodes (stubs): collected first so they resolve in one batch
+        missing: Dict[str, Tuple[str, str]] = {}
+        for edge in edges:
+            plt = edge["platform"]
+            for handle in (edge["source"], edge["target"]):
+                key = f"{plt}:{handle}"
+                if key not in self.handle_map and key not in missing:
+                    missing[key] = (handle, plt)
+        if missing:
+            self._create_stub_entities(list(missing.values()))
+
+        for edge in edges:
+            plt = edge["platform"]
+            u = self.handle_map[f"{plt}:{edge['source']}"]
+            v = self.handle_map[f"{plt}:{edge['target']}"]
             self.graph.add_edge(u, v, **edge)
 
-    def _create_stub_entity(self, handle: str, platform: str) -> str:
-        """Create a stub entity for a node mentioned in an edge but not in profiles."""
-        # Create identity so it persists for future resolutions
-        ident = PlatformIdentity(
-            platform=platform,
-            handle=handle,
-            display_name=handle,
-            profile_url="",
-            numeric_id=None,
-            title=None,
-            company=None,
-            verified=False,
-            raw_data={"stub": True}
-        )
-        self.all_identities.append(ident)
+    def _create_stub_entities(self, handles: List[Tuple[str, str]]) -> None:
+        """Create stub entities for (handle, platform) pairs mentioned in edges but not in profiles."""
+        # Create identities so they persist for future resolutions
+        stubs = [
+            PlatformIdentity(
+                platform=platform,
+                handle=handle,
+                display_name=handle,
+                profile_url="",
+                numeric_id=None,
+                title=None,
+                company=None,
+                verified=False,
+                raw_data={"stub": True}
+            )
+            for handle, platform in handles
+        ]
+        self.all_identities.extend(stubs)
 
-        # Create ephemeral entity ID and node for current graph state
-        entity_id = str(uuid.uuid4())
+        if self.incremental:
+            # Register the stubs with the resolver so later sources can merge into them; a later
+            # profile for the same handle replaces its stub in place and renames the entity, so
+            # the node gets the name, type and ID a rebuild() would give it
+            created, updated = self.resolver.resolve_incremental(stubs)
+            self._merge_absorbed_nodes()
+            for entity in created + updated:
+                self._add_entity_node(entity)
+            return
 
-        self.graph.add_node(entity_id,
-                            canonical_name=handle,
-                            platforms=[platform],
-                            confidence=0.0,
-                            type="stub",
-                            entity_id=entity_id)
+        for ident in stubs:
+            # Same derivation as resolved entities, so a stub and a later profile
+            # for the same handle land on the same node
+            entity_id = stable_entity_id([identity_key(ident)])
 
-        key = f"{platform}:{handle}"
-        self.handle_map[key] = entity_id
+            self.graph.add_node(entity_id,
+                                canonical_name=ident.handle,
+                                platforms=[ident.platform],
+                                confidence=0.0,
+                                type="stub",
+                                entity_id=entity_id)
 
-        return entity_id
+            self.handle_map[identity_key(ident)] = entity_id
 
     def build(self) -> nx.MultiGraph:
-        """Finalize graph construction."""
+        """Finalize graph construction, resolving any sources registered via add_data_sources()."""
+        if self.pending_sources:
+            pending, self.pending_sources = self.pending_sources, []
+            nodes = [node for source_nodes, _, _ in pending for node in source_nodes]
+            edges = [edge for _, source_edges, _ in pending for edge in source_edges]
+            self._materialize(nodes, edges)
         return self.graph
 
     def get_simplified_graph(self) -> nx.Graph:
         """Collapse MultiGraph to simple Graph by summing edge weights per pair."""
-        simple_graph = nx.Graph()
-
-        for u, v, data in self.graph.edges(data=True):
-            w = data.get('weight', 1.0)
-            if simple_graph.has_edge(u, v):
-                simple_graph[u][v]['weight'] += w
-            else:
-                simple_graph.add_edge(u, v, weight=w)
-
-        for node, attrs in self.graph.nodes(data=True):
-            simple_graph.add_node(node, **attrs)
+        return simplify_multigraph(self.graph)
 
-        return simple_graph
+    def get_csr_graph(self) -> CSRGraph:
+        """Compact CSR form of the simplified graph for the analyzers."""
+        return CSRGraph.from_networkx(self.graph)
@@ -0,0 +1,203 @@
+"""
+Compact compressed-sparse-row graph used by the analysis hot paths.
+Nodes are addressed by int32 index; node_ids / index translate to and from entity IDs.
+Undirected edges are stored in both directions, self-loops once, with summed weights.
+"""
+import networkx as nx
+import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, Union
+
+class CSRGraph:
+    def __init__(self, node_ids: Sequence[Hashable], indptr: np.ndarray, indices: np.ndarray,
+                 weights: np.ndarray, node_attrs: Optional[List[Dict[str, Any]]] = None):
+        self.node_ids: List[Hashable] = list(node_ids)
+        self.index: Dict[Hashable, int] = {node: i for i, node in enumerate(self.node_ids)}
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.node_attrs = node_attrs if node_attrs is not None else [{} for _ in self.node_ids]
+        self._matrix: Optional[sparse.csr_matrix] = None
+        self._networkx: Optional[nx.Graph] = None
+        self._rows: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_edges(cls, node_ids: Sequence[Hashable], src: np.ndarray, dst: np.ndarray,
+                   weights: Optional[np.ndarray] = None,
+                   node_attrs: Optional[List[Dict[str, Any]]] = None) -> "CSRGraph":
+        """Build from undirected edge index arrays; parallel edges are summed."""
+        n = len(node_ids)
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        if weights is None:
+            weights = np.ones(len(src), dtype=np.float64)
+        weights = np.asarray(weights, dtype=np.float64)
+
+        # Mirror every non-loop edge; coo -> csr sums duplicate (row, col) entries
+        off_diag = src != dst
+        rows = np.concatenate([src, dst[off_diag]])
+        cols = np.concatenate([dst, src[off_diag]])
+        data = np.concatenate([weights, weights[off_diag]])
+        matrix = sparse.coo_matrix((data, (rows, cols)), shape=(n, n)).tocsr()
+        matrix.sum_duplicates()
+        matrix.sort_indices()
+
+        return cls(node_ids, matrix.indptr, matrix.indices, matrix.data, node_attrs)
+
+    @classmethod
+    def from_networkx(cls, G: nx.Graph, weight: str = "weight") -> "CSRGraph":
+        """Convert a (Multi)Graph; parallel edges of a MultiGraph are summed."""
+        node_ids = list(G.nodes)
+        src, dst, weights = edge_index_arrays(G, {node: i for i, node in enumerate(node_ids)}, weight)
+        node_attrs = [G.nodes[node] for node in node_ids]
+        return cls.from_edges(node_ids, src, dst, weights, node_attrs)
+
+    def to_networkx(self) -> nx.Graph:
+        """Export to a weighted nx.Graph (cached; treat the result as read-only)."""
+        if self._networkx is None:
+            G = nx.Graph()
+            G.add_nodes_from((node, attrs) for node, attrs in zip(self.node_ids, self.node_attrs))
+            rows = self.edge_rows()
+            upper = rows <= self.indices
+            ids = self.node_ids
+            G.add_weighted_edges_from(
+                (ids[u], ids[v], w)
+                for u, v, w in zip(rows[upper].tolist(), self.indices[upper].tolist(), self.weights[upper].tolist())
+            )
+            self._networkx = G
+        return self._networkx
+
+    def to_scipy(self) -> sparse.csr_matrix:
+        """Weighted adjacency matrix sharing this graph's arrays."""
+        if self._matrix is None:
+            n = self.number_of_nodes()
+            self._matrix = sparse.csr_matrix((self.weights, self.indices, self.indptr), shape=(n, n))
+        return self._matrix
+
+    def edge_rows(self) -> np.ndarray:
+        """Row (source node) index of every stored entry, i.e. the COO row array."""
+        if self._rows is None:
+            self._rows = np.repeat(np.arange(self.number_of_nodes(), dtype=np.int32), np.diff(self.indptr))
+        return self._rows
+
+    def number_of_nodes(self) -> int:
+        return len(self.node_ids)
+
+    def number_of_edges(self) -> int:
+        return int((len(self.indices) + self.self_loop_mask().sum()) // 2)
+
+    def self_loop_mask(self) -> np.ndarray:
+        """Boolean per node: has a self-loop."""
+        rows = self.edge_rows()
+        mask = np.zeros(self.number_of_nodes(), dtype=bool)
+        mask[rows[rows == self.indices]] = True
+        return mask
+
+    def degree(self) -> np.ndarray:
+        """Unweighted degree per node; self-loops count twice, as in NetworkX."""
+        return np.diff(self.indptr) + self.self_loop_mask()
+
+    def neighbors(self, i: int) -> np.ndarray:
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def node_data(self, node: Hashable) -> Dict[str, Any]:
+        return self.node_attrs[self.index[node]]
+
+    def connected_components(self) -> Tuple[int, np.ndarray]:
+        """(component count, component label per node)."""
+        return csgraph.connected_components(self.to_scipy(), directed=False)
+
+    def subgraph(self, indices: Iterable[int]) -> "CSRGraph":
+        """Induced subgraph on the given node indices (in that order)."""
+        keep = np.asarray(list(indices), dtype=np.int64)
+        matrix = self.to_scipy()[keep][:, keep].tocsr()
+        matrix.sort_indices()
+        return CSRGraph([self.node_ids[i] for i in keep], matrix.indptr, matrix.indices, matrix.data,
+                        [self.node_attrs[i] for i in keep])
+
+    def remove_nodes(self, nodes: Iterable[Hashable]) -> "CSRGraph":
+        """Copy of this graph without the given node IDs."""
+        mask = np.ones(self.number_of_nodes(), dtype=bool)
+        mask[[self.index[node] for node in nodes]] = False
+        return self.subgraph(np.flatnonzero(mask))
+
+    def bfs_distances(self, sources: Sequence[int]) -> np.ndarray:
+        """Hop distances from each source (len(sources) x n, inf when unreachable)."""
+        return csgraph.shortest_path(self.to_scipy(), method="D", directed=True,
+                                     unweighted=True, indices=np.asarray(sources))
+
+    def triangles(self) -> np.ndarray:
+        """Twice the number of triangles through each node (self-loops ignored)."""
+        n = self.number_of_nodes()
+        rows = self.edge_rows()
+        off_diag = rows != self.indices
+        binary = sparse.csr_matrix(
+            (np.ones(int(off_diag.sum())), (rows[off_diag], self.indices[off_diag])), shape=(n, n)
+        )
+
+        # Row blocks keep the A @ A intermediate bounded on large graphs
+        counts = np.zeros(n, dtype=np.float64)
+        block = 4096
+        for start in range(0, n, block):
+            chunk = binary[start:start + block]
+            counts[start:start + block] = np.asarray((chunk @ binary).multiply(chunk).sum(axis=1)).ravel()
+        return counts
+
+AnyGraph = Union[nx.Graph, CSRGraph]
+
+def edge_index_arrays(G: nx.Graph, index: Dict[Hashable, int],
+                      weight: str = "weight") -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(src, dst, weight) arrays for every edge of G, with endpoints mapped through index."""
+    # iter() first: list() on the view would call its __len__, an extra full edge pass
+    edges = list(iter(G.edges(data=weight, default=1.0)))
+    m = len(edges)
+    src = np.fromiter((index[u] for u, _, _ in edges), dtype=np.int64, count=m)
+    dst = np.fromiter((index[v] for _, v, _ in edges), dtype=np.int64, count=m)
+    weights = np.fromiter((w for _, _, w in edges), dtype=np.float64, count=m)
+    return src, dst, weights
+
+def collapse_edges(src: np.ndarray, dst: np.ndarray, weights: np.ndarray,
+                   n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Canonicalize undirected (u, v) pairs to u <= v and sum the weights of duplicates.
+    Returns unique (src, dst, weight) arrays sorted by (src, dst).
+    """
+    lo = np.minimum(src, dst).astype(np.int64)
+    hi = np.maximum(src, dst).astype(np.int64)
+    keys = lo * n + hi
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+
+    if len(keys) == 0:
+        return lo, hi, np.asarray(weights, dtype=np.float64)
+
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    summed = np.add.reduceat(np.asarray(weights, dtype=np.float64)[order], starts)
+    unique = keys[starts]
+    return unique // n, unique % n, summed
+
+def simplify_multigraph(G: nx.Graph, weight: str = "weight") -> nx.Graph:
+    """Collapse a MultiGraph to a simple Graph, summing edge weights per node pair."""
+    node_ids = list(G.nodes)
+    src, dst, weights = edge_index_arrays(G, {node: i for i, node in enumerate(node_ids)}, weight)
+    src, dst, weights = collapse_edges(src, dst, weights, len(node_ids))
+
+    simple_graph = nx.Graph()
+    simple_graph.add_nodes_from(G.nodes(data=True))
+    simple_graph.add_weighted_edges_from(
+        zip((node_ids[u] for u in src.tolist()), (node_ids[v] for v in dst.tolist()), weights.tolist()),
+        weight=weight
+    )
+    return simple_graph
+
+def ensure_networkx(G: AnyGraph) -> nx.Graph:
+    """NetworkX view of G; CSR graphs are converted once and cached."""
+    return G.to_networkx() if isinstance(G, CSRGraph) else G
+
+def ensure_csr(G: AnyGraph) -> CSRGraph:
+    return G if isinstance(G, CSRGraph) else CSRGraph.from_networkx(G)
+
+def node_attributes(G: AnyGraph, node: Hashable) -> Dict[str, Any]:
+    """Attribute dict for a node of either graph representation."""
+    return G.node_data(node) if isinstance(G, CSRGraph) else G.nodes[node]
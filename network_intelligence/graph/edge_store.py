@@ -0,0 +1,230 @@
+"""
+Compact binary edge store, opened with np.memmap so repeated runs skip text parsing.
+Layout: an 8-byte magic, the JSON header length (uint64), the JSON header, then 64-byte
+aligned sections: node-id string table (int64 byte offsets + UTF-8 blob, one ID per line),
+src / dst node indices (int32, or int64 past 2^31 nodes), float64 weights and uint8 codes
+for the per-edge categorical columns (platform, relationship) named in the header.
+Stores built from a source file record its size, mtime and SHA-256 for invalidation.
+"""
+import hashlib
+import json
+import logging
+import os
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from network_intelligence import config
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"NIEDGES1"
+# Bump when the layout or the meaning of a header field changes
+STORE_VERSION = 2
+ALIGNMENT = 64
+
+def file_sha256(filepath: str) -> str:
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def source_fingerprint(filepath: str, with_hash: bool = True) -> Dict[str, Any]:
+    """Size, mtime and (optionally) SHA-256 of a source file."""
+    stat = os.stat(filepath)
+    fingerprint = {"path": os.path.abspath(filepath), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    if with_hash:
+        fingerprint["sha256"] = file_sha256(filepath)
+    return fingerprint
+
+def cache_path(filepath: str, directory: Optional[str] = None) -> str:
+    """Store location for a source file: its basename plus a hash of the absolute path."""
+    directory = directory or config.EDGE_STORE_DIR
+    tag = hashlib.sha1(os.path.abspath(filepath).encode()).hexdigest()[:12]
+    return os.path.join(directory, f"{os.path.basename(filepath)}.{tag}.edges")
+
+def _encode_categories(values: Optional[Sequence[str]], names: Optional[List[str]],
+                       codes: Optional[np.ndarray], m: int) -> Tuple[np.ndarray, List[str]]:
+    if codes is not None:
+        return np.asarray(codes, dtype=np.uint8), list(names)
+    lookup: Dict[str, int] = {}
+    codes = np.fromiter((lookup.setdefault(v, len(lookup)) for v in values), dtype=np.int64, count=m)
+    if len(lookup) > 256:
+        raise ValueError(f"At most 256 distinct categories per column, got {len(lookup)}")
+    return codes.astype(np.uint8), list(lookup)
+
+def _data_start(header_length: int) -> int:
+    return -(-(len(MAGIC) + 8 + header_length) // ALIGNMENT) * ALIGNMENT
+
+class EdgeStore:
+    def __init__(self, path: str, header: Dict[str, Any], data_start: int):
+        self.path = path
+        self.header = header
+        self.data_start = data_start
+        self._arrays: Dict[str, np.ndarray] = {}
+        self.source: Optional[Dict[str, Any]] = header.get("source")
+        self.categories: Dict[str, List[str]] = header["categories"]
+        self._node_ids: Optional[List[str]] = None
+
+    @staticmethod
+    def write(path: str, node_ids: Sequence[str], src: np.ndarray, dst: np.ndarray,
+              weights: Optional[np.ndarray] = None, categories: Optional[Dict[str, Any]] = None,
+              source: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Write a store. categories maps a column name to either per-edge string values or a
+        (names, uint8 codes) tuple. Written to a temporary file and renamed into place.
+        """
+        m = len(src)
+        index_dtype = np.int32 if len(node_ids) < 2 ** 31 else np.int64
+        text = "\n".join(str(node) for node in node_ids)
+        blob = np.frombuffer(text.encode("utf-8"), dtype=np.uint8)
+        # IDs without newlines split on them directly when read back
+        split_ids = int(np.count_nonzero(blob == 10)) == max(len(node_ids) - 1, 0)
+        if split_ids:
+            ends = np.r_[np.flatnonzero(blob == 10), len(blob)] if len(node_ids) else np.zeros(0, dtype=np.int64)
+        else:
+            ends = np.cumsum([len(str(node).encode("utf-8")) + 1 for node in node_ids]) - 1
+        offsets = np.r_[0, ends + 1].astype(np.int64)
+
+        sections = [("node_offsets", offsets),
+                    ("node_blob", blob),
+                    ("src", np.asarray(src, dtype=index_dtype)),
+                    ("dst", np.asarray(dst, dtype=index_dtype)),
+                    # float64, as parsed, so a cached load sees exactly the weights of a cold one
+                    ("weights", np.ones(m, dtype=np.float64) if weights is None
+                     else np.asarray(weights, dtype=np.float64))]
+        names: Dict[str, List[str]] = {}
+        for column, spec in (categories or {}).items():
+            if isinstance(spec, tuple):
+                codes, names[column] = _encode_categories(None, spec[0], spec[1], m)
+            else:
+                codes, names[column] = _encode_categories(spec, None, None, m)
+            sections.append((f"category:{column}", codes))
+
+        # Section offsets are relative to the (aligned) end of the header
+        layout = []
+        position = 0
+        for name, array in sections:
+            position = -(-position // ALIGNMENT) * ALIGNMENT
+            layout.append((name, array, position))
+            position += array.nbytes
+        header = {
+            "version": STORE_VERSION,
+            "nodes": len(node_ids),
+            "edges": m,
+            "split_ids": split_ids,
+            "weighted": weights is not None,
+            "categories": names,
+            "source": source,
+            "sections": {name: [offset, array.dtype.str, len(array)] for name, array, offset in layout}
+        }
+        encoded = json.dumps(header).encode()
+        base = _data_start(len(encoded))
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(MAGIC)
+            f.write(np.uint64(len(encoded)).tobytes())
+            f.write(encoded)
+            for name, array, offset in layout:
+                f.seek(base + offset)
+                f.write(np.ascontiguousarray(array).tobytes())
+            f.truncate(base + position)
+        os.replace(tmp, path)
+
+    @classmethod
+    def open(cls, path: str) -> "EdgeStore":
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not an edge store")
+            length = int(np.frombuffer(f.read(8), dtype=np.uint64)[0])
+            header = json.loads(f.read(length))
+        if header.get("version") != STORE_VERSION:
+            raise ValueError(f"Edge store {path} has version {header.get('version')}, expected {STORE_VERSION}")
+        return cls(path, header, _data_start(length))
+
+    def _array(self, name: str) -> np.ndarray:
+        array = self._arrays.get(name)
+        if array is None:
+            offset, dtype, length = self.header["sections"][name]
+            if length == 0:
+                array = np.zeros(0, dtype=dtype)
+            else:
+                array = np.memmap(self.path, dtype=np.dtype(dtype), mode="r", offset=self.data_start + offset,
+                                  shape=(length,))
+            self._arrays[name] = array
+        return array
+
+    @property
+    def number_of_nodes(self) -> int:
+        return self.header["nodes"]
+
+    @property
+    def number_of_edges(self) -> int:
+        return self.header["edges"]
+
+    @property
+    def src(self) -> np.ndarray:
+        return self._array("src")
+
+    @property
+    def dst(self) -> np.ndarray:
+        return self._array("dst")
+
+    @property
+    def weights(self) -> np.ndarray:
+        return self._array("weights")
+
+    @property
+    def weighted(self) -> bool:
+        """False when the store was written without weights (all 1.0)."""
+        return self.header["weighted"]
+
+    def codes(self, column: str) -> np.ndarray:
+        """uint8 per-edge codes of a categorical column; names in self.categories[column]."""
+        return self._array(f"category:{column}")
+
+    def node_ids(self) -> List[str]:
+        """Decoded node-ID table (decoded once, on first use)."""
+        if self._node_ids is None:
+            if not self.number_of_nodes:
+                self._node_ids = []
+            else:
+                blob = bytes(self._array("node_blob"))
+                if self.header["split_ids"]:
+                    self._node_ids = blob.decode("utf-8").split("\n")
+                else:
+                    offsets = self._array("node_offsets").tolist()
+                    self._node_ids = [blob[a:b - 1].decode("utf-8") for a, b in zip(offsets[:-1], offsets[1:])]
+        return self._node_ids
+
+    def is_current(self, filepath: str) -> bool:
+        """
+        Whether the store was built from filepath as it is now. Size and mtime decide;
+        if only the mtime moved (a touch or a copy), the content hash settles it.
+        """
+        if not self.source or not os.path.exists(filepath):
+            return False
+        current = source_fingerprint(filepath, with_hash=False)
+        if current["size"] != self.source["size"]:
+            return False
+        if current["mtime_ns"] == self.source["mtime_ns"]:
+            return True
+        return file_sha256(filepath) == self.source.get("sha256")
+
+def open_cached(filepath: str, directory: Optional[str] = None) -> Optional[EdgeStore]:
+    """The cached store for a source file, or None when missing, unreadable or stale."""
+    path = cache_path(filepath, directory)
+    if not os.path.exists(path):
+        return None
+    try:
+        store = EdgeStore.open(path)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable edge store {path}: {e}")
+        return None
+    if not store.is_current(filepath):
+        logger.info(f"Edge store {path} is stale, re-reading {filepath}")
+        return None
+    return store
@@ -1,5 +1,7 @@
 import networkx as nx
+import numpy as np
 import os
+from network_intelligence.graph.edge_store import EdgeStore
 
 class GraphExporter:
     def export_graphml(self, G: nx.Graph, filepath: str) -> None:
@@ -13,3 +15,17 @@ class GraphExporter:
     def export_edge_list(self, G: nx.Graph, filepath: str) -> None:
         """Export to edge list."""
         nx.write_edgelist(G, filepath)
+
+    def export_edge_store(self, G: nx.Graph, filepath: str) -> None:
+        """Export to the binary edge store format (memory-mappable, see graph.edge_store)."""
+        index = {node: i for i, node in enumerate(G.nodes)}
+        edges = list(G.edges(data=True))
+        EdgeStore.write(
+            filepath,
+            [str(node) for node in G.nodes],
+            np.fromiter((index[u] for u, _, _ in edges), dtype=np.int64, count=len(edges)),
+            np.fromiter((index[v] for _, v, _ in edges), dtype=np.int64, count=len(edges)),
+            np.fromiter((d.get("weight", 1.0) for _, _, d in edges), dtype=np.float64, count=len(edges)),
+            {"platform": [str(d.get("platform") or "unknown") for _, _, d in edges],
+             "relationship": [str(d.get("relationship") or "connected") for _, _, d in edges]}
+        )
@@ -0,0 +1,84 @@
+"""
+Streaming ingestion of large SNAP edge lists.
+Chunks from FacebookLoader.load_chunked() feed an incremental GraphBuilder one at a time, so
+the text and the edge dicts of only one chunk are in memory. After each chunk a checkpoint
+records the byte offset reached; a later run resumes with a seek to it. Graph state survives
+between runs through a ResolutionStore (identities, entities and connections), which is saved
+before every checkpoint.
+"""
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+from network_intelligence import config
+from network_intelligence.data_sources.facebook import FacebookLoader
+from network_intelligence.graph.builder import GraphBuilder
+from network_intelligence.identity.store import ResolutionStore
+
+logger = logging.getLogger(__name__)
+
+# Attributes of SNAP friend edges, for connections restored from the store on resume
+EDGE_ATTRS = {"platform": "facebook", "relationship": "friend", "weight": 1.0}
+
+def _resume_offset(checkpoint: Optional[Dict[str, Any]], filepath: str) -> int:
+    """Byte offset to continue from, or 0 when the checkpoint belongs to another file or was truncated."""
+    if not checkpoint or checkpoint.get("source") != os.path.abspath(filepath):
+        return 0
+    offset = checkpoint.get("offset", 0)
+    if offset > os.path.getsize(filepath):
+        logger.warning(f"{filepath} is shorter than its checkpoint offset {offset}, starting over")
+        return 0
+    return offset
+
+def stream_edge_list(builder: GraphBuilder, filepath: str, checkpoint_path: Optional[str] = None,
+                     store: Optional[ResolutionStore] = None, chunk_size: Optional[int] = None,
+                     progress_interval: Optional[int] = None,
+                     loader: Optional[FacebookLoader] = None) -> Dict[str, Any]:
+    """
+    Ingest a SNAP edge list chunk by chunk. With checkpoint_path and a store, an interrupted run
+    resumes where the last checkpoint left off; without a store a checkpoint cannot restore the
+    graph, so the file is read from the start. Returns counts and timings.
+    """
+    loader = loader or FacebookLoader()
+    progress_interval = progress_interval or config.PROGRESS_REPORT_INTERVAL
+    size = os.path.getsize(filepath)
+
+    offset = 0
+    edges_done = 0
+    if checkpoint_path:
+        checkpoint = loader.load_checkpoint(checkpoint_path)
+        if store is None:
+            if checkpoint:
+                logger.warning("Streaming checkpoint ignored: resuming needs an identity store")
+        else:
+            offset = _resume_offset(checkpoint, filepath)
+            if offset:
+                edges_done = checkpoint.get("edges", 0)
+                restored = builder.restore_connections({**EDGE_ATTRS, "source_data_origin": filepath})
+                logger.info(f"Resuming {filepath} at byte {offset} ({edges_done} edges done, "
+                            f"{restored} connections restored)")
+    resumed_from = offset
+
+    start = time.perf_counter()
+    reported = edges_done // progress_interval
+    for identities, edges, offset in loader.load_chunked(filepath, chunk_size, resume_from=offset):
+        builder.add_chunk(identities, edges)
+        edges_done += len(edges)
+
+        if checkpoint_path:
+            if store is not None:
+                store.save(builder.resolver)
+            loader.save_checkpoint(checkpoint_path, {"source": os.path.abspath(filepath), "offset": offset,
+                                                     "edges": edges_done})
+        if edges_done // progress_interval > reported:
+            reported = edges_done // progress_interval
+            elapsed = time.perf_counter() - start
+            logger.info(f"Streamed {edges_done} edges ({100.0 * offset / max(size, 1):.1f}% of {filepath}, "
+                        f"{(offset - resumed_from) / max(elapsed, 1e-9) / 2 ** 20:.1f} MB/s), "
+                        f"{builder.graph.number_of_nodes()} nodes")
+
+    builder.finish_stream()
+    if store is not None:
+        store.save(builder.resolver)
+    return {"edges": edges_done, "offset": offset, "resumed_from": resumed_from,
+            "seconds": time.perf_counter() - start}
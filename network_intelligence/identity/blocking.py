@@ -0,0 +1,172 @@
+"""
+Multi-key blocking index for identity resolution.
+Every identity is posted under several keys: phonetic last name, handle / email tokens,
+numeric ID, and company tokens (qualified by last-name initial). Identities sharing a key
+become candidate pairs. Keys with more than max_block_size members fall back to a
+sorted neighborhood: members are ordered by normalized name and each one is only
+paired with its `window` nearest neighbors, so no key can degenerate to O(n^2).
+"""
+import re
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from network_intelligence import config
+from network_intelligence.identity.entity import PlatformIdentity
+from network_intelligence.identity.normalizer import NormalizationCache
+
+KEY_TYPES = ("phonetic", "handle", "numeric_id", "company")
+
+# Company tokens that say nothing about which company it is
+COMPANY_STOPWORDS = {
+    "inc", "llc", "ltd", "limited", "corp", "corporation", "company", "group", "the",
+    "and", "gmbh", "plc", "holdings", "international", "services", "solutions"
+}
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_NON_ALPHA = re.compile(r"[^a-z]+")
+
+class BlockingIndex:
+    def __init__(self, cache: NormalizationCache, max_block_size: Optional[int] = None,
+                 window: Optional[int] = None):
+        self.cache = cache
+        self.max_block_size = max_block_size or config.BLOCKING_MAX_BLOCK_SIZE
+        self.window = window or config.BLOCKING_WINDOW
+        self._key_codes: Dict[str, int] = {}
+        self._key_types: List[int] = []
+        # Flat posting list: (key code, identity index) per entry
+        self._post_keys: List[int] = []
+        self._post_items: List[int] = []
+        self._names: List[str] = []
+        # Blocking quality / pair volume of the last add()
+        self.stats: Dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def keys(self, identity: PlatformIdentity) -> List[str]:
+        """Blocking keys of one identity, prefixed by key type."""
+        normalized = self.cache.get(identity)
+        # dict as an insertion-ordered set
+        keys: Dict[str, None] = {}
+        if normalized.phonetic:
+            keys[f"phonetic:{normalized.phonetic}"] = None
+
+        handles = [identity.handle or ""]
+        email = identity.raw_data.get("email") if identity.raw_data else None
+        if email:
+            handles.append(str(email))
+        for handle in handles:
+            handle = handle.lower().split("@")[0]
+            # "john.doe" and "johndoe" share the squashed form
+            squashed = _NON_ALNUM.sub("", handle)
+            if len(squashed) >= 3:
+                keys[f"handle:{squashed}"] = None
+            for token in _NON_ALPHA.split(handle):
+                if len(token) >= 3:
+                    keys[f"handle:{token}"] = None
+
+        if identity.numeric_id:
+            keys[f"numeric_id:{identity.numeric_id}"] = None
+
+        if normalized.company and normalized.last_name:
+            initial = normalized.last_name[0]
+            for token in normalized.company.split():
+                if len(token) >= 3 and token not in COMPANY_STOPWORDS:
+                    keys[f"company:{token}:{initial}"] = None
+        return list(keys)
+
+    def post(self, keys: List[str], name: str) -> None:
+        """Index the next identity under already computed keys, without generating pairs."""
+        self._index(len(self._names), keys)
+        self._names.append(name)
+
+    def repost(self, item: int, keys: List[str], name: str) -> None:
+        """Index an existing item under the keys of the identity that replaced it (a profile for a stub)."""
+        self._index(item, keys)
+        self._names[item] = name
+
+    def _index(self, item: int, keys: List[str]) -> None:
+        for key in keys:
+            code = self._key_codes.get(key)
+            if code is None:
+                code = self._key_codes[key] = len(self._key_codes)
+                self._key_types.append(KEY_TYPES.index(key.split(":", 1)[0]))
+            self._post_keys.append(code)
+            self._post_items.append(item)
+
+    def add(self, identities: List[PlatformIdentity],
+            replaced: Sequence[Tuple[int, PlatformIdentity]] = ()) -> np.ndarray:
+        """
+        Index new identities (numbered from len(self) in order) and return candidate
+        pairs as an (m, 2) int64 array of (a, b), a < b, where at least one side is a new
+        identity or one of the (item, identity) replacements, which are re-posted first.
+        """
+        first_new = len(self)
+        for item, identity in replaced:
+            self.repost(item, self.keys(identity), self.cache.get(identity).name)
+        for identity in identities:
+            self.post(self.keys(identity), self.cache.get(identity).name)
+        changed = np.zeros(len(self), dtype=bool)
+        changed[first_new:] = True
+        changed[[item for item, _ in replaced]] = True
+
+        keys = np.array(self._post_keys, dtype=np.int64)
+        items = np.array(self._post_items, dtype=np.int64)
+        key_types = np.array(self._key_types, dtype=np.int64)
+
+        # Only keys that gained a member can produce new pairs
+        touched = np.zeros(len(self._key_codes), dtype=bool)
+        touched[keys[changed[items]]] = True
+        keep = touched[keys]
+        keys, items = keys[keep], items[keep]
+
+        sizes = np.bincount(keys, minlength=len(self._key_codes))
+        oversized = sizes > self.max_block_size
+
+        # Members of oversized keys are ordered by name for the sorted neighborhood
+        name_rank = np.zeros(len(items), dtype=np.int64)
+        in_oversized = np.flatnonzero(oversized[keys])
+        if len(in_oversized):
+            names = np.array([self._names[i] for i in items[in_oversized].tolist()], dtype=str)
+            name_rank[in_oversized] = np.argsort(np.argsort(names, kind="stable"), kind="stable")
+        order = np.lexsort((items, name_rank, keys))
+        keys, items = keys[order], items[order]
+
+        # Pair each position with the following members of its key: all of them in a
+        # regular block, the next `window` in an oversized one
+        positions = np.arange(len(keys))
+        group_end = np.searchsorted(keys, keys, side="right")
+        span = np.where(oversized[keys], self.window, sizes[keys] - 1)
+        counts = np.minimum(span, group_end - 1 - positions)
+        src = np.repeat(positions, counts)
+        step = np.arange(len(src)) - np.repeat(np.cumsum(counts) - counts, counts) + 1
+        dst = src + step
+
+        lo = np.minimum(items[src], items[dst])
+        hi = np.maximum(items[src], items[dst])
+        # A re-posted item may sit under a key twice (its stub's keys and its profile's)
+        new_pair = (changed[lo] | changed[hi]) & (lo != hi)
+        pair_types = key_types[keys[src]][new_pair]
+        lo, hi = lo[new_pair], hi[new_pair]
+
+        n = len(self)
+        # Sort-based dedupe of the pair codes
+        codes = np.sort(lo * n + hi)
+        unique = codes[np.r_[True, codes[1:] != codes[:-1]]] if len(codes) else codes
+        pairs = np.stack([unique // n, unique % n], axis=1) if len(unique) else np.zeros((0, 2), dtype=np.int64)
+
+        added = len(identities)
+        exhaustive = added * first_new + added * (added - 1) // 2
+        block_types = key_types[np.flatnonzero(touched)]
+        self.stats = {
+            "identities": n,
+            "new_identities": added,
+            "blocks": int(touched.sum()),
+            "oversized_blocks": int((oversized & touched).sum()),
+            "largest_block": int(sizes.max(initial=0)),
+            "pairs_per_key_type": {name: int((pair_types == i).sum()) for i, name in enumerate(KEY_TYPES)},
+            "blocks_per_key_type": {name: int((block_types == i).sum()) for i, name in enumerate(KEY_TYPES)},
+            "candidate_pairs": len(pairs),
+            "exhaustive_pairs": exhaustive,
+            "reduction_ratio": 1.0 - len(pairs) / exhaustive if exhaustive else 0.0
+        }
+        return pairs
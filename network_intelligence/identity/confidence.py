@@ -1,4 +1,5 @@
-from typing import Dict, Any
+import numpy as np
+from typing import Dict, Any, Optional
 
 class ConfidenceScorer:
     WEIGHTS = {
@@ -31,6 +32,34 @@ class ConfidenceScorer:
 
         return weighted_sum / total_weight
 
+    def score_arrays(self, signals: Dict[str, np.ndarray],
+                     present: Optional[Dict[str, np.ndarray]] = None) -> np.ndarray:
+        """
+        score() over whole matrices of pairs at once.
+        present[key] masks the pairs a signal applies to (absent keys apply everywhere);
+        the summation order matches score(), so both give bit-identical results.
+        """
+        present = present or {}
+        weighted_sum = 0.0
+        total_weight = 0.0
+        for key, value in signals.items():
+            if key not in self.WEIGHTS:
+                continue
+            weight = self.WEIGHTS[key]
+            mask = present.get(key)
+            if mask is None:
+                weighted_sum = weighted_sum + value * weight
+                total_weight = total_weight + weight
+            else:
+                weighted_sum = weighted_sum + np.where(mask, value * weight, 0.0)
+                total_weight = total_weight + np.where(mask, weight, 0.0)
+
+        weighted_sum = np.asarray(weighted_sum, dtype=np.float64)
+        total_weight = np.broadcast_to(total_weight, weighted_sum.shape)
+        scores = np.zeros(weighted_sum.shape)
+        np.divide(weighted_sum, total_weight, out=scores, where=total_weight != 0)
+        return scores
+
     def explain(self, signals: Dict[str, float]) -> Dict[str, Any]:
         """
         Return human-readable explanation of the score.
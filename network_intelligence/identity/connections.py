@@ -0,0 +1,34 @@
+"""
+Mutual-connections signal for identity resolution.
+Neighbors are labeled with the cluster (entity) they resolved to in the first pass, so the
+neighbor sets of identities on different platforms are comparable. Each identity's set is
+one row of a binary sparse matrix, and the Jaccard overlap of a whole pair list comes from
+row-wise sparse intersections rather than per-pair Python sets.
+"""
+import numpy as np
+from scipy import sparse
+
+def neighbor_matrix(sources: np.ndarray, targets: np.ndarray, labels: np.ndarray,
+                    rows: np.ndarray) -> sparse.csr_matrix:
+    """
+    Binary (n, n) CSR matrix over identity indices: entry (i, labels[j]) is set when i and j
+    are connected (edges are undirected). Only identities flagged in `rows` get their row filled.
+    """
+    n = len(labels)
+    src = np.concatenate([sources, targets])
+    dst = np.concatenate([targets, sources])
+    keep = rows[src]
+    src, dst = src[keep], labels[dst[keep]]
+    matrix = sparse.csr_matrix((np.ones(len(src), dtype=np.int32), (src, dst)), shape=(n, n))
+    # Parallel edges and neighbors sharing an entity count once
+    matrix.data[:] = 1
+    return matrix
+
+def jaccard(matrix: sparse.csr_matrix, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """|N(a) & N(b)| / |N(a) | N(b)| for each (left[i], right[i]) row pair; 0.0 when both are empty."""
+    shared = np.asarray(matrix[left].multiply(matrix[right]).sum(axis=1)).ravel()
+    degrees = np.diff(matrix.indptr)
+    union = degrees[left] + degrees[right] - shared
+    scores = np.zeros(len(left))
+    np.divide(shared, union, out=scores, where=union > 0)
+    return scores
@@ -3,9 +3,28 @@ Unified person entity that spans platforms.
 A single real-world person may have identities on Facebook, LinkedIn, Twitter, etc.
 This model holds all of them and tracks which are confirmed vs inferred.
 """
-from dataclasses import dataclass, field
-from typing import List, Optional, Set, Dict, Any
+import uuid
+from dataclasses import dataclass, field, fields
+from typing import Iterable, List, Optional, Set, Dict, Any
 
+# Fixed namespace so the same identity keys always hash to the same entity ID
+ENTITY_ID_NAMESPACE = uuid.UUID("6f1c2d0e-5b7a-4c3e-9a51-2e8d4b6f7c10")
+
+# raw_data keys the engine itself reads (stub markers, blocking on email); kept when raw data is dropped
+ESSENTIAL_RAW_KEYS = ("stub", "email")
+
+def _slotted(cls):
+    """
+    dataclass(slots=True) for Python < 3.10: rebuild the class with __slots__ for its fields,
+    so instances carry no per-instance __dict__.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = {key: value for key, value in cls.__dict__.items()
+                 if key not in names and key not in ("__dict__", "__weakref__")}
+    namespace["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+@_slotted
 @dataclass
 class PlatformIdentity:
     platform: str               # "facebook", "linkedin", "twitter", "powermem"
@@ -18,9 +37,10 @@ class PlatformIdentity:
     verified: bool              # Has this identity been confirmed?
     raw_data: Dict[str, Any]    # Original platform data preserved
 
+@_slotted
 @dataclass
 class UnifiedEntity:
-    entity_id: str              # Generated UUID
+    entity_id: str              # Content-derived UUID, see stable_entity_id()
     canonical_name: str         # Best-guess real name
     identities: List[PlatformIdentity]
     platforms_present: Set[str]
@@ -28,3 +48,21 @@ class UnifiedEntity:
     overall_confidence: float = 0.0   # Aggregate confidence that all identities are same person
     merge_history: List[Dict[str, Any]] = field(default_factory=list)   # Audit trail of merges
     metadata: Dict[str, Any] = field(default_factory=dict)              # Arbitrary additional data
+
+
+def essential_raw_data(raw_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """The part of an identity's raw_data the engine needs, for callers that drop the rest."""
+    if not raw_data:
+        return {}
+    return {key: raw_data[key] for key in ESSENTIAL_RAW_KEYS if key in raw_data}
+
+def identity_key(identity: PlatformIdentity) -> str:
+    """Platform-qualified handle, e.g. "linkedin:john.doe"."""
+    return f"{identity.platform}:{identity.handle}"
+
+def stable_entity_id(keys: Iterable[str]) -> str:
+    """
+    Deterministic entity ID derived from the sorted platform:handle keys of its members.
+    Resolving the same data again yields the same IDs, so cached analysis stays valid.
+    """
+    return str(uuid.uuid5(ENTITY_ID_NAMESPACE, "\n".join(sorted(keys))))
@@ -1,6 +1,9 @@
 import unicodedata
 import re
-from difflib import SequenceMatcher
+import sys
+from typing import Dict, List, Tuple
+from network_intelligence.identity.entity import PlatformIdentity
+from network_intelligence.identity.similarity import indel_similarity
 
 class NameNormalizer:
     SUFFIXES = {
@@ -10,11 +13,20 @@ class NameNormalizer:
         "dr", "mr", "mrs", "ms", "prof", "eng", "arch"
     }
 
+    def __init__(self):
+        # normalize() memo; the same display names, companies and titles recur across sources
+        self._memo: Dict[str, str] = {}
+
     def normalize(self, name: str) -> str:
         """Canonical normalized form."""
         if not name:
             return ""
+        cached = self._memo.get(name)
+        if cached is None:
+            cached = self._memo[name] = self._normalize(name)
+        return cached
 
+    def _normalize(self, name: str) -> str:
         # Unicode normalization
         normalized = unicodedata.normalize('NFKD', name)
 
@@ -72,5 +84,78 @@ class NameNormalizer:
         if norm_a == norm_b:
             return 1.0
 
-        # Jaro-Winkler or Levenshtein. Using SequenceMatcher (Ratcliff/Obershelp) for simplicity/std lib
-        return SequenceMatcher(None, norm_a, norm_b).ratio()
+        # Indel (LCS) ratio, the same formula the batch kernel in similarity.py vectorizes
+        return indel_similarity(norm_a, norm_b)
+
+_SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"), **dict.fromkeys("cgjkqsxz", "2"), **dict.fromkeys("dt", "3"),
+    "l": "4", **dict.fromkeys("mn", "5"), "r": "6"
+}
+
+def soundex(word: str) -> str:
+    """American Soundex code ("robert" -> "r163"), or "" when the word has no ASCII letters."""
+    letters = [c for c in word.lower() if "a" <= c <= "z"]
+    if not letters:
+        return ""
+    code = letters[0]
+    last = _SOUNDEX_CODES.get(letters[0], "")
+    for c in letters[1:]:
+        digit = _SOUNDEX_CODES.get(c, "")
+        if digit and digit != last:
+            code += digit
+            if len(code) == 4:
+                break
+        # h and w do not separate equal codes; vowels do
+        if c not in "hw":
+            last = digit
+    return code.ljust(4, "0")
+
+class NormalizedIdentity:
+    """Normalized fields of one PlatformIdentity, computed once."""
+    __slots__ = ("name", "tokens", "last_name", "phonetic", "company", "title")
+
+    def __init__(self, name: str, tokens: Tuple[str, ...], phonetic: str, company: str, title: str):
+        self.name = name
+        self.tokens = tokens
+        self.last_name = tokens[-1] if tokens else ""
+        self.phonetic = phonetic
+        self.company = company
+        self.title = title
+
+class NormalizationCache:
+    """
+    Side table of NormalizedIdentity per PlatformIdentity (identities are treated as
+    immutable once loaded). Normalized strings are interned, so a company shared by
+    thousands of profiles is stored once.
+    """
+
+    def __init__(self, normalizer: NameNormalizer):
+        self.normalizer = normalizer
+        # id(identity) -> (identity, normalized); the identity reference keeps the id from being reused
+        self._entries: Dict[int, Tuple[PlatformIdentity, NormalizedIdentity]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def normalize(self, text: str) -> str:
+        return sys.intern(self.normalizer.normalize(text)) if text else ""
+
+    def get(self, identity: PlatformIdentity) -> NormalizedIdentity:
+        entry = self._entries.get(id(identity))
+        if entry is not None and entry[0] is identity:
+            return entry[1]
+
+        name = self.normalize(identity.display_name)
+        tokens = tuple(sys.intern(token) for token in name.split())
+        normalized = NormalizedIdentity(
+            name=name,
+            tokens=tokens,
+            phonetic=soundex(tokens[-1]) if tokens else "",
+            company=self.normalize(identity.company),
+            title=self.normalize(identity.title)
+        )
+        self._entries[id(identity)] = (identity, normalized)
+        return normalized
+
+    def get_many(self, identities: List[PlatformIdentity]) -> List[NormalizedIdentity]:
+        return [self.get(identity) for identity in identities]
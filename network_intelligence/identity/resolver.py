@@ -1,88 +1,451 @@
-import uuid
-from typing import List, Dict, Tuple, Optional
-from network_intelligence.identity.entity import PlatformIdentity, UnifiedEntity
-from network_intelligence.identity.normalizer import NameNormalizer
+import json
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from scipy import sparse
+from scipy.sparse import csgraph
+from typing import Iterable, List, Dict, Set, Tuple, Optional, Union
+from network_intelligence import config
+from network_intelligence.identity.entity import PlatformIdentity, UnifiedEntity, identity_key, stable_entity_id
+from network_intelligence.identity.normalizer import NameNormalizer, NormalizationCache
 from network_intelligence.identity.confidence import ConfidenceScorer
+from network_intelligence.identity.similarity import IdentityFeatures, indel_similarity
+from network_intelligence.identity.blocking import BlockingIndex
+from network_intelligence.identity.table import IdentityTable
+from network_intelligence.identity.union_find import DisjointSet
+from network_intelligence.identity.connections import neighbor_matrix, jaccard
+
+# Candidate pairs scored per vectorized batch (and per worker task)
+SCORE_BLOCK_ELEMENTS = 2 ** 20
+
+# Below this many candidate pairs a process pool costs more than it saves
+PARALLEL_MIN_PAIRS = 500_000
+
+# Features and scorer inherited by forked workers (or passed once to spawned ones)
+_worker_features: Optional[IdentityFeatures] = None
+_worker_scorer: Optional[ConfidenceScorer] = None
+
+def _score(features: IdentityFeatures, scorer: ConfidenceScorer, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    return scorer.score_arrays(features.signals(left, right), features.present(left, right))
+
+def _preference(identity: PlatformIdentity) -> tuple:
+    """
+    Sort key among identities sharing a platform:handle, preferred first: a profile over a
+    stub, then the most filled-in fields, then the field values themselves (a total order,
+    so which duplicate wins does not depend on input order).
+    """
+    values = (identity.display_name, identity.profile_url, identity.numeric_id, identity.title, identity.company)
+    filled = sum(1 for value in values if value) + bool(identity.verified) + len(identity.raw_data)
+    return (bool(identity.raw_data.get("stub")), -filled, tuple(str(value or "") for value in values),
+            not identity.verified, json.dumps(identity.raw_data, sort_keys=True, default=str))
+
+def _init_worker(features: IdentityFeatures, scorer: ConfidenceScorer) -> None:
+    global _worker_features, _worker_scorer
+    _worker_features, _worker_scorer = features, scorer
+
+def _score_shard(pairs: np.ndarray) -> np.ndarray:
+    return _score(_worker_features, _worker_scorer, pairs[:, 0], pairs[:, 1])
 
 class IdentityResolver:
-    def __init__(self):
+    def __init__(self, workers: Optional[int] = None):
+        # Processes for candidate scoring on large inputs (config.MAX_WORKERS by default)
+        self.workers = workers or config.MAX_WORKERS
         self.normalizer = NameNormalizer()
+        # Normalized fields per identity; kept across resolve() calls, so rebuilds reuse them
+        self.normalized = NormalizationCache(self.normalizer)
         self.scorer = ConfidenceScorer()
         self.review_queue = []
+        # Every identity seen since the last resolve(), in index order, and its entity
+        self.identities: List[PlatformIdentity] = []
+        self.entity_of: List[UnifiedEntity] = []
+        # Clusters over identity indices; merges persist across incremental calls
+        self.clusters = DisjointSet()
+        # Entity IDs merged away by the last resolve_incremental(): absorbed -> surviving ID
+        self.absorbed: Dict[str, str] = {}
+        # Identity index per platform:handle key, and edges between identity indices,
+        # for the mutual_connections signal of the second pass
+        self.index_of: Dict[str, int] = {}
+        self.edge_sources: List[int] = []
+        self.edge_targets: List[int] = []
+        # (a, b) identity indices behind each review_queue entry
+        self.review_pairs: List[Tuple[int, int]] = []
+        # Entities created or changed since the last ResolutionStore.save(); None once absorbed
+        self.changed_entities: Dict[str, Optional[UnifiedEntity]] = {}
+        # Identity indices whose stub was replaced by a profile since the last save()
+        self.replaced: Set[int] = set()
+        # Bumped by every resolve(), which renumbers identities: a store saved before must be rewritten
+        self.generation = 0
+        self.blocking = BlockingIndex(self.normalized)
 
-    def resolve(self, identities: List[PlatformIdentity]) -> List[UnifiedEntity]:
+    def resolve(self, identities: Union[Iterable[PlatformIdentity], IdentityTable]) -> List[UnifiedEntity]:
         """Main resolution pipeline."""
         self.review_queue = [] # Reset queue for new resolution run
-        unified_entities: List[UnifiedEntity] = []
+        self.identities = []
+        self.entity_of = []
+        self.clusters = DisjointSet()
+        self.index_of = {}
+        self.edge_sources = []
+        self.edge_targets = []
+        self.review_pairs = []
+        self.changed_entities = {}
+        self.replaced = set()
+        self.blocking = BlockingIndex(self.normalized)
+        self.generation += 1
+
+        created, _ = self.resolve_incremental(identities)
+        return created
+
+    def resolve_incremental(self, identities: Union[Iterable[PlatformIdentity], IdentityTable]
+                            ) -> Tuple[List[UnifiedEntity], List[UnifiedEntity]]:
+        """
+        Resolve new identities against the entities already known to this resolver.
+        Returns (created, updated): entities minted in this call, and previously
+        existing entities that absorbed at least one of the new identities.
+
+        Every candidate pair at or above the auto-merge threshold is unioned, so the
+        clusters (and the IDs of new entities) do not depend on input order. Existing
+        entities keep their IDs; when a new identity links two of them, the one with the
+        smaller ID survives and the other is recorded in self.absorbed.
+
+        Identities whose platform:handle is already known (e.g. restored from a
+        ResolutionStore), or repeated within the call, are skipped (of duplicates, the one
+        _split_new prefers is kept), except that a profile replaces a stub: in place when
+        the stub is already resolved, so its entity keeps its ID and is renamed after the
+        profile (see _promote_profile). The review queue holds the best near miss per
+        pair of entities kept apart, ordered by identity key.
+        Rows of an IdentityTable are only materialized when they may be new.
+        """
+        created: List[UnifiedEntity] = []
+        updated: List[UnifiedEntity] = []
+        self.absorbed = {}
+        if isinstance(identities, IdentityTable):
+            table = identities
+            identities = [table[row] for row, key in enumerate(table.keys())
+                          if key not in self.index_of or self.identities[self.index_of[key]].raw_data.get("stub")]
+        identities, replaced = self._split_new(identities)
+
+        # Candidate pairs (a, b), a < b, pair each new identity (or replaced stub) with
+        # identities from this or previous calls that share a blocking key
+        first = len(self.identities)
+        pairs = self.blocking.add(identities, replaced)
+        promote = set()
+        for index, identity in replaced:
+            stub = self.identities[index]
+            self.identities[index] = identity
+            entity = self.entity_of[index]
+            entity.identities[entity.identities.index(stub)] = identity
+            promote.add(id(entity))
+            self.replaced.add(index)
+        self.identities.extend(identities)
+        for offset, identity in enumerate(identities):
+            self.index_of[identity_key(identity)] = first + offset
+        self.entity_of.extend([None] * len(identities))
+        self.clusters.add(len(identities))
+        scores = self._score_candidates(pairs)
 
-        # Initial blocking
-        blocks = self.block_by_name(identities)
+        # Pairs below the review threshold cannot change the outcome
+        keep = scores >= config.IDENTITY_MANUAL_REVIEW_THRESHOLD
+        pairs, scores = pairs[keep], scores[keep]
+        merge = scores >= config.IDENTITY_AUTO_MERGE_THRESHOLD
 
-        for block_key, block_identities in blocks.items():
-            if not block_identities:
+        # Confidence each new identity joined its cluster with: its best merge score
+        joined = np.zeros(len(self.identities))
+        for column in (0, 1):
+            np.maximum.at(joined, pairs[merge, column], scores[merge])
+        joined = joined.tolist()
+
+        for a, b in pairs[merge].tolist():
+            self.clusters.union(a, b)
+
+        # One entity per cluster that gained members (or a profile), visited in order of first new member
+        changed = [first + offset for offset in range(len(identities))] + [index for index, _ in replaced]
+        replaced_indices = {index for index, _ in replaced}
+        seen = set()
+        for start in changed:
+            root = self.clusters.find(start)
+            if root in seen:
+                continue
+            seen.add(root)
+            members = sorted(self.clusters.members(root))
+            existing = {}
+            for member in members:
+                if member < first:
+                    entity = self.entity_of[member]
+                    existing[entity.entity_id] = entity
+            new_members = [self.identities[m] for m in members if m >= first]
+            confidence = {id(self.identities[m]): joined[m] for m in members
+                          if m >= first or m in replaced_indices}
+
+            if existing:
+                entity = existing.pop(min(existing))
+                for other_id in sorted(existing):
+                    # Linked through the new members: as strong as their weakest join
+                    self._absorb(entity, existing[other_id], min(confidence.values()))
+                    if id(existing[other_id]) in promote:
+                        promote.add(id(entity))
+                updated.append(entity)
+            else:
+                # Founder: a real profile over a stub, then the smallest identity key
+                new_members.sort(key=lambda identity: (bool(identity.raw_data.get("stub")), identity_key(identity)))
+                entity = self._new_entity(new_members[0], new_members)
+                new_members = new_members[1:]
+                created.append(entity)
+            for identity in new_members:
+                self.merge_entities(entity, identity, confidence[id(identity)])
+            if id(entity) in promote or entity.identities[0].raw_data.get("stub"):
+                self._promote_profile(entity)
+
+            for member in members:
+                self.entity_of[member] = entity
+            self.changed_entities[entity.entity_id] = entity
+
+        # Review queue: best near-miss per pair of entities still apart. Chosen and ordered by
+        # score, entity IDs and identity keys (never indices), so it does not depend on input order
+        review = ~merge
+        best: Dict[Tuple[str, str], Tuple[float, str, str, int, int]] = {}
+        for (a, b), score in zip(pairs[review].tolist(), scores[review].tolist()):
+            if self.clusters.find(a) == self.clusters.find(b):
                 continue
+            key_a, key_b = identity_key(self.identities[a]), identity_key(self.identities[b])
+            # The new identity is proposed for the other's entity; of two new ones, the larger key
+            if a >= first or a in replaced_indices:
+                if (b < first and b not in replaced_indices) or key_a > key_b:
+                    a, b, key_a, key_b = b, a, key_b, key_a
+            entities = tuple(sorted((self.entity_of[a].entity_id, self.entity_of[b].entity_id)))
+            candidate = (-score, key_b, key_a, a, b)
+            if entities not in best or candidate[:3] < best[entities][:3]:
+                best[entities] = candidate
+        for negative, key_b, key_a, a, b in sorted(best.values(), key=lambda candidate: candidate[1:3]):
+            score = -negative
+            entity, identity = self.entity_of[a], self.identities[b]
+            self.review_queue.append({
+                "type": "potential_merge",
+                "entity_id": entity.entity_id,
+                "entity_name": entity.canonical_name,
+                "new_identity_handle": identity.handle,
+                "new_identity_platform": identity.platform,
+                "score": score
+            })
+            self.review_pairs.append((a, b))
+
+        return created, updated
+
+    def _split_new(self, identities: Iterable[PlatformIdentity]
+                   ) -> Tuple[List[PlatformIdentity], List[Tuple[int, PlatformIdentity]]]:
+        """
+        (identities with a new platform:handle, one per key;
+        (index, profile) replacements for stubs this resolver already holds).
+        Of several identities with the same key, the one first in _preference order is kept
+        (a profile over a stub, then the most complete), whatever the input order.
+        """
+        new: Dict[str, PlatformIdentity] = {}
+        replaced: Dict[int, PlatformIdentity] = {}
+        for identity in identities:
+            key = identity_key(identity)
+            index = self.index_of.get(key)
+            if index is not None:
+                if identity.raw_data.get("stub") or not self.identities[index].raw_data.get("stub"):
+                    continue
+                if index not in replaced or _preference(identity) < _preference(replaced[index]):
+                    replaced[index] = identity
+            elif key not in new or _preference(identity) < _preference(new[key]):
+                new[key] = identity
+        return list(new.values()), list(replaced.items())
+
+    def _promote_profile(self, entity: UnifiedEntity) -> None:
+        """
+        Founder rule of a new cluster, for an entity that began as a stub: its real profile
+        with the smallest identity key leads and names it, as full resolution would.
+        The entity ID stays.
+        """
+        founder = min(entity.identities, key=lambda identity: (bool(identity.raw_data.get("stub")),
+                                                               identity_key(identity)))
+        if founder.raw_data.get("stub"):
+            return
+        entity.identities.remove(founder)
+        entity.identities.insert(0, founder)
+        entity.canonical_name = founder.display_name
+
+    def entities(self) -> List[UnifiedEntity]:
+        """Every current entity, in order of its first identity."""
+        unique: Dict[int, UnifiedEntity] = {}
+        for entity in self.entity_of:
+            unique.setdefault(id(entity), entity)
+        return list(unique.values())
 
-            # Within each block, compare pairs.
-            # We treat the block as a set of candidates to be clustered.
-            # Simple greedy clustering:
-            # 1. Take an identity
-            # 2. Compare against all existing clusters (unified entities)
-            # 3. Find best match above threshold
-            # 4. If found, merge. Else create new cluster.
-
-            local_entities: List[UnifiedEntity] = []
-
-            for identity in block_identities:
-                best_match_entity = None
-                best_score = 0.0
-
-                for entity in local_entities:
-                    # Compare new identity with existing unified entity
-                    # In a real system, we'd compare against all identities in the entity
-                    # For now, let's just pick the first identity in the entity as representative
-                    rep_identity = entity.identities[0]
-                    score = self.compare_pair(rep_identity, identity)
-
-                    if score > best_score:
-                        best_score = score
-                        best_match_entity = entity
-
-                if best_match_entity:
-                    if best_score >= 0.90:
-                        # Auto-merge
-                        self.merge_entities(best_match_entity, identity, best_score)
-                        continue
-                    elif best_score >= 0.50:
-                        # Flag for review
-                        self.review_queue.append({
-                            "type": "potential_merge",
-                            "entity_id": best_match_entity.entity_id,
-                            "entity_name": best_match_entity.canonical_name,
-                            "new_identity_handle": identity.handle,
-                            "new_identity_platform": identity.platform,
-                            "score": best_score
-                        })
-
-                # If not merged (even if flagged), create new entity
-                new_entity = UnifiedEntity(
-                        entity_id=str(uuid.uuid4()),
-                        canonical_name=identity.display_name, # or normalized
-                        identities=[identity],
-                        platforms_present={identity.platform},
-                        confidence_scores={},
-                        overall_confidence=1.0,
-                        merge_history=[]
-                    )
-                    local_entities.append(new_entity)
-
-            unified_entities.extend(local_entities)
-
-        return unified_entities
+    def add_connections(self, edges: List[Dict]) -> None:
+        """Record loaded edges (platform / source / target dicts) between known identities."""
+        for edge in edges:
+            plt = edge["platform"]
+            u = self.index_of.get(f"{plt}:{edge['source']}")
+            v = self.index_of.get(f"{plt}:{edge['target']}")
+            if u is not None and v is not None and u != v:
+                self.edge_sources.append(u)
+                self.edge_targets.append(v)
+
+    def rescore_review_queue(self) -> List[UnifiedEntity]:
+        """
+        Second pass: re-score the flagged review pairs with mutual_connections added, the
+        Jaccard overlap of the two identities' neighbor entities. Pairs that now reach the
+        auto-merge threshold merge their entities (the smaller ID survives, the other goes
+        to self.absorbed); pairs below the review threshold leave the queue.
+        Returns the entities that grew.
+        """
+        self.absorbed = {}
+        if not self.review_pairs:
+            return []
+        pairs = np.array(self.review_pairs, dtype=np.int64)
+        left, right = pairs[:, 0], pairs[:, 1]
+
+        rows = np.zeros(len(self.identities), dtype=bool)
+        rows[pairs.ravel()] = True
+        matrix = neighbor_matrix(np.array(self.edge_sources, dtype=np.int64),
+                                 np.array(self.edge_targets, dtype=np.int64),
+                                 self.clusters.roots(), rows)
+        degrees = np.diff(matrix.indptr)
+
+        members, local = np.unique(pairs, return_inverse=True)
+        local = local.reshape(pairs.shape)
+        features = self.features([self.identities[i] for i in members.tolist()])
+        signals = features.signals(local[:, 0], local[:, 1])
+        present = features.present(local[:, 0], local[:, 1])
+        # Only informative when both sides have connections, like company and title
+        signals["mutual_connections"] = jaccard(matrix, left, right)
+        present["mutual_connections"] = (degrees[left] > 0) & (degrees[right] > 0)
+        scores = self.scorer.score_arrays(signals, present)
+
+        grown: Dict[str, UnifiedEntity] = {}
+        kept = []
+        for i, (a, b) in enumerate(pairs.tolist()):
+            if self.clusters.find(a) == self.clusters.find(b):
+                continue
+            if scores[i] >= config.IDENTITY_AUTO_MERGE_THRESHOLD:
+                entity, other = self.entity_of[a], self.entity_of[b]
+                if other.entity_id < entity.entity_id:
+                    entity, other = other, entity
+                self._absorb(entity, other, float(scores[i]))
+                self.clusters.union(a, b)
+                for member in self.clusters.members(a):
+                    self.entity_of[member] = entity
+                grown[entity.entity_id] = entity
+                self.changed_entities[entity.entity_id] = entity
+            elif scores[i] >= config.IDENTITY_MANUAL_REVIEW_THRESHOLD:
+                kept.append(i)
+
+        # Rebuild the queue from the surviving pairs, pointing at their current entities
+        queue, review_pairs = [], []
+        for i in kept:
+            a, b = self.review_pairs[i]
+            if self.clusters.find(a) == self.clusters.find(b):
+                continue
+            entity = self.entity_of[a]
+            queue.append(dict(self.review_queue[i], entity_id=entity.entity_id, entity_name=entity.canonical_name,
+                              score=float(scores[i]), mutual_connections=float(signals["mutual_connections"][i])))
+            review_pairs.append((a, b))
+        self.review_queue, self.review_pairs = queue, review_pairs
+
+        return [entity for entity_id, entity in grown.items() if entity_id not in self.absorbed]
+
+    def _score_candidates(self, pairs: np.ndarray) -> np.ndarray:
+        """compare_pair for every candidate (a, b) row, vectorized in chunks."""
+        scores = np.zeros(len(pairs))
+        if not len(pairs):
+            return scores
+        # Features only for identities that take part in a pair
+        members, local = np.unique(pairs, return_inverse=True)
+        local = local.reshape(pairs.shape)
+        features = self.features([self.identities[i] for i in members.tolist()])
+
+        if self.workers > 1 and len(pairs) >= PARALLEL_MIN_PAIRS:
+            return self._score_parallel(features, local)
+
+        for start in range(0, len(pairs), SCORE_BLOCK_ELEMENTS):
+            chunk = local[start:start + SCORE_BLOCK_ELEMENTS]
+            scores[start:start + len(chunk)] = self.score_pairs(features, chunk[:, 0], chunk[:, 1])
+        return scores
+
+    def _score_parallel(self, features: IdentityFeatures, local: np.ndarray) -> np.ndarray:
+        """
+        Score candidate pairs across a process pool, one task per shard of the candidate
+        graph's connected components (the independent resolution blocks), largest first.
+        Scores are written back by pair position, so the result matches the serial path.
+        """
+        n = int(local.max()) + 1
+        graph = sparse.coo_matrix((np.ones(len(local)), (local[:, 0], local[:, 1])), shape=(n, n))
+        _, labels = csgraph.connected_components(graph, directed=False)
+        component = labels[local[:, 0]]
+        sizes = np.bincount(component)
+
+        # Pairs grouped by component, largest component first; large components are
+        # split and small ones packed so every task is about SCORE_BLOCK_ELEMENTS pairs
+        order = np.lexsort((component, -sizes[component]))
+        chunk = max(1, min(SCORE_BLOCK_ELEMENTS, -(-len(order) // (self.workers * 4))))
+        shards = [order[start:start + chunk] for start in range(0, len(order), chunk)]
+
+        methods = multiprocessing.get_all_start_methods()
+        # fork shares the feature arrays copy-on-write; other start methods receive them once per worker
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        scores = np.zeros(len(local))
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                 initializer=_init_worker, initargs=(features, self.scorer)) as pool:
+            for shard, shard_scores in zip(shards, pool.map(_score_shard, [local[shard] for shard in shards])):
+                scores[shard] = shard_scores
+        return scores
+
+    def features(self, identities: List[PlatformIdentity]) -> IdentityFeatures:
+        """Normalized names, companies and titles of a set of identities, for batch scoring."""
+        normalized = self.normalized.get_many(identities)
+        return IdentityFeatures(
+            names=[norm.name for norm in normalized],
+            handles=[ident.handle for ident in identities],
+            companies=[ident.company for ident in identities],
+            normalized_companies=[norm.company for norm in normalized],
+            titles=[ident.title for ident in identities],
+            normalized_titles=[norm.title for norm in normalized]
+        )
+
+    def score_matrix(self, features: IdentityFeatures, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """compare_pair for every (row, col) identity pair of a feature set, as one matrix."""
+        return self.score_pairs(features, np.asarray(rows)[:, None], np.asarray(cols)[None, :])
+
+    def score_pairs(self, features: IdentityFeatures, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+        """compare_pair for each (left[i], right[i]) pair; the index arrays broadcast."""
+        return _score(features, self.scorer, left, right)
+
+    def _new_entity(self, identity: PlatformIdentity, members: Optional[List[PlatformIdentity]] = None) -> UnifiedEntity:
+        # The ID is derived from the keys of all founding members and kept
+        # across later merges so it stays stable between calls.
+        return UnifiedEntity(
+            entity_id=stable_entity_id(identity_key(member) for member in (members or [identity])),
+            canonical_name=identity.display_name, # or normalized
+            identities=[identity],
+            platforms_present={identity.platform},
+            confidence_scores={},
+            overall_confidence=1.0,
+            merge_history=[]
+        )
+
+    def _absorb(self, entity: UnifiedEntity, other: UnifiedEntity, confidence: float) -> None:
+        """Fold an existing entity into another one, once a match links them."""
+        entity.identities.extend(other.identities)
+        entity.platforms_present |= other.platforms_present
+        entity.merge_history.extend(other.merge_history)
+        entity.merge_history.append({
+            "action": "absorb",
+            "absorbed_entity_id": other.entity_id,
+            "confidence": confidence
+        })
+        entity.overall_confidence = min(entity.overall_confidence, other.overall_confidence, confidence)
+        self.absorbed[other.entity_id] = entity.entity_id
+        self.changed_entities[other.entity_id] = None
 
     def compare_pair(self, a: PlatformIdentity, b: PlatformIdentity) -> float:
         """Compare two identities, return confidence score 0.0-1.0."""
+        norm_a = self.normalized.get(a)
+        norm_b = self.normalized.get(b)
+
         # Calculate signals
-        name_sim = self.normalizer.similarity(a.display_name, b.display_name)
+        name_sim = indel_similarity(norm_a.name, norm_b.name)
 
         handle_sim = 0.0
         if a.handle and b.handle:
@@ -93,15 +456,15 @@ class IdentityResolver:
 
         company_match = 0.0
         if a.company and b.company:
-            comp_a = self.normalizer.normalize(a.company)
-            comp_b = self.normalizer.normalize(b.company)
+            comp_a = norm_a.company
+            comp_b = norm_b.company
             if comp_a and comp_b and comp_a == comp_b:
                 company_match = 1.0
 
         title_match = 0.0
         if a.title and b.title:
-             tit_a = self.normalizer.normalize(a.title)
-             tit_b = self.normalizer.normalize(b.title)
+             tit_a = norm_a.title
+             tit_b = norm_b.title
              if tit_a and tit_b and tit_a == tit_b:
                  title_match = 1.0
 
@@ -123,27 +486,26 @@ class IdentityResolver:
         if a.title and b.title:
             signals["title_match"] = title_match
 
-        # mutual_connections is not implemented yet, so excluding it allows
-        # the score to normalize over the other weights (e.g. 0.75 total weight).
+        # mutual_connections needs the edges, so it is only added when the review
+        # queue is re-scored (rescore_review_queue); excluding it here lets the score
+        # normalize over the other weights (e.g. 0.75 total weight).
         # This makes auto-merge possible for perfect profile matches.
 
         return self.scorer.score(signals)
 
     def block_by_name(self, identities: List[PlatformIdentity]) -> Dict[str, List[PlatformIdentity]]:
-        """Group identities into comparison blocks to reduce O(n²)."""
+        """
+        Group identities by the first 3 letters of the last name.
+        Resolution itself uses the multi-key BlockingIndex (self.blocking).
+        """
         blocks: Dict[str, List[PlatformIdentity]] = {}
         for identity in identities:
-            normalized_name = self.normalizer.normalize(identity.display_name)
-            if not normalized_name:
+            normalized = self.normalized.get(identity)
+            if not normalized.name:
                 key = "unknown"
             else:
-                parts = normalized_name.split()
                 # Block by first 3 chars of last name, or whole name if short
-                if len(parts) > 1:
-                    last_name = parts[-1]
-                    key = last_name[:3]
-                else:
-                    key = normalized_name[:3]
+                key = normalized.last_name[:3]
 
             if key not in blocks:
                 blocks[key] = []
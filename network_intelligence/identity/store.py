@@ -0,0 +1,198 @@
+"""
+Persistent identity resolution state in a local SQLite database.
+Holds every resolved identity (with its normalized name and blocking keys), entity
+membership and merge history, the review queue and the known connections. A resolver
+restored from the store skips identities it already knows, so a run only blocks and
+scores the identities that are new since the last save.
+"""
+import json
+import logging
+import os
+import sqlite3
+from typing import Dict, List, Optional
+from network_intelligence import config
+from network_intelligence.identity.entity import PlatformIdentity, UnifiedEntity, identity_key
+from network_intelligence.identity.resolver import IdentityResolver
+
+logger = logging.getLogger(__name__)
+
+# Bump when the schema or the meaning of a column changes
+STORE_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS identities (
+    idx INTEGER PRIMARY KEY, key TEXT NOT NULL, platform TEXT, handle TEXT, display_name TEXT,
+    profile_url TEXT, numeric_id TEXT, title TEXT, company TEXT, verified INTEGER, raw_data TEXT,
+    name TEXT, entity_id TEXT, position INTEGER
+);
+CREATE INDEX IF NOT EXISTS identities_entity ON identities (entity_id);
+CREATE TABLE IF NOT EXISTS blocking_keys (idx INTEGER, key TEXT);
+CREATE TABLE IF NOT EXISTS entities (
+    entity_id TEXT PRIMARY KEY, canonical_name TEXT, overall_confidence REAL,
+    confidence_scores TEXT, merge_history TEXT, metadata TEXT
+);
+CREATE TABLE IF NOT EXISTS review_queue (position INTEGER PRIMARY KEY, a INTEGER, b INTEGER, entry TEXT);
+CREATE TABLE IF NOT EXISTS connections (source INTEGER, target INTEGER, PRIMARY KEY (source, target));
+"""
+
+class ResolutionStore:
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or config.IDENTITY_STORE_PATH
+        if not self.path:
+            raise ValueError("No identity store path given (IDENTITY_STORE_PATH is empty)")
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.executescript(SCHEMA)
+        version = self.connection.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()
+        if version is None:
+            self.connection.execute("INSERT INTO meta VALUES ('version', ?)", (str(STORE_VERSION),))
+            self.connection.commit()
+        elif int(version[0]) != STORE_VERSION:
+            raise ValueError(f"Identity store {self.path} has version {version[0]}, expected {STORE_VERSION}")
+        # Identities and connections already on disk, and the resolver generation they belong to
+        self.saved_identities = self._count("identities")
+        self.saved_connections = 0
+        self.generation: Optional[int] = None
+
+    def _count(self, table: str) -> int:
+        return self.connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def load(self, resolver: IdentityResolver) -> int:
+        """Restore the stored state into an empty resolver; returns the number of identities."""
+        if resolver.identities:
+            raise ValueError("ResolutionStore.load() needs a resolver that has not resolved anything yet")
+        db = self.connection
+
+        identities: List[PlatformIdentity] = []
+        names: List[str] = []
+        members: Dict[str, List[tuple]] = {}
+        for row in db.execute("SELECT platform, handle, display_name, profile_url, numeric_id, title, company, "
+                              "verified, raw_data, name, entity_id, position FROM identities ORDER BY idx"):
+            identity = PlatformIdentity(platform=row[0], handle=row[1], display_name=row[2], profile_url=row[3],
+                                        numeric_id=row[4], title=row[5], company=row[6], verified=bool(row[7]),
+                                        raw_data=json.loads(row[8]))
+            members.setdefault(row[10], []).append((row[11], len(identities)))
+            identities.append(identity)
+            names.append(row[9])
+
+        entity_of: List[Optional[UnifiedEntity]] = [None] * len(identities)
+        resolver.clusters.add(len(identities))
+        for entity_id, canonical_name, overall, scores, history, metadata in db.execute(
+                "SELECT entity_id, canonical_name, overall_confidence, confidence_scores, merge_history, "
+                "metadata FROM entities"):
+            indices = [index for _, index in sorted(members.get(entity_id, []))]
+            if not indices:
+                continue
+            entity = UnifiedEntity(
+                entity_id=entity_id,
+                canonical_name=canonical_name,
+                identities=[identities[i] for i in indices],
+                platforms_present={identities[i].platform for i in indices},
+                confidence_scores=json.loads(scores),
+                overall_confidence=overall,
+                merge_history=json.loads(history),
+                metadata=json.loads(metadata)
+            )
+            for index in indices:
+                entity_of[index] = entity
+                resolver.clusters.union(indices[0], index)
+
+        keys: List[List[str]] = [[] for _ in identities]
+        for index, key in db.execute("SELECT idx, key FROM blocking_keys ORDER BY rowid"):
+            keys[index].append(key)
+        for index, identity in enumerate(identities):
+            resolver.blocking.post(keys[index], names[index])
+            resolver.index_of[identity_key(identity)] = index
+
+        resolver.identities = identities
+        resolver.entity_of = entity_of
+        for a, b, entry in db.execute("SELECT a, b, entry FROM review_queue ORDER BY position"):
+            resolver.review_pairs.append((a, b))
+            resolver.review_queue.append(json.loads(entry))
+        for source, target in db.execute("SELECT source, target FROM connections"):
+            resolver.edge_sources.append(source)
+            resolver.edge_targets.append(target)
+        resolver.changed_entities = {}
+        resolver.replaced = set()
+
+        self.saved_identities = len(identities)
+        self.saved_connections = len(resolver.edge_sources)
+        self.generation = resolver.generation
+        return len(identities)
+
+    def save(self, resolver: IdentityResolver) -> int:
+        """
+        Write what changed since the last load() / save(): new identities and their blocking keys
+        (and stubs replaced by a profile, rewritten under the same index), changed entities (with their membership), the review queue and new connections.
+        Returns the number of identities appended. After a resolve() (e.g. GraphBuilder.rebuild()),
+        which renumbers the resolver's identities, the store is rewritten in full.
+        """
+        db = self.connection
+        rewrite = self.generation is not None and resolver.generation != self.generation
+        if rewrite:
+            logger.info("Identity store: resolver was re-resolved since the last save, rewriting the store")
+            self.saved_identities = 0
+            self.saved_connections = 0
+            resolver.changed_entities = {entity.entity_id: entity for entity in resolver.entities()}
+            resolver.replaced = set()
+        first = self.saved_identities
+        new = resolver.identities[first:]
+        # New rows, and saved stub rows since replaced by their profile (rewritten in place)
+        rows = sorted(index for index in resolver.replaced if index < first)
+        rows += range(first, len(resolver.identities))
+        with db:
+            if rewrite:
+                # In the same transaction as the new rows: an interrupted save keeps the old store
+                for table in ("identities", "blocking_keys", "entities", "review_queue", "connections"):
+                    db.execute(f"DELETE FROM {table}")
+            db.executemany(
+                "INSERT OR REPLACE INTO identities (idx, key, platform, handle, display_name, profile_url, "
+                "numeric_id, title, company, verified, raw_data, name) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(index, identity_key(i), i.platform, i.handle, i.display_name, i.profile_url,
+                  i.numeric_id, i.title, i.company, int(bool(i.verified)), json.dumps(i.raw_data, default=str),
+                  resolver.normalized.get(i).name)
+                 for index, i in zip(rows, map(resolver.identities.__getitem__, rows))]
+            )
+            db.executemany("DELETE FROM blocking_keys WHERE idx = ?", [(index,) for index in rows if index < first])
+            db.executemany("INSERT INTO blocking_keys VALUES (?, ?)",
+                           [(index, key) for index in rows
+                            for key in resolver.blocking.keys(resolver.identities[index])])
+
+            changed = resolver.changed_entities
+            removed = [(entity_id,) for entity_id, entity in changed.items() if entity is None]
+            db.executemany("DELETE FROM entities WHERE entity_id = ?", removed)
+            live = {entity_id: entity for entity_id, entity in changed.items() if entity is not None}
+            db.executemany(
+                "INSERT OR REPLACE INTO entities VALUES (?, ?, ?, ?, ?, ?)",
+                [(entity.entity_id, entity.canonical_name, entity.overall_confidence,
+                  json.dumps(entity.confidence_scores), json.dumps(entity.merge_history, default=str),
+                  json.dumps(entity.metadata, default=str))
+                 for entity in live.values()]
+            )
+            # Membership rows of the changed entities, located through the key index (no full scan,
+            # so saving after every chunk of a stream stays proportional to the delta)
+            membership = [(entity.entity_id, pos, resolver.index_of[identity_key(identity)])
+                          for entity in live.values() for pos, identity in enumerate(entity.identities)]
+            db.executemany("UPDATE identities SET entity_id = ?, position = ? WHERE idx = ?", membership)
+
+            db.execute("DELETE FROM review_queue")
+            db.executemany("INSERT INTO review_queue VALUES (?, ?, ?, ?)",
+                           [(pos, a, b, json.dumps(entry, default=str))
+                            for pos, ((a, b), entry) in enumerate(zip(resolver.review_pairs, resolver.review_queue))])
+            db.executemany("INSERT OR IGNORE INTO connections VALUES (?, ?)",
+                           zip(resolver.edge_sources[self.saved_connections:],
+                               resolver.edge_targets[self.saved_connections:]))
+
+        resolver.changed_entities = {}
+        resolver.replaced = set()
+        self.saved_identities = len(resolver.identities)
+        self.saved_connections = len(resolver.edge_sources)
+        self.generation = resolver.generation
+        logger.info(f"Identity store: saved {len(new)} new identities, {len(live)} changed entities")
+        return len(new)
@@ -0,0 +1,148 @@
+"""
+Columnar identity storage for large loads.
+One list per PlatformIdentity field instead of one object per identity: platforms are uint8
+codes, repeated strings (titles, companies, platform names) are interned once per table,
+numeric IDs equal to the handle are not stored twice, verified flags are a bytearray and
+raw_data lives out of line (or only its essential keys, when dropped). Rows become
+PlatformIdentity objects on access, sharing the table's strings.
+"""
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+from network_intelligence.identity.entity import PlatformIdentity, essential_raw_data
+
+# Marks a numeric_id equal to the handle (SNAP, Twitter)
+_SAME_AS_HANDLE = object()
+
+class IdentityTable:
+    def __init__(self, keep_raw: bool = True):
+        self.keep_raw = keep_raw
+        self.platforms: List[str] = []
+        self.platform_codes = array("B")
+        self.handles: List[str] = []
+        self.display_names: List[str] = []
+        self.profile_urls: List[str] = []
+        self.numeric_ids: List[Any] = []
+        self.titles: List[Optional[str]] = []
+        self.companies: List[Optional[str]] = []
+        self.verified = bytearray()
+        # Out-of-line raw data: every row's dict, or (when dropping) only rows with essential keys
+        self.raw_data: Union[List[Dict[str, Any]], Dict[int, Dict[str, Any]]] = [] if keep_raw else {}
+        self._strings: Dict[str, str] = {}
+        self._platform_index: Dict[str, int] = {}
+
+    @classmethod
+    def from_identities(cls, identities: Iterable[PlatformIdentity], keep_raw: bool = True) -> "IdentityTable":
+        table = cls(keep_raw)
+        table.extend(identities)
+        return table
+
+    @classmethod
+    def from_columns(cls, platforms: Sequence[str], handles: Sequence[str], display_names: Sequence[str],
+                     profile_urls: Optional[Sequence[str]] = None, numeric_ids: Optional[Sequence[Any]] = None,
+                     titles: Optional[Sequence[Optional[str]]] = None,
+                     companies: Optional[Sequence[Optional[str]]] = None,
+                     verified: Optional[Sequence[bool]] = None,
+                     raw_data: Optional[Sequence[Dict[str, Any]]] = None, keep_raw: bool = True) -> "IdentityTable":
+        """Build a table from whole columns (e.g. a columnar CSV read) without a per-row append."""
+        table = cls(keep_raw)
+        n = len(handles)
+        for platform in platforms:
+            if platform not in table._platform_index:
+                table._platform_index[platform] = len(table.platforms)
+                table.platforms.append(platform)
+        if len(table.platforms) > 256:
+            raise ValueError("IdentityTable supports at most 256 platforms")
+        table.platform_codes = array("B", [table._platform_index[platform] for platform in platforms])
+        table.handles = list(handles)
+        table.display_names = list(display_names)
+        table.profile_urls = list(profile_urls) if profile_urls is not None else [""] * n
+        table.numeric_ids = ([_SAME_AS_HANDLE if value is not None and value == handle else value
+                              for value, handle in zip(numeric_ids, table.handles)]
+                             if numeric_ids is not None else [None] * n)
+        table.titles = [table._intern(value) for value in titles] if titles is not None else [None] * n
+        table.companies = [table._intern(value) for value in companies] if companies is not None else [None] * n
+        table.verified = bytearray(bool(value) for value in verified) if verified is not None else bytearray(n)
+        if raw_data is not None:
+            if keep_raw:
+                table.raw_data = list(raw_data)
+            else:
+                table.raw_data = {row: essential for row, essential in enumerate(map(essential_raw_data, raw_data))
+                                  if essential}
+        elif keep_raw:
+            table.raw_data = [{} for _ in range(n)]
+        return table
+
+    def _intern(self, value: Optional[str]) -> Optional[str]:
+        if value is None:
+            return None
+        return self._strings.setdefault(value, value)
+
+    def append(self, identity: PlatformIdentity) -> None:
+        self.add_row(identity.platform, identity.handle, identity.display_name, identity.profile_url,
+                     identity.numeric_id, identity.title, identity.company, identity.verified, identity.raw_data)
+
+    def add_row(self, platform: str, handle: str, display_name: str, profile_url: str = "",
+                numeric_id: Optional[str] = None, title: Optional[str] = None, company: Optional[str] = None,
+                verified: bool = False, raw_data: Optional[Dict[str, Any]] = None) -> None:
+        """Append one identity from its field values, without building a PlatformIdentity."""
+        code = self._platform_index.get(platform)
+        if code is None:
+            if len(self.platforms) == 256:
+                raise ValueError("IdentityTable supports at most 256 platforms")
+            code = self._platform_index[platform] = len(self.platforms)
+            self.platforms.append(platform)
+        row = len(self.handles)
+        self.platform_codes.append(code)
+        self.handles.append(handle)
+        self.display_names.append(display_name)
+        self.profile_urls.append(profile_url)
+        self.numeric_ids.append(_SAME_AS_HANDLE if numeric_id is not None and numeric_id == handle else numeric_id)
+        self.titles.append(self._intern(title))
+        self.companies.append(self._intern(company))
+        self.verified.append(1 if verified else 0)
+        if self.keep_raw:
+            self.raw_data.append(raw_data if raw_data is not None else {})
+        else:
+            essential = essential_raw_data(raw_data)
+            if essential:
+                self.raw_data[row] = essential
+
+    def extend(self, identities: Iterable[PlatformIdentity]) -> None:
+        for identity in identities:
+            self.append(identity)
+
+    def __len__(self) -> int:
+        return len(self.handles)
+
+    def _row(self, i: int) -> PlatformIdentity:
+        handle = self.handles[i]
+        numeric_id = self.numeric_ids[i]
+        return PlatformIdentity(
+            platform=self.platforms[self.platform_codes[i]],
+            handle=handle,
+            display_name=self.display_names[i],
+            profile_url=self.profile_urls[i],
+            numeric_id=handle if numeric_id is _SAME_AS_HANDLE else numeric_id,
+            title=self.titles[i],
+            company=self.companies[i],
+            verified=bool(self.verified[i]),
+            raw_data=self.raw_data[i] if self.keep_raw else self.raw_data.get(i, {})
+        )
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[PlatformIdentity, List[PlatformIdentity]]:
+        """Row i as a new PlatformIdentity (a list of them for a slice)."""
+        if isinstance(i, slice):
+            return [self._row(j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("IdentityTable index out of range")
+        return self._row(i)
+
+    def __iter__(self) -> Iterator[PlatformIdentity]:
+        for i in range(len(self)):
+            yield self._row(i)
+
+    def keys(self) -> List[str]:
+        """platform:handle per row (see identity_key)."""
+        return [f"{self.platforms[code]}:{handle}" for code, handle in zip(self.platform_codes, self.handles)]
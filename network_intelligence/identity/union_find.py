@@ -0,0 +1,60 @@
+import numpy as np
+from typing import Dict, List
+
+class DisjointSet:
+    """
+    Union-find over the integers 0..n-1, with path compression and union by size.
+    Member lists are kept per root (smaller list merged into larger), so a cluster's
+    members are available without scanning every element.
+    """
+
+    def __init__(self, n: int = 0):
+        self.parent: List[int] = list(range(n))
+        self.size: List[int] = [1] * n
+        # Only roots of clusters with more than one member appear here
+        self._members: Dict[int, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def add(self, count: int) -> None:
+        """Append `count` new singleton elements."""
+        start = len(self.parent)
+        self.parent.extend(range(start, start + count))
+        self.size.extend([1] * count)
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        # Path compression: point everything on the way directly at the root
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, a: int, b: int) -> int:
+        """Merge the clusters of a and b; returns the surviving root."""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return root_a
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        self._members.setdefault(root_a, [root_a]).extend(self._members.pop(root_b, [root_b]))
+        return root_a
+
+    def members(self, x: int) -> List[int]:
+        """All elements in x's cluster (unordered)."""
+        root = self.find(x)
+        return self._members.get(root, [root])
+
+    def roots(self) -> np.ndarray:
+        """Root of every element, as an array (vectorized pointer jumping; no compression)."""
+        parent = np.array(self.parent, dtype=np.int64)
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                return parent
+            parent = grand
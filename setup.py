@@ -8,6 +8,7 @@ setup(
         "networkx>=3.0",
         "requests>=2.28",
         "numpy>=1.24",
+        "scipy>=1.10",
         "matplotlib>=3.8",
         "python-louvain>=0.16",
     ],
@@ -1,7 +1,15 @@
 import pytest
 import networkx as nx
+from network_intelligence import config
 from network_intelligence.identity.entity import PlatformIdentity, UnifiedEntity
 
+@pytest.fixture(autouse=True)
+def edge_store_dir(tmp_path, monkeypatch):
+    """Keep binary edge stores written by loaders inside the test's temporary directory."""
+    directory = str(tmp_path / "edge_cache")
+    monkeypatch.setattr(config, "EDGE_STORE_DIR", directory)
+    return directory
+
 @pytest.fixture
 def sample_fb_identity():
     return PlatformIdentity(
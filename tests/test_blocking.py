@@ -0,0 +1,52 @@
+from network_intelligence.identity.blocking import BlockingIndex
+from network_intelligence.identity.entity import PlatformIdentity
+from network_intelligence.identity.normalizer import NameNormalizer, NormalizationCache
+from network_intelligence.identity.resolver import IdentityResolver
+
+def _person(handle, name, platform="linkedin", company=None, numeric_id=None):
+    return PlatformIdentity(platform=platform, handle=handle, display_name=name, profile_url="",
+                            numeric_id=numeric_id, title=None, company=company, verified=False, raw_data={})
+
+def _index(**kwargs):
+    return BlockingIndex(NormalizationCache(NameNormalizer()), **kwargs)
+
+def test_keys_cover_every_key_type():
+    keys = _index().keys(_person("john.doe", "John Doe", company="Acme Inc", numeric_id="42"))
+    assert "phonetic:d000" in keys
+    assert "handle:johndoe" in keys and "handle:john" in keys
+    assert "numeric_id:42" in keys
+    assert "company:acme:d" in keys
+    assert "company:inc:d" not in keys
+
+def test_pairs_from_any_shared_key():
+    index = _index()
+    pairs = index.add([
+        _person("john.doe", "John Doe", platform="facebook"),
+        _person("johndoe", "J. Dough-Smith"),   # squashed handle only
+        _person("zed", "Zed Ward"),             # nothing shared
+    ])
+    assert pairs.tolist() == [[0, 1]]
+    assert index.stats["candidate_pairs"] == 1
+    assert index.stats["exhaustive_pairs"] == 3
+
+def test_incremental_pairs_involve_new_identities():
+    index = _index()
+    index.add([_person("a1", "Ann Lee"), _person("b1", "Bob Lee")])
+    pairs = index.add([_person("c1", "Cat Lee")])
+    assert pairs.tolist() == [[0, 2], [1, 2]]
+
+def test_oversized_block_uses_sorted_neighborhood():
+    index = _index(max_block_size=10, window=2)
+    pairs = index.add([_person(f"h{i}", f"Person{i:02d} Smith") for i in range(50)])
+    assert index.stats["oversized_blocks"] == 1
+    assert len(pairs) <= 50 * 2
+    # Neighbors in name order are paired
+    assert [3, 4] in pairs.tolist()
+
+def test_resolver_merges_across_spelling_variants():
+    # "Smith" / "Smyth" fell into different 3-letter blocks; they share a Soundex key
+    a = _person("jon.smith", "Jon Smith", platform="facebook", company="Acme")
+    b = _person("jon.smith", "Jon Smyth", company="Acme")
+    a.title = b.title = "Engineer"
+    entities = IdentityResolver().resolve([a, b])
+    assert len(entities) == 1
@@ -0,0 +1,76 @@
+import os
+import time
+import networkx as nx
+from network_intelligence.analysis.cache import AnalysisCache, graph_fingerprint
+from network_intelligence.analysis.centrality import CentralityAnalyzer
+from network_intelligence.analysis.community import CommunityDetector
+from network_intelligence.graph.csr import CSRGraph
+
+def test_fingerprint_tracks_content(sample_graph):
+    G = nx.Graph(sample_graph)
+    assert graph_fingerprint(G) == graph_fingerprint(nx.Graph(sample_graph))
+    # The MultiGraph and its simplified form share a fingerprint
+    assert graph_fingerprint(sample_graph) == graph_fingerprint(CSRGraph.from_networkx(sample_graph))
+
+    changed = G.copy()
+    changed.add_edge("1", "3")
+    assert graph_fingerprint(changed) != graph_fingerprint(G)
+
+def test_scores_cached_on_disk(sample_graph, tmp_path):
+    G = nx.Graph(sample_graph)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return nx.degree_centrality(G)
+
+    first = AnalysisCache(str(tmp_path)).scores(G, "degree", compute)
+    # A fresh cache object (i.e. a new run) reads the stored array
+    second = AnalysisCache(str(tmp_path)).scores(nx.Graph(sample_graph), "degree", compute)
+    assert first == second
+    assert len(calls) == 1
+
+def test_analyzers_reuse_cached_results(sample_graph, tmp_path):
+    G = nx.Graph(sample_graph)
+    expected = CentralityAnalyzer().compute_all(G)
+
+    CentralityAnalyzer(AnalysisCache(str(tmp_path))).compute_all(G)
+    cache = AnalysisCache(str(tmp_path))
+    assert CentralityAnalyzer(cache).compute_all(G) == expected
+    assert cache.misses == 0
+
+def test_cache_hit_skips_spectral_setup(sample_graph, tmp_path, monkeypatch):
+    from network_intelligence.analysis import centrality
+    G = nx.Graph(sample_graph)
+    CentralityAnalyzer(AnalysisCache(str(tmp_path))).compute_all(G)
+
+    built = []
+    engine = centrality.SpectralEngine
+    monkeypatch.setattr(centrality, "SpectralEngine", lambda graph: built.append(1) or engine(graph))
+    CentralityAnalyzer(AnalysisCache(str(tmp_path))).compute_all(G)
+    assert built == []
+    # Without a cache the three measures still share one engine
+    CentralityAnalyzer().compute_all(G)
+    assert built == [1]
+
+    detector = CommunityDetector(AnalysisCache(str(tmp_path)))
+    communities = detector.detect_communities(G, method="greedy_modularity")
+    assert detector.detect_communities(G, method="greedy_modularity") == communities
+    assert detector.cache.hits == 1
+
+def test_lru_eviction(tmp_path):
+    cache = AnalysisCache(str(tmp_path), max_bytes=6_000)
+    graphs = [nx.path_graph(n) for n in (300, 301, 302)]
+    for G in graphs[:2]:
+        cache.scores(G, "degree", lambda: nx.degree_centrality(G))
+
+    # Touching the first entry makes the second the least recently used
+    old = time.time() - 60
+    for path in os.listdir(tmp_path):
+        os.utime(tmp_path / path, (old, old))
+    cache.scores(graphs[0], "degree", lambda: {})
+    cache.scores(graphs[2], "degree", lambda: nx.degree_centrality(graphs[2]))
+
+    remaining = os.listdir(tmp_path)
+    assert len(remaining) == 2
+    assert not any(name.startswith(graph_fingerprint(graphs[1])) for name in remaining)
@@ -49,3 +49,70 @@ def test_eigenvector(sample_graph):
 
     eig = analyzer.eigenvector_centrality(G)
     assert len(eig) == 3
+
+def test_betweenness_engine_matches_networkx():
+    from network_intelligence.analysis.betweenness import betweenness_scores
+    G = nx.relabel_nodes(nx.gnm_random_graph(60, 130, seed=1), str)
+
+    expected = nx.betweenness_centrality(G)
+    actual = betweenness_scores(G)
+    for node in G:
+        assert actual[node] == pytest.approx(expected[node], abs=1e-12)
+
+def test_betweenness_memoized_across_callers(sample_graph, monkeypatch):
+    from network_intelligence.analysis import betweenness
+    from network_intelligence.analysis.metrics import NetworkMetrics
+    G = nx.Graph(sample_graph)
+
+    calls = []
+    original = betweenness._dependency_sums
+    monkeypatch.setattr(betweenness, "_dependency_sums", lambda *a, **kw: calls.append(1) or original(*a, **kw))
+
+    analyzer = CentralityAnalyzer()
+    analyzer.betweenness_centrality(G)
+    analyzer.find_gatekeepers(G)
+    NetworkMetrics().analyze_resilience(G)
+    assert len(calls) == 1
+
+def test_betweenness_process_pool(monkeypatch):
+    from network_intelligence.analysis import betweenness
+    G = nx.relabel_nodes(nx.gnm_random_graph(50, 120, seed=2), str)
+    serial = betweenness.betweenness_scores(G, k=30, workers=1)
+
+    monkeypatch.setattr(betweenness, "PARALLEL_MIN_WORK", 0)
+    betweenness._memo.clear()
+    parallel = betweenness.betweenness_scores(G, k=30, workers=2)
+    for node in G:
+        assert parallel[node] == pytest.approx(serial[node], abs=1e-12)
+
+def test_closeness_exact_matches_networkx():
+    from network_intelligence.analysis.closeness import closeness_scores
+    G = nx.relabel_nodes(nx.gnm_random_graph(80, 150, seed=3), str)
+    G.add_edge("x", "y")
+
+    expected = nx.closeness_centrality(G)
+    actual = closeness_scores(G, exact=True)
+    for node in G:
+        assert actual[node] == pytest.approx(expected[node], abs=1e-12)
+
+def test_closeness_sampled_refines_top_candidates():
+    from network_intelligence.analysis.closeness import closeness_scores
+    G = nx.relabel_nodes(nx.barabasi_albert_graph(400, 2, seed=4), str)
+    G.add_node("isolated")
+
+    expected = nx.closeness_centrality(G)
+    actual = closeness_scores(G, exact=False, epsilon=0.5, refine=40)
+    top = sorted(expected, key=expected.get, reverse=True)[:10]
+    assert sorted(actual, key=actual.get, reverse=True)[:10] == top
+    for node in top:
+        assert actual[node] == pytest.approx(expected[node], abs=1e-12)
+    assert actual["isolated"] == 0.0
+
+def test_closeness_process_pool(monkeypatch):
+    from network_intelligence.analysis import closeness
+    G = nx.relabel_nodes(nx.gnm_random_graph(50, 120, seed=5), str)
+    serial = closeness.closeness_scores(G, exact=True, workers=1)
+
+    monkeypatch.setattr(closeness, "PARALLEL_MIN_WORK", 0)
+    parallel = closeness.closeness_scores(G, exact=True, workers=2)
+    assert parallel == pytest.approx(serial)
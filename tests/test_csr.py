@@ -0,0 +1,91 @@
+import pytest
+import networkx as nx
+import numpy as np
+from network_intelligence.graph.csr import CSRGraph, ensure_networkx
+from network_intelligence.graph.builder import GraphBuilder
+from network_intelligence.identity.resolver import IdentityResolver
+from network_intelligence.analysis.centrality import CentralityAnalyzer
+from network_intelligence.analysis.metrics import NetworkMetrics
+from network_intelligence.analysis.pathfinding import PathFinder
+
+def test_from_networkx_sums_parallel_edges(sample_graph):
+    sample_graph.add_edge("1", "2", key=1, platform="linkedin", weight=2.0)
+    C = CSRGraph.from_networkx(sample_graph)
+
+    assert C.number_of_nodes() == 3
+    assert C.number_of_edges() == 2
+    assert C.indices.dtype == np.int32
+    i, j = C.index["1"], C.index["2"]
+    assert C.to_scipy()[i, j] == pytest.approx(3.0)
+    assert C.to_scipy()[j, i] == pytest.approx(3.0)
+    assert C.node_data("2")["canonical_name"] == "Bob"
+
+def test_to_networkx_round_trip(sample_graph):
+    C = CSRGraph.from_networkx(sample_graph)
+    G = ensure_networkx(C)
+
+    assert isinstance(G, nx.Graph) and not isinstance(G, nx.MultiGraph)
+    assert sorted(G.edges()) == [("1", "2"), ("2", "3")]
+    assert G["2"]["3"]["weight"] == pytest.approx(1.5)
+    assert G.nodes["1"]["platforms"] == ["facebook"]
+
+def test_builder_csr_graph(sample_graph):
+    builder = GraphBuilder(IdentityResolver())
+    builder.graph = sample_graph
+
+    C = builder.get_csr_graph()
+    assert isinstance(C, CSRGraph)
+    assert C.degree()[C.index["2"]] == 2
+
+def test_analyzers_accept_csr(sample_graph):
+    C = CSRGraph.from_networkx(sample_graph)
+
+    deg = CentralityAnalyzer().degree_centrality(C)
+    assert deg[0]["entity_id"] == "2"
+    assert deg[0]["score"] == 1.0
+    assert deg[0]["node"] == "Bob"
+
+    metrics = NetworkMetrics().compute_all(C)
+    expected = NetworkMetrics().compute_all(nx.Graph(sample_graph))
+    assert metrics["density"] == pytest.approx(expected["density"])
+    assert metrics["diameter"] == expected["diameter"] == 2
+    assert metrics["avg_shortest_path"] == pytest.approx(expected["avg_shortest_path"])
+    assert metrics["assortativity"] == pytest.approx(expected["assortativity"])
+
+    res = PathFinder().find_shortest_weighted_path(C, "1", "3")
+    assert res["found"]
+    assert res["path"] == ["1", "2", "3"]
+
+def test_csr_metrics_match_networkx():
+    G = nx.relabel_nodes(nx.gnm_random_graph(40, 90, seed=7), str)
+    C = CSRGraph.from_networkx(G)
+
+    expected = NetworkMetrics().compute_all(G)
+    actual = NetworkMetrics().compute_all(C)
+    for key in ("transitivity", "average_clustering", "assortativity", "components"):
+        assert actual[key] == pytest.approx(expected[key])
+
+    closeness = {r["entity_id"]: r["score"] for r in CentralityAnalyzer().closeness_centrality(C)}
+    reference = nx.closeness_centrality(G)
+    for node, score in closeness.items():
+        assert score == pytest.approx(reference[node])
+
+def test_collapse_edges_canonicalizes_and_sums():
+    from network_intelligence.graph.csr import collapse_edges
+    src = np.array([0, 1, 2, 0, 2])
+    dst = np.array([1, 0, 1, 1, 2])
+    weights = np.array([1.0, 2.0, 0.5, 1.0, 3.0])
+
+    u, v, w = collapse_edges(src, dst, weights, 3)
+    assert list(zip(u.tolist(), v.tolist(), w.tolist())) == [(0, 1, 4.0), (1, 2, 0.5), (2, 2, 3.0)]
+
+def test_simplify_multigraph_matches_pairwise_sum(sample_graph):
+    from network_intelligence.graph.csr import simplify_multigraph
+    sample_graph.add_edge("2", "1", key=1, platform="linkedin", weight=2.0)
+    sample_graph.add_node("4", canonical_name="Dana", platforms=["twitter"])
+
+    simple = simplify_multigraph(sample_graph)
+    assert simple.number_of_nodes() == 4
+    assert simple.number_of_edges() == 2
+    assert simple["1"]["2"]["weight"] == pytest.approx(3.0)
+    assert simple.nodes["4"]["canonical_name"] == "Dana"
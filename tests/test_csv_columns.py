@@ -0,0 +1,67 @@
+import csv
+import numpy as np
+import pytest
+from network_intelligence.data_sources import csv_columns
+from network_intelligence.data_sources.csv_columns import factorize, index_nodes, read_columns
+from network_intelligence.data_sources.csv_loader import CSVLoader
+from network_intelligence.data_sources.linkedin import LinkedInLoader
+
+PLAIN = "source,target,platform,weight\n" + "".join(f"u{i % 7},u{i % 5},tw,{i / 4}\n" for i in range(40))
+# An unquoted comma in one row and a missing field in the next: the comma totals still match
+RAGGED = PLAIN + "u1,Doe, John,li,2\nu2,Jane,tw\n"
+TRICKY = PLAIN + 'u1,"Doe, Jane",li,2\r\n\nu2,"multi\nline",li,3\nu3,u4\n'
+
+def _dict_reader_columns(path):
+    with open(path, newline='') as f:
+        rows = list(csv.DictReader(f))
+    return {name: [row[name] for row in rows] for name in rows[0]}
+
+@pytest.mark.parametrize("text", [PLAIN, TRICKY, RAGGED])
+@pytest.mark.parametrize("block_chars", [8, 100, None])
+def test_columns_match_dict_reader(tmp_path, text, block_chars):
+    path = tmp_path / "edges.csv"
+    path.write_bytes(text.encode())
+    header, columns = read_columns(str(path), block_chars=block_chars)
+    assert header == ["source", "target", "platform", "weight"]
+    assert columns == _dict_reader_columns(str(path))
+
+    _, subset = read_columns(str(path), ["weight", "missing"], block_chars=block_chars)
+    assert list(subset) == ["weight"]
+
+def test_factorize_matches_dict_pass(monkeypatch):
+    values = ["b", "ä", "b", "a" * 9, "", "ä", "a" * 9]
+    uniques, labels = factorize(values)
+    assert uniques == ["b", "ä", "a" * 9, ""] and labels.tolist() == [0, 1, 0, 2, 3, 1, 2]
+    monkeypatch.setattr(csv_columns, "FACTORIZE_MAX_BYTES", 0)
+    assert factorize(values)[0] == uniques and factorize(values)[1].tolist() == labels.tolist()
+
+def test_index_nodes_per_platform():
+    handles, src, dst = index_nodes(["a", "b", "a"], ["b", "c", "b"], np.array([1, 1, 0], dtype=np.uint8))
+    assert handles == ["a", "b", "c", "a", "b"]
+    assert src.tolist() == [0, 1, 3] and dst.tolist() == [1, 2, 4] and src.dtype == np.int32
+
+def test_csv_loader_layouts(tmp_path):
+    path = tmp_path / "people.csv"
+    path.write_text('id,name,title,company,email\n1,"Lee, Ann",CTO,Acme,ann@acme.io\n,Bo Ray,CTO,Acme,\n')
+    identities, edges = CSVLoader().load(str(path))
+    assert [(i.platform, i.handle, i.display_name) for i in identities] == \
+           [("csv", "1", "Lee, Ann"), ("csv", "Bo Ray", "Bo Ray")]
+    assert identities[0].raw_data["email"] == "ann@acme.io" and edges == []
+
+    table, _ = CSVLoader().load_table(str(path))
+    assert [i.handle for i in table] == ["1", "Bo Ray"] and table[0].raw_data == {"email": "ann@acme.io"}
+    assert table.titles[0] is table.titles[1]
+
+def test_linkedin_export(tmp_path):
+    (tmp_path / "Connections.csv").write_text(
+        "First Name,Last Name,Email Address,Company,Position,Connected On\n"
+        "Ann,Lee,ann@acme.io,Acme,CTO,01 Jan 2024\n"
+        "Bo,Ray,,Globex,Engineer,02 Jan 2024\n", encoding="utf-8")
+    identities, edges = LinkedInLoader().load_export(str(tmp_path))
+    assert [(i.handle, i.display_name, i.company, i.title) for i in identities] == \
+           [("ann@acme.io", "Ann Lee", "Acme", "CTO"), ("bo.ray", "Bo Ray", "Globex", "Engineer")]
+    assert identities[1].raw_data["Connected On"] == "02 Jan 2024" and edges == []
+
+    table, _ = LinkedInLoader().load_export_table(str(tmp_path))
+    assert [i.handle for i in table] == ["ann@acme.io", "bo.ray"] and table[1].raw_data == {}
+    assert LinkedInLoader().load_export(str(tmp_path / "missing")) == ([], [])
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+from network_intelligence.data_sources.edge_list import EdgeListLoader, parse_edge_list
+from network_intelligence.data_sources.facebook import FacebookLoader
+from network_intelligence.graph.builder import GraphBuilder
+from network_intelligence.identity.resolver import IdentityResolver
+
+SNAP_TEXT = "# Undirected graph\n# Nodes: 5 Edges: 5\n0 1\n0 2\n1 2\n\n2 10\t11\n3 4 7\n10 3\r\n4 0"
+
+@pytest.fixture
+def snap_file(tmp_path):
+    path = tmp_path / "edges.txt"
+    path.write_text(SNAP_TEXT)
+    return str(path)
+
+def test_parse_matches_line_loader(snap_file):
+    nodes, edges = EdgeListLoader().load(snap_file)
+    # Tiny chunks force lines to straddle block boundaries
+    for chunk_bytes in (3, 7, 1 << 20):
+        src, dst = parse_edge_list(snap_file, chunk_bytes)
+        assert list(zip(src.tolist(), dst.tolist())) == [(int(e["source"]), int(e["target"])) for e in edges]
+
+    arrays = EdgeListLoader().load_arrays(snap_file, chunk_bytes=5)
+    assert arrays.identities() == nodes
+    assert arrays.edges() == edges
+    assert arrays.src.dtype == np.int32 and len(arrays) == len(edges)
+
+def test_parse_skips_mismatched_lines(tmp_path):
+    # Three fields then one: the value count matches two per line, but neither line is an edge
+    path = tmp_path / "ragged.txt"
+    path.write_text("1 2 3\n4\n5 6\n")
+    _, edges = EdgeListLoader().load(str(path))
+    assert [(e["source"], e["target"]) for e in edges] == [("5", "6")]
+    src, dst = parse_edge_list(str(path))
+    assert list(zip(src.tolist(), dst.tolist())) == [(5, 6)]
+
+def test_parse_rejects_non_integer_ids(tmp_path):
+    path = tmp_path / "named.txt"
+    path.write_text("alice bob\n")
+    with pytest.raises(ValueError):
+        parse_edge_list(str(path))
+
+def test_builder_edge_arrays_match_dict_path(snap_file):
+    nodes, edges = FacebookLoader().load_edge_list(snap_file)
+    slow = GraphBuilder(IdentityResolver())
+    slow.add_data_source(nodes, edges, "facebook")
+
+    fast = GraphBuilder(IdentityResolver())
+    fast.add_edge_arrays(FacebookLoader().load_edge_arrays(snap_file))
+
+    G, H = slow.build(), fast.build()
+    assert set(G.nodes) == set(H.nodes)
+    assert sorted(map(sorted, G.edges())) == sorted(map(sorted, H.edges()))
+    assert {n: G.nodes[n]["canonical_name"] for n in G} == {n: H.nodes[n]["canonical_name"] for n in H}
+    assert fast.handle_map == slow.handle_map
+
+    # Later edges that mention an array node attach to it, and rebuild() keeps the arrays
+    fast.add_data_source([], [{"source": "0", "target": "99", "platform": "facebook", "weight": 1.0}], "facebook")
+    assert fast.graph.has_edge(fast.handle_map["facebook:0"], fast.handle_map["facebook:99"])
+    fast.rebuild()
+    assert fast.graph.number_of_edges() == len(edges) + 1
+
+def test_edge_arrays_sparse_ids_keep_first_appearance():
+    from network_intelligence.data_sources.edge_list import EdgeArrays
+    src = np.array([10 ** 12, 5, 7], dtype=np.int64)
+    dst = np.array([5, 10 ** 12, 10 ** 12], dtype=np.int64)
+    arrays = EdgeArrays.from_pairs(src, dst, "facebook_snap")
+    assert arrays.node_ids.tolist() == [10 ** 12, 5, 7]
+    assert arrays.src.tolist() == [0, 1, 2] and arrays.dst.tolist() == [1, 0, 0]
+
+def test_edge_array_node_folds_into_merged_profile(snap_file):
+    from network_intelligence.identity.entity import PlatformIdentity
+
+    def profile(platform):
+        return PlatformIdentity(platform=platform, handle="1", display_name="Bob Jones", profile_url="",
+                                numeric_id="1", title=None, company="Acme", verified=False,
+                                raw_data={"email": "bob@acme.com"})
+
+    builder = GraphBuilder(IdentityResolver())
+    builder.add_edge_arrays(FacebookLoader().load_edge_arrays(snap_file))
+    G = builder.graph
+    array_node = builder.handle_map["facebook:1"]
+    degree = G.degree(array_node)
+    edges = G.number_of_edges()
+
+    # facebook:1 and twitter:1 merge into an entity whose ID is not the array node's
+    builder.add_data_source([profile("facebook"), profile("twitter")], [], "mixed")
+    bob = builder.handle_map["facebook:1"]
+    assert builder.handle_map["twitter:1"] == bob and bob != array_node and array_node not in G
+    assert G.degree(bob) == degree and G.number_of_edges() == edges
+    assert G.nodes[bob]["canonical_name"] == "Bob Jones"
+    assert all(d > 0 for _, d in G.degree())
+
+    builder.rebuild()
+    G = builder.graph
+    assert builder.handle_map["facebook:1"] == bob and G.degree(bob) == degree
+    assert all(d > 0 for _, d in G.degree())
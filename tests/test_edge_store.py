@@ -0,0 +1,110 @@
+import os
+import numpy as np
+import networkx as nx
+import pytest
+from network_intelligence.data_sources.csv_loader import CSVLoader
+from network_intelligence.data_sources.edge_list import EdgeListLoader
+from network_intelligence.graph.builder import GraphBuilder
+from network_intelligence.graph.edge_store import EdgeStore, cache_path, open_cached, source_fingerprint
+from network_intelligence.graph.exporter import GraphExporter
+from network_intelligence.identity.resolver import IdentityResolver
+
+@pytest.fixture
+def snap_file(tmp_path):
+    path = tmp_path / "edges.txt"
+    path.write_text("# comment\n0 1\n0 2\n1 2\n2 10\n10 3\n")
+    return str(path)
+
+def test_store_round_trip(tmp_path):
+    path = str(tmp_path / "graph.edges")
+    EdgeStore.write(path, ["a", "b", "café"], np.array([0, 1]), np.array([1, 2]),
+                    weights=np.array([0.5, 2.0]), categories={"platform": ["twitter", "facebook"]})
+    store = EdgeStore.open(path)
+    assert isinstance(store.src, np.memmap) and store.src.dtype == np.int32
+    assert store.node_ids() == ["a", "b", "café"]
+    assert store.src.tolist() == [0, 1] and store.dst.tolist() == [1, 2]
+    assert store.weights.dtype == np.float64 and store.weights.tolist() == [0.5, 2.0]
+    assert store.categories["platform"] == ["twitter", "facebook"]
+    assert store.codes("platform").tolist() == [0, 1]
+
+    # IDs containing newlines go through the offset table
+    EdgeStore.write(path, ["x\ny", ""], np.array([0]), np.array([1]))
+    store = EdgeStore.open(path)
+    assert store.node_ids() == ["x\ny", ""] and not store.weighted
+
+def test_store_invalidation(snap_file):
+    store_path = cache_path(snap_file)
+    EdgeStore.write(store_path, ["0"], np.zeros(0), np.zeros(0), source=source_fingerprint(snap_file))
+    assert open_cached(snap_file) is not None
+
+    # A touch keeps the store (same content hash)
+    stat = os.stat(snap_file)
+    os.utime(snap_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert open_cached(snap_file) is not None
+
+    # Same size, different content
+    with open(snap_file, "r+") as f:
+        f.seek(len("# comment\n"))
+        f.write("9")
+    assert open_cached(snap_file) is None
+
+    with open(snap_file, "a") as f:
+        f.write("3 4\n")
+    assert open_cached(snap_file) is None
+
+def test_loader_reuses_store(snap_file):
+    loader = EdgeListLoader()
+    first = loader.load_arrays(snap_file)
+    assert os.path.exists(cache_path(snap_file))
+    second = loader.load_arrays(snap_file)
+    assert isinstance(second.src, np.memmap)
+    assert second.identities() == first.identities()
+    assert second.edges() == first.edges()
+
+    # Changed source: parsed again, store rewritten
+    with open(snap_file, "a") as f:
+        f.write("3 4\n")
+    third = loader.load_arrays(snap_file)
+    assert not isinstance(third.src, np.memmap) and len(third) == len(first) + 1
+    assert len(loader.load_arrays(snap_file)) == len(third)
+
+def test_csv_edge_arrays(tmp_path):
+    path = tmp_path / "edges.csv"
+    path.write_text("source,target,platform,relationship,weight\n"
+                    "alice,bob,twitter,follows,2.5\n"
+                    "bob,carol,linkedin,connected,1\n"
+                    "alice,carol,twitter,follows,0.1\n")
+    _, edges = CSVLoader().load(str(path))
+
+    for _ in range(2):  # parsed, then memory-mapped: the same weights as load() both times
+        arrays = CSVLoader().load_edge_arrays(str(path))
+        assert arrays.edges() == edges
+        builder = GraphBuilder(IdentityResolver())
+        builder.add_edge_arrays(arrays)
+        # Nodes are per platform: bob and carol exist on twitter and on linkedin
+        assert sorted(builder.handle_map) == ["linkedin:bob", "linkedin:carol", "twitter:alice",
+                                              "twitter:bob", "twitter:carol"]
+        relationships = {(builder.graph.nodes[u]["canonical_name"], builder.graph.nodes[v]["canonical_name"],
+                          d["platform"]): (d["relationship"], d["weight"])
+                         for u, v, d in builder.graph.edges(data=True)}
+        assert relationships[("alice", "bob", "twitter")] == ("follows", 2.5)
+        assert relationships[("bob", "carol", "linkedin")] == ("connected", 1.0)
+        assert relationships[("alice", "carol", "twitter")] == ("follows", 0.1)
+
+    (tmp_path / "people.csv").write_text("id,name\n1,Alice\n")
+    with pytest.raises(ValueError):
+        CSVLoader().load_edge_arrays(str(tmp_path / "people.csv"))
+
+def test_exporter_writes_edge_store(tmp_path):
+    G = nx.Graph()
+    G.add_edge("a", "b", platform="twitter", relationship="follows", weight=3.0)
+    G.add_edge("b", 7, platform="facebook")
+    path = str(tmp_path / "graph.edges")
+    GraphExporter().export_edge_store(G, path)
+
+    store = EdgeStore.open(path)
+    nodes = store.node_ids()
+    platforms = store.categories["platform"]
+    exported = {(nodes[u], nodes[v]): (platforms[p], w) for u, v, p, w in
+                zip(store.src.tolist(), store.dst.tolist(), store.codes("platform").tolist(), store.weights.tolist())}
+    assert exported == {("a", "b"): ("twitter", 3.0), ("b", "7"): ("facebook", 1.0)}
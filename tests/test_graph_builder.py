@@ -100,3 +100,138 @@ def test_get_simplified_graph(sample_graph):
     assert not isinstance(simple_G, nx.MultiGraph)
     assert simple_G.number_of_nodes() == 3
     assert simple_G.number_of_edges() == 2
+
+def _person(platform, handle, name, company=None, title=None):
+    from network_intelligence.identity.entity import PlatformIdentity
+    return PlatformIdentity(
+        platform=platform, handle=handle, display_name=name, profile_url="",
+        numeric_id=None, title=title, company=company, verified=False, raw_data={}
+    )
+
+def test_incremental_keeps_entity_ids():
+    builder = GraphBuilder(IdentityResolver())
+
+    fb_nodes = [_person("facebook", "john.doe", "John Doe", "Acme", "Engineer"),
+                _person("facebook", "jane.roe", "Jane Roe")]
+    fb_edges = [{"source": "john.doe", "target": "jane.roe", "platform": "facebook", "weight": 1.0}]
+    builder.add_data_source(fb_nodes, fb_edges, "facebook")
+    first_ids = set(builder.build().nodes)
+
+    li_nodes = [_person("linkedin", "john.doe", "John Doe", "Acme", "Engineer"),
+                _person("linkedin", "bob.poe", "Bob Poe")]
+    li_edges = [{"source": "john.doe", "target": "bob.poe", "platform": "linkedin", "weight": 1.5}]
+    builder.add_data_source(li_nodes, li_edges, "linkedin")
+    G = builder.build()
+
+    # Existing nodes survive untouched, only Bob is new
+    assert first_ids <= set(G.nodes)
+    assert G.number_of_nodes() == 3
+    assert G.number_of_edges() == 2
+    john = builder.handle_map["facebook:john.doe"]
+    assert builder.handle_map["linkedin:john.doe"] == john
+    assert sorted(G.nodes[john]["platforms"]) == ["facebook", "linkedin"]
+
+def test_incremental_matches_full_rebuild():
+    sources = [
+        ([_person("facebook", "a", "Alice Smith", "Acme", "CTO"), _person("facebook", "b", "Bob Jones")],
+         [{"source": "a", "target": "b", "platform": "facebook", "weight": 1.0},
+          {"source": "a", "target": "ghost", "platform": "facebook", "weight": 1.0}],
+         "facebook"),
+        ([_person("linkedin", "a", "Alice Smith", "Acme", "CTO"), _person("linkedin", "c", "Carol White")],
+         [{"source": "a", "target": "c", "platform": "linkedin", "weight": 1.5}],
+         "linkedin"),
+    ]
+
+    def summary(builder):
+        G = builder.build()
+        names = sorted(G.nodes[n]["canonical_name"] for n in G.nodes)
+        edges = sorted(tuple(sorted((G.nodes[u]["canonical_name"], G.nodes[v]["canonical_name"])))
+                       for u, v in G.edges())
+        return names, edges
+
+    incremental = GraphBuilder(IdentityResolver())
+    full = GraphBuilder(IdentityResolver(), incremental=False)
+    for nodes, edges, platform in sources:
+        incremental.add_data_source(nodes, edges, platform)
+        full.add_data_source(nodes, edges, platform)
+
+    assert summary(incremental) == summary(full)
+    assert incremental.build().nodes[incremental.handle_map["facebook:ghost"]]["type"] == "stub"
+
+def test_add_data_sources_defers_until_build():
+    builder = GraphBuilder(IdentityResolver())
+    builder.add_data_sources([
+        ([_person("facebook", "john.doe", "John Doe", "Acme", "Engineer")], [], "facebook"),
+        ([_person("linkedin", "john.doe", "John Doe", "Acme", "Engineer"), _person("linkedin", "bob.poe", "Bob Poe")],
+         [{"source": "john.doe", "target": "bob.poe", "platform": "linkedin", "weight": 1.5}],
+         "linkedin"),
+    ])
+
+    # Nothing is resolved until build()
+    assert builder.graph.number_of_nodes() == 0
+
+    G = builder.build()
+    assert G.number_of_nodes() == 2
+    assert G.number_of_edges() == 1
+    assert set(builder.timings) == {"resolve", "node_insert", "edge_insert", "rescore"}
+    assert builder.pending_sources == []
+
+def test_entity_ids_are_deterministic():
+    def build():
+        builder = GraphBuilder(IdentityResolver())
+        builder.add_data_source(
+            [_person("facebook", "a", "Alice Smith"), _person("facebook", "b", "Bob Jones")],
+            [{"source": "a", "target": "b", "platform": "facebook", "weight": 1.0},
+             {"source": "b", "target": "ghost", "platform": "facebook", "weight": 1.0}],
+            "facebook"
+        )
+        return builder
+
+    first, second = build(), build()
+    assert set(first.build().nodes) == set(second.build().nodes)
+    assert first.handle_map == second.handle_map
+
+    # A profile arriving later for a stubbed handle lands on the stub's node
+    ghost_id = first.handle_map["facebook:ghost"]
+    first.add_data_source([_person("facebook", "ghost", "Gina Host")], [], "facebook")
+    assert first.handle_map["facebook:ghost"] == ghost_id
+    assert first.build().nodes[ghost_id]["canonical_name"] == "Gina Host"
+
+def test_incremental_bridge_folds_absorbed_node():
+    builder = GraphBuilder(IdentityResolver())
+    builder.add_data_source(
+        [_person("facebook", "johndoe", "John Doe", "Acme"), _person("linkedin", "johndoe", "John Doe", "Globex"),
+         _person("facebook", "jane.roe", "Jane Roe")],
+        [{"source": "johndoe", "target": "jane.roe", "platform": "facebook", "weight": 1.0}],
+        "mixed"
+    )
+    assert builder.build().number_of_nodes() == 3
+
+    # A profile matching both John Does merges them into one node, keeping the edge
+    builder.add_data_source([_person("twitter", "johndoe", "John Doe")], [], "twitter")
+    G = builder.build()
+    john = builder.handle_map["facebook:johndoe"]
+    assert builder.handle_map["linkedin:johndoe"] == builder.handle_map["twitter:johndoe"] == john
+    assert G.number_of_nodes() == 2
+    assert G.has_edge(john, builder.handle_map["facebook:jane.roe"])
+    assert sorted(G.nodes[john]["platforms"]) == ["facebook", "linkedin", "twitter"]
+
+def test_stub_then_profile_matches_rebuild():
+    # Bob is first seen as an edge endpoint (a stub), his profile arrives with a later source
+    builder = GraphBuilder(IdentityResolver())
+    builder.add_data_source([_person("facebook", "alice", "Alice Smith")],
+                            [{"source": "alice", "target": "bobjones", "platform": "facebook", "weight": 1.0}],
+                            "facebook")
+    stub_node = builder.handle_map["facebook:bobjones"]
+    assert builder.graph.nodes[stub_node]["type"] == "stub"
+    builder.add_data_source([_person("facebook", "bobjones", "Bob Jones", "Acme")], [], "facebook")
+
+    def nodes(G):
+        return sorted((n, G.nodes[n]["canonical_name"], G.nodes[n]["type"]) for n in G.nodes)
+
+    incremental = nodes(builder.graph)
+    assert builder.handle_map["facebook:bobjones"] == stub_node
+    assert (stub_node, "Bob Jones", "person") in incremental
+    assert len(builder.resolver.entities()) == 2
+    builder.rebuild()
+    assert nodes(builder.graph) == incremental
@@ -83,3 +83,255 @@ def test_block_by_name():
     # "Doe" -> "doe" (normalized)
     assert "doe" in blocks
     assert len(blocks["doe"]) == 2
+
+def test_resolve_incremental_reports_created_and_updated():
+    resolver = IdentityResolver()
+    id1 = PlatformIdentity(
+        platform="facebook", handle="john.doe", display_name="John Doe",
+        profile_url="", numeric_id=None, title="Engineer", company="Acme", verified=False, raw_data={}
+    )
+    id2 = PlatformIdentity(
+        platform="linkedin", handle="john.doe", display_name="John Doe",
+        profile_url="", numeric_id=None, title="Engineer", company="Acme", verified=False, raw_data={}
+    )
+
+    created, updated = resolver.resolve_incremental([id1])
+    assert len(created) == 1 and updated == []
+
+    created2, updated2 = resolver.resolve_incremental([id2])
+    assert created2 == []
+    assert updated2 == [created[0]]
+    assert updated2[0].platforms_present == {"facebook", "linkedin"}
+
+def test_score_matrix_matches_compare_pair(sample_identities):
+    import numpy as np
+    resolver = IdentityResolver()
+    identities = sample_identities + [
+        PlatformIdentity(platform="linkedin", handle="jdoe", display_name="Dr. John Doe Jr", profile_url="",
+                         numeric_id=None, title="engineer", company="TECH CORP", verified=False, raw_data={})
+    ]
+    features = resolver.features(identities)
+    index = np.arange(len(identities))
+    scores = resolver.score_matrix(features, index, index)
+    for i, a in enumerate(identities):
+        for j, b in enumerate(identities):
+            assert scores[i, j] == resolver.compare_pair(a, b)
+
+def test_similarity_kernel_matches_scalar():
+    from network_intelligence.identity.similarity import similarity_matrix, indel_similarity
+    names = ["john doe", "jon doe", "", "jane smith", "x" * 70 + " doe", "x" * 65]
+    matrix = similarity_matrix(names, names)
+    for i, a in enumerate(names):
+        for j, b in enumerate(names):
+            assert matrix[i, j] == indel_similarity(a, b)
+    assert indel_similarity("john doe", "jon doe") == pytest.approx(2 * 7 / 15)
+
+def test_normalization_cache_reuses_entries(sample_li_identity):
+    from network_intelligence.identity.normalizer import soundex
+    resolver = IdentityResolver()
+    other = PlatformIdentity(platform="facebook", handle="jd", display_name="Dr. John DOE", profile_url="",
+                             numeric_id=None, title=None, company="tech corp.", verified=False, raw_data={})
+    resolver.resolve([sample_li_identity, other])
+    resolver.resolve([sample_li_identity, other])
+
+    assert len(resolver.normalized) == 2
+    first = resolver.normalized.get(sample_li_identity)
+    second = resolver.normalized.get(other)
+    assert first is resolver.normalized.get(sample_li_identity)
+    assert first.tokens == ("john", "doe") and first.phonetic == soundex("doe") == "d000"
+    # Equal normalized companies share one interned string
+    assert first.company is second.company
+
+def test_soundex():
+    from network_intelligence.identity.normalizer import soundex
+    assert soundex("robert") == soundex("rupert") == "r163"
+    assert soundex("ashcraft") == "a261"
+    assert soundex("tymczak") == "t522"
+    assert soundex("") == ""
+
+def test_parallel_scoring_matches_serial(monkeypatch):
+    from network_intelligence.identity import resolver as resolver_module
+    identities = [
+        PlatformIdentity(platform=platform, handle=f"{first}.{last}".lower(), display_name=f"{first} {last}",
+                         profile_url="", numeric_id=None, title="Engineer", company="Acme",
+                         verified=False, raw_data={})
+        for platform in ("facebook", "linkedin")
+        for first in ("John", "Jon", "Jane", "Joan")
+        for last in ("Doe", "Dough", "Smith", "Smyth")
+    ]
+
+    serial = IdentityResolver(workers=1)
+    expected = serial.resolve(identities)
+
+    monkeypatch.setattr(resolver_module, "PARALLEL_MIN_PAIRS", 0)
+    parallel = IdentityResolver(workers=2)
+    actual = parallel.resolve(identities)
+
+    assert [e.entity_id for e in actual] == [e.entity_id for e in expected]
+    assert parallel.review_queue == serial.review_queue
+
+def _profile(platform, handle, name, company="Acme", title="Engineer"):
+    return PlatformIdentity(platform=platform, handle=handle, display_name=name, profile_url="",
+                            numeric_id=None, title=title, company=company, verified=False, raw_data={})
+
+def test_resolve_is_order_independent():
+    import random
+    identities = [
+        _profile("facebook", "john.doe", "John Doe"),
+        _profile("linkedin", "john.doe", "John Doe"),
+        _profile("twitter", "johndoe", "John Doe"),
+        _profile("facebook", "jane.smith", "Jane Smith"),
+        _profile("linkedin", "jane.smith", "Jane Smith"),
+        _profile("twitter", "jsmyth", "Jane Smyth", company=None),
+    ]
+    expected = IdentityResolver().resolve(identities)
+
+    def clusters(entities):
+        return {e.entity_id: sorted(f"{i.platform}:{i.handle}" for i in e.identities) for e in entities}
+
+    for seed in range(5):
+        shuffled = identities[:]
+        random.Random(seed).shuffle(shuffled)
+        assert clusters(IdentityResolver().resolve(shuffled)) == clusters(expected)
+
+def test_incremental_bridge_merges_existing_entities():
+    resolver = IdentityResolver()
+    # Conflicting companies keep these two apart...
+    acme = _profile("facebook", "johndoe", "John Doe", company="Acme", title=None)
+    globex = _profile("linkedin", "johndoe", "John Doe", company="Globex", title=None)
+    created, _ = resolver.resolve_incremental([acme, globex])
+    assert len(created) == 2
+
+    # ...until a profile matching both links them: the smaller ID survives
+    bridge = _profile("twitter", "johndoe", "John Doe", company=None, title=None)
+    created2, updated2 = resolver.resolve_incremental([bridge])
+    survivor, absorbed = sorted(e.entity_id for e in created)
+    assert created2 == []
+    assert [e.entity_id for e in updated2] == [survivor]
+    assert resolver.absorbed == {absorbed: survivor}
+    assert updated2[0].platforms_present == {"facebook", "linkedin", "twitter"}
+
+def test_disjoint_set():
+    from network_intelligence.identity.union_find import DisjointSet
+    ds = DisjointSet(3)
+    ds.add(2)
+    ds.union(0, 1)
+    ds.union(3, 4)
+    assert ds.find(2) == 2 and ds.members(2) == [2]
+    ds.union(1, 4)
+    assert sorted(ds.members(0)) == [0, 1, 3, 4]
+    assert len({ds.find(i) for i in (0, 1, 3, 4)}) == 1
+
+def test_mutual_connections_rescore_review_queue():
+    def edge(platform, source, target):
+        return {"source": source, "target": target, "platform": platform, "weight": 1.0}
+
+    identities = [
+        # Same person, but the titles disagree: review band on profile signals alone
+        _profile("facebook", "johndoe", "John Doe", title="Engineer"),
+        _profile("linkedin", "johndoe", "John Doe", title="Manager"),
+        _profile("facebook", "jane.roe", "Jane Roe", company=None, title=None),
+        _profile("linkedin", "jane.roe", "Jane Roe", company=None, title=None),
+        _profile("linkedin", "bob.poe", "Bob Poe", company=None, title=None),
+        _profile("facebook", "bob.poe", "Bob Poe", company=None, title=None),
+    ]
+    resolver = IdentityResolver()
+    resolver.resolve(identities)
+    assert len(resolver.review_queue) == 1
+    assert resolver.review_queue[0]["score"] == pytest.approx(0.65 / 0.75)
+
+    # No connections yet: the signal does not apply and nothing changes
+    assert resolver.rescore_review_queue() == []
+    assert resolver.review_queue[0]["score"] == pytest.approx(0.65 / 0.75)
+
+    # Disjoint neighbors (Jane vs Bob) pull the score down
+    resolver.add_connections([edge("facebook", "johndoe", "jane.roe"), edge("linkedin", "johndoe", "bob.poe")])
+    assert resolver.rescore_review_queue() == []
+    assert resolver.review_queue[0]["score"] == pytest.approx(0.65)
+    assert resolver.review_queue[0]["mutual_connections"] == 0.0
+
+    # Both know Jane and Bob (one entity each across platforms): Jaccard 1.0 merges them
+    resolver.add_connections([edge("linkedin", "johndoe", "jane.roe"), edge("facebook", "johndoe", "bob.poe"),
+                              edge("facebook", "johndoe", "unknown.handle")])
+    grown = resolver.rescore_review_queue()
+    assert len(grown) == 1
+    assert sorted(i.platform for i in grown[0].identities) == ["facebook", "linkedin"]
+    assert grown[0].overall_confidence == pytest.approx(0.9)
+    assert len(resolver.absorbed) == 1 and resolver.review_queue == [] and resolver.review_pairs == []
+
+def test_profile_replaces_resolved_stub_like_full_resolution():
+    def person(handle, name, stub=False, platform="facebook"):
+        return PlatformIdentity(platform=platform, handle=handle, display_name=name, profile_url="",
+                                numeric_id=None, title=None, company=None, verified=False,
+                                raw_data={"stub": True} if stub else {})
+
+    def state(entities):
+        return sorted((e.entity_id, e.canonical_name, tuple(f"{i.platform}:{i.handle}" for i in e.identities))
+                      for e in entities)
+
+    stub, profile = person("bobjones", "bobjones", stub=True), person("bobjones", "Bob Jones")
+    incremental = IdentityResolver()
+    created, _ = incremental.resolve_incremental([stub])
+    created2, updated = incremental.resolve_incremental([profile])
+    # Replaced in place: same entity and ID, renamed after the profile, no second entity for the key
+    assert created2 == [] and updated == created
+    assert state(incremental.entities()) == state(IdentityResolver().resolve([stub, profile]))
+    assert state(incremental.entities()) == [(created[0].entity_id, "Bob Jones", ("facebook:bobjones",))]
+    assert incremental.identities == [profile]
+
+    # A profile on another platform that merges into a stub entity also takes over its name
+    other = person("bob.jones", "Bob Jones", platform="linkedin")
+    incremental = IdentityResolver()
+    incremental.resolve_incremental([person("bob.jones", "bob.jones", stub=True)])
+    incremental.resolve_incremental([other])
+    [entity] = incremental.entities()
+    assert entity.canonical_name == "Bob Jones" and entity.identities[0] is other
+
+def test_review_queue_is_order_independent():
+    import random
+    identities = [
+        # Titles disagree: John's facebook profile is a near miss for both of the others
+        _profile("facebook", "johndoe", "John Doe", title="Engineer"),
+        _profile("linkedin", "johndoe", "John Doe", title="Manager"),
+        _profile("twitter", "johndoe", "John Doe", title="Manager"),
+        _profile("facebook", "jane.roe", "Jane Roe", title="Engineer"),
+        _profile("linkedin", "jane.roe", "Jane Roe", title="Designer"),
+        _profile("twitter", "bob.poe", "Bob Poe", company=None, title=None),
+    ]
+    expected = IdentityResolver()
+    expected.resolve(identities)
+    # One entry per pair of entities kept apart
+    assert len(expected.review_queue) == 2
+
+    for seed in range(10):
+        shuffled = identities[:]
+        random.Random(seed).shuffle(shuffled)
+        resolver = IdentityResolver()
+        resolver.resolve(shuffled)
+        assert resolver.review_queue == expected.review_queue
+
+def test_duplicate_keys_keep_the_most_complete_profile():
+    import random
+    identities = [
+        _profile("facebook", "johndoe", "John Doe", company=None, title=None),
+        _profile("facebook", "johndoe", "John Doe", company="Globex"),
+        _profile("facebook", "johndoe", "John Doe", company="Acme"),
+        _profile("linkedin", "johndoe", "John Doe", company="Globex"),
+        _profile("twitter", "johndoe", "John Doe", company="Acme"),
+    ]
+
+    def clusters(entities):
+        return sorted(sorted(f"{i.platform}:{i.handle}" for i in e.identities) for e in entities)
+
+    expected = IdentityResolver()
+    expected_clusters = clusters(expected.resolve(identities))
+    kept = expected.identities[expected.index_of["facebook:johndoe"]]
+    # Two profiles are equally complete: the field values break the tie (Acme before Globex)
+    assert kept is identities[2]
+
+    for seed in range(10):
+        shuffled = identities[:]
+        random.Random(seed).shuffle(shuffled)
+        resolver = IdentityResolver()
+        assert clusters(resolver.resolve(shuffled)) == expected_clusters
+        assert resolver.identities[resolver.index_of["facebook:johndoe"]] is identities[2]
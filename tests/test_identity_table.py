@@ -0,0 +1,50 @@
+import pickle
+from network_intelligence.data_sources.csv_loader import CSVLoader
+from network_intelligence.data_sources.edge_list import EdgeListLoader
+from network_intelligence.identity.entity import PlatformIdentity, UnifiedEntity
+from network_intelligence.identity.resolver import IdentityResolver
+from network_intelligence.identity.table import IdentityTable
+
+def test_identities_are_slotted(sample_fb_identity):
+    assert not hasattr(sample_fb_identity, "__dict__")
+    entity = UnifiedEntity(entity_id="e", canonical_name="John Doe", identities=[sample_fb_identity],
+                           platforms_present={"facebook"})
+    assert not hasattr(entity, "__dict__") and entity.merge_history == []
+    assert pickle.loads(pickle.dumps(entity)) == entity
+
+def test_table_round_trip(sample_fb_identity, sample_li_identity, sample_tw_identity):
+    stub = PlatformIdentity(platform="twitter", handle="x", display_name="x", profile_url="", numeric_id="x",
+                            title=None, company=None, verified=False, raw_data={"stub": True, "extra": 1})
+    identities = [sample_fb_identity, sample_li_identity, sample_tw_identity, stub]
+    table = IdentityTable.from_identities(identities)
+    assert list(table) == identities and table[-1] == stub and table[1:3] == identities[1:3]
+    assert table.keys() == ["facebook:john.doe", "linkedin:johndoe", "twitter:johnd", "twitter:x"]
+
+    # Dropping raw data keeps what the engine reads
+    compact = IdentityTable.from_identities(identities, keep_raw=False)
+    assert compact[3].raw_data == {"stub": True} and compact[0].raw_data == {}
+    assert compact[3].numeric_id == "x"
+
+def test_csv_table_interns_and_resolves(tmp_path):
+    path = tmp_path / "people.csv"
+    path.write_text("id,name,title,company,platform\n"
+                    "jdoe,John Doe,Engineer,Acme,linkedin\n"
+                    "john.doe,John Doe,Engineer,Acme,twitter\n")
+    identities, _ = CSVLoader().load(str(path))
+    table, _ = CSVLoader().load_table(str(path))
+    assert [(i.platform, i.handle, i.display_name, i.company) for i in table] == \
+           [(i.platform, i.handle, i.display_name, i.company) for i in identities]
+    assert table.companies[0] is table.companies[1]
+
+    resolver = IdentityResolver()
+    created, _ = resolver.resolve_incremental(table)
+    assert sum(len(entity.identities) for entity in created) == 2
+    # Known rows are skipped without being resolved again
+    assert resolver.resolve_incremental(table) == ([], [])
+
+def test_edge_arrays_identity_table(tmp_path):
+    path = tmp_path / "edges.txt"
+    path.write_text("0 1\n1 2\n")
+    arrays = EdgeListLoader().load_arrays(str(path))
+    assert list(arrays.identity_table(keep_raw=True)) == arrays.identities()
+    assert arrays.identity_table()[0].raw_data == {}
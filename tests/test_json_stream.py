@@ -0,0 +1,61 @@
+import json
+import pytest
+from network_intelligence.data_sources.facebook import FacebookLoader
+from network_intelligence.data_sources.json_stream import batch_records, iter_json_records
+from network_intelligence.data_sources.linkedin import LinkedInLoader
+from network_intelligence.data_sources.twitter import TwitterLoader
+
+PROFILES = [
+    {"id": "1", "name": "Ann Lee", "friends": [{"id": "2"}, {"name": "Bo \"B\" Ray"}]},
+    {"id": "2", "name": "Bo Ray", "work": [{"company": "Acme", "position": "CTO"}], "score": 12345.5},
+    {"id": "3", "name": "Émile [x] {y}", "friends": []},
+]
+
+@pytest.mark.parametrize("block_chars", [1, 2, 7, 1 << 20])
+def test_records_match_json_load(tmp_path, block_chars):
+    array = tmp_path / "profiles.json"
+    array.write_text(json.dumps(PROFILES, indent=2), encoding="utf-8")
+    ndjson = tmp_path / "profiles.ndjson"
+    ndjson.write_text("\n".join(json.dumps(p) for p in PROFILES) + "\n", encoding="utf-8")
+    single = tmp_path / "profile.json"
+    single.write_text(json.dumps(PROFILES[0]), encoding="utf-8")
+    numbers = tmp_path / "numbers.json"
+    numbers.write_text("[12345, 6.25e3 ,-7]")
+
+    assert list(iter_json_records(str(array), block_chars)) == PROFILES
+    assert list(iter_json_records(str(ndjson), block_chars)) == PROFILES
+    assert list(iter_json_records(str(single), block_chars)) == [PROFILES[0]]
+    assert list(iter_json_records(str(numbers), block_chars)) == [12345, 6250.0, -7]
+
+def test_malformed_input_raises(tmp_path):
+    truncated = tmp_path / "truncated.json"
+    truncated.write_text(json.dumps(PROFILES)[:-5])
+    with pytest.raises(ValueError):
+        list(iter_json_records(str(truncated), 4))
+
+def test_twitter_archive_js_wrapper(tmp_path):
+    data = tmp_path / "data"
+    data.mkdir()
+    items = [{"following": {"accountId": "11", "userLink": "https://twitter.com/ann"}},
+             {"following": {"accountId": "12"}}]
+    (data / "following.js").write_text("window.YTD.following.part0 = " + json.dumps(items))
+    identities, edges = TwitterLoader().load_archive(str(tmp_path))
+    assert [i.handle for i in identities] == ["ann", "id_12"] and edges == []
+
+def test_scraped_loaders_stream_profiles(tmp_path):
+    path = tmp_path / "profiles.json"
+    path.write_text(json.dumps(PROFILES))
+    identities, edges = FacebookLoader().load_scraped_profiles(str(path))
+    assert [i.handle for i in identities] == ["1", "2", "3"]
+    assert identities[1].company == "Acme" and len(edges) == 2
+
+    chunks = list(batch_records(FacebookLoader().iter_scraped_profiles(str(path)), chunk_size=2))
+    assert [len(nodes) for nodes, _ in chunks] == [2, 1]
+    assert [e for _, chunk_edges in chunks for e in chunk_edges] == edges
+
+    linkedin = tmp_path / "linkedin.ndjson"
+    linkedin.write_text('{"urn_id": "a", "name": "Ann Lee", "connections": [{"urn_id": "b"}]}\n'
+                        '{"urn_id": "b", "name": "Bo Ray"}\n')
+    identities, edges = LinkedInLoader().load_scraped(str(linkedin))
+    assert [i.handle for i in identities] == ["a", "b"] and edges[0]["target"] == "b"
+    assert TwitterLoader().load_scraped(str(tmp_path / "missing.json")) == ([], [])
@@ -0,0 +1,54 @@
+import threading
+import time
+import pytest
+from network_intelligence.data_sources.parallel import run_loaders
+
+def test_loaders_overlap_and_keep_job_order():
+    started = threading.Barrier(3, timeout=5)
+
+    def loader(name, delay):
+        def load():
+            # Every loader waits for the others to start: only passes when they run concurrently
+            started.wait()
+            time.sleep(delay)
+            return [name], []
+        return load
+
+    jobs = [("slow", loader("slow", 0.2)), ("fast", loader("fast", 0.0)), ("mid", loader("mid", 0.1))]
+    results = run_loaders(jobs, workers=3)
+    assert [name for name, _, _ in results] == ["slow", "fast", "mid"]
+    assert [nodes for _, (nodes, _), _ in results] == [["slow"], ["fast"], ["mid"]]
+    assert results[0][2] >= 0.2 > results[1][2]
+
+def test_failing_loader_raises():
+    def broken():
+        raise OSError("unreadable export")
+
+    with pytest.raises(OSError):
+        run_loaders([("ok", lambda: ([], [])), ("broken", broken)])
+    assert run_loaders([]) == []
+
+def test_stream_job_runs_on_calling_thread(tmp_path):
+    # The CLI's job list for --from-edge-list --stream --identity-store next to a pooled loader
+    from network_intelligence.graph.builder import GraphBuilder
+    from network_intelligence.graph.streaming import stream_edge_list
+    from network_intelligence.identity.resolver import IdentityResolver
+    from network_intelligence.identity.store import ResolutionStore
+
+    edge_file = tmp_path / "edges.txt"
+    edge_file.write_text("".join(f"{i} {i + 1}\n" for i in range(50)))
+    store = ResolutionStore(str(tmp_path / "identities.db"))
+    builder = GraphBuilder(IdentityResolver())
+    threads = {}
+
+    def stream():
+        threads["stream"] = threading.current_thread()
+        return stream_edge_list(builder, str(edge_file), str(tmp_path / "checkpoint.json"), store, chunk_size=10)
+
+    jobs = [("stream", stream), ("other", lambda: ([], []))]
+    results = run_loaders(jobs, inline=("stream",))
+    assert [name for name, _, _ in results] == ["stream", "other"]
+    assert threads["stream"] is threading.main_thread()
+    assert results[0][1]["edges"] == 50
+    assert builder.graph.number_of_nodes() == 51
+    store.close()
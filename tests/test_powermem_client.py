@@ -1,6 +1,9 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import pytest
 import responses
-from network_intelligence.data_sources.powermem import PowerMemClient
+from network_intelligence.data_sources.powermem import PowerMemClient, make_session
 
 @responses.activate
 def test_health_check():
@@ -77,3 +80,124 @@ def test_write_analysis():
 
     success = client.write_analysis("Test", ["test"], {})
     assert success is True
+
+class _StandIn(BaseHTTPRequestHandler):
+    """Local PowerMem stand-in: paginated search, single and bulk memory writes."""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def _reply(self, status, body=None):
+        data = json.dumps(body or {}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self._reply(200 if self.path == "/health" else 404)
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            if server.failures:
+                server.failures -= 1
+                return self._reply(server.failure_status)
+        if self.path == "/api/search":
+            offset, limit = body.get("offset", 0), body["limit"]
+            page = server.people[offset:offset + limit]
+            self._reply(200, {"results": page, **({"total": len(server.people)} if server.report_total else {})})
+        elif self.path == "/api/memory/batch" and server.batches != 0:
+            with server.lock:
+                server.batches -= 1
+                server.stored.extend(body["memories"])
+            self._reply(200)
+        elif self.path == "/api/memory":
+            with server.lock:
+                server.stored.append(body)
+            self._reply(200)
+        else:
+            self._reply(404)
+
+@pytest.fixture
+def standin():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandIn)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = 0
+    server.requests = []
+    server.stored = []
+    server.failures = 0
+    server.failure_status = 503
+    # Bulk requests accepted before the endpoint answers 404 (negative: no limit)
+    server.batches = -1
+    server.report_total = True
+    server.people = [{"id": str(i), "content": f"P{i}",
+                      "metadata": {"name": f"Person {i}", "relationships": [{"target": f"Person {i + 1}"}]}}
+                     for i in range(20000)]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def _client(server, **kwargs):
+    return PowerMemClient(base_url=f"http://127.0.0.1:{server.server_address[1]}", **kwargs)
+
+@pytest.mark.parametrize("report_total", [True, False])
+def test_load_company_graph_reads_every_page(standin, report_total):
+    standin.report_total = report_total
+    with _client(standin) as client:
+        nodes, edges = client.load_company_graph("Acme")
+
+    assert len(nodes) == 20000 and len(edges) == 20000
+    assert [n.numeric_id for n in nodes] == [str(i) for i in range(20000)]
+    # Pages share a handful of keep-alive connections
+    assert standin.requests.count("/api/search") >= 40
+    assert standin.connections <= 8
+
+def test_query_retries_unavailable_service(standin):
+    standin.failures = 2
+    client = _client(standin, session=make_session(backoff=0))
+    assert len(client.query("Acme", limit=10)) == 10
+
+    standin.failures = 5
+    client = _client(standin, session=make_session(retries=1, backoff=0))
+    assert client.query("Acme") == []
+
+def test_write_memories_batches(standin):
+    memories = [{"content": f"m{i}", "tags": ["t"], "metadata": {}} for i in range(1050)]
+    client = _client(standin)
+    assert client.write_memories(memories, batch_size=200) == 1050
+    assert standin.requests.count("/api/memory/batch") == 6
+    assert sorted(m["content"] for m in standin.stored) == sorted(m["content"] for m in memories)
+
+def test_write_memories_without_bulk_endpoint(standin):
+    standin.batches = 0
+    client = _client(standin)
+    assert client.write_memories([{"content": f"m{i}", "tags": [], "metadata": {}} for i in range(30)]) == 30
+    assert standin.requests.count("/api/memory") == 30
+    assert len(standin.stored) == 30
+
+    # Checked per batch: batches refused after the endpoint goes away are written one by one
+    standin.stored, standin.batches = [], 2
+    memories = [{"content": f"m{i}", "tags": [], "metadata": {}} for i in range(100)]
+    assert client.write_memories(memories, batch_size=10) == 100
+    assert sorted(m["content"] for m in standin.stored) == sorted(m["content"] for m in memories)
+
+def test_batch_write_not_retried_after_gateway_error(standin):
+    # A 502 may come after the backend stored the batch: resending could write it twice
+    standin.failures, standin.failure_status = 1, 502
+    client = _client(standin, session=make_session(backoff=0))
+    assert client.write_memories([{"content": "m", "tags": [], "metadata": {}}]) == 0
+    assert standin.requests == ["/api/memory/batch"]
@@ -0,0 +1,25 @@
+import random
+import pytest
+from network_intelligence.analysis.ranking import ScoreTable
+
+def test_top_matches_stable_sort():
+    rng = random.Random(7)
+    for _ in range(200):
+        scores = {f"n{i}": float(rng.choice([0, 1, 2, rng.random()])) for i in range(rng.randint(0, 40))}
+        n = rng.randint(0, 45)
+        expected = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:n]
+        assert ScoreTable.from_dict(scores).top(n) == expected
+
+def test_rank_and_percentile():
+    table = ScoreTable.from_dict({"a": 1.0, "b": 2.0, "c": 2.0, "d": 3.0})
+    assert table.rank("d") == 1
+    assert table.rank("c") == 2
+    assert table.rank("a") == 4
+    assert table.percentile("a") == pytest.approx(12.5)
+    assert table.percentiles(["b", "d"]).tolist() == pytest.approx([50.0, 87.5])
+
+def test_filter_keeps_order():
+    table = ScoreTable.from_dict({"a": 0.5, "b": 0.05, "c": 0.2})
+    kept = table.filter(table.values > 0.1)
+    assert kept.node_ids == ["a", "c"]
+    assert kept.top(5) == [("a", 0.5), ("c", 0.2)]
@@ -0,0 +1,48 @@
+import pytest
+import networkx as nx
+import numpy as np
+from network_intelligence.analysis.spectral import SpectralEngine
+from network_intelligence.graph.csr import CSRGraph
+
+@pytest.fixture
+def weighted_graph():
+    G = nx.relabel_nodes(nx.powerlaw_cluster_graph(120, 3, 0.3, seed=3), str)
+    rng = np.random.default_rng(3)
+    for u, v in G.edges:
+        G[u][v]["weight"] = float(rng.random() + 0.1)
+    return G
+
+def _as_array(engine, scores):
+    return np.array([scores[n] for n in engine.graph.node_ids])
+
+def test_matches_networkx(weighted_graph):
+    engine = SpectralEngine(weighted_graph)
+
+    eig = engine.eigenvector(max_iter=1000, tol=1e-6)
+    assert eig == pytest.approx(_as_array(engine, nx.eigenvector_centrality(weighted_graph, max_iter=1000)))
+
+    pr = engine.pagerank()
+    assert pr == pytest.approx(_as_array(engine, nx.pagerank(weighted_graph)))
+
+    katz = engine.katz(alpha=0.05)
+    assert katz == pytest.approx(_as_array(engine, nx.katz_centrality(weighted_graph, alpha=0.05)))
+
+def test_warm_start_and_csr_input(weighted_graph):
+    engine = SpectralEngine(CSRGraph.from_networkx(weighted_graph))
+    cold = engine.pagerank()
+
+    warm = engine.pagerank(x0=engine.solutions["pagerank"])
+    assert warm == pytest.approx(cold, abs=1e-4)
+
+    with pytest.raises(ValueError):
+        engine.pagerank(x0=np.ones(3))
+
+def test_katz_divergence_raises(weighted_graph):
+    engine = SpectralEngine(weighted_graph)
+    with pytest.raises(nx.PowerIterationFailedConvergence):
+        engine.katz(alpha=1.0)
+
+def test_lanczos_fallback(weighted_graph):
+    engine = SpectralEngine(weighted_graph)
+    expected = nx.eigenvector_centrality_numpy(weighted_graph)
+    assert engine.eigenvector_lanczos() == pytest.approx(_as_array(engine, expected), abs=1e-6)
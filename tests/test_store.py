@@ -0,0 +1,138 @@
+import pytest
+from network_intelligence.graph.builder import GraphBuilder
+from network_intelligence.identity.entity import PlatformIdentity
+from network_intelligence.identity.resolver import IdentityResolver
+from network_intelligence.identity.store import ResolutionStore
+
+def _person(platform, handle, name, company=None, title=None):
+    return PlatformIdentity(platform=platform, handle=handle, display_name=name, profile_url="",
+                            numeric_id=None, title=title, company=company, verified=False, raw_data={})
+
+FIRST_DAY = [
+    _person("facebook", "johndoe", "John Doe", "Acme"),
+    _person("linkedin", "johndoe", "John Doe", "Globex"),
+    _person("facebook", "jane.roe", "Jane Roe"),
+    _person("linkedin", "jane.roe", "Jane Roe"),
+]
+SECOND_DAY = [
+    _person("twitter", "johndoe", "John Doe"),
+    _person("twitter", "bob.poe", "Bob Poe"),
+]
+
+def _state(resolver):
+    return sorted((e.entity_id, tuple(sorted(f"{i.platform}:{i.handle}" for i in e.identities)))
+                  for e in resolver.entities())
+
+def test_store_round_trip(tmp_path):
+    path = str(tmp_path / "identities.db")
+    resolver = IdentityResolver()
+    resolver.resolve_incremental(FIRST_DAY)
+    store = ResolutionStore(path)
+    assert store.save(resolver) == 4
+    store.close()
+
+    restored = IdentityResolver()
+    assert ResolutionStore(path).load(restored) == 4
+    assert _state(restored) == _state(resolver)
+    assert restored.review_queue == resolver.review_queue
+    assert restored.blocking.keys(FIRST_DAY[0]) == resolver.blocking.keys(FIRST_DAY[0])
+
+def test_store_resolves_only_new_identities(tmp_path):
+    path = str(tmp_path / "identities.db")
+    store = ResolutionStore(path)
+    resolver = IdentityResolver()
+    resolver.resolve_incremental(FIRST_DAY)
+    store.save(resolver)
+    store.close()
+
+    # Reference: one resolver that saw both days
+    reference = IdentityResolver()
+    reference.resolve_incremental(FIRST_DAY)
+    reference.resolve_incremental(SECOND_DAY)
+
+    # Next day: a new process re-reads every source, but only the delta gets blocked and scored
+    store = ResolutionStore(path)
+    resumed = IdentityResolver()
+    store.load(resumed)
+    reloaded = [_person(i.platform, i.handle, i.display_name, i.company) for i in FIRST_DAY]
+    resumed.resolve_incremental(reloaded + SECOND_DAY)
+
+    assert len(resumed.identities) == 6
+    assert resumed.blocking.stats["new_identities"] == 2
+    assert _state(resumed) == _state(reference)
+    # The Twitter profile bridged both John Does; the absorbed one leaves the store
+    assert len(resumed.absorbed) == 1
+    assert store.save(resumed) == 2
+    store.close()
+
+    final = IdentityResolver()
+    ResolutionStore(path).load(final)
+    assert _state(final) == _state(reference)
+
+def test_builder_starts_from_restored_entities(tmp_path):
+    path = str(tmp_path / "identities.db")
+    builder = GraphBuilder(IdentityResolver())
+    builder.add_data_source(FIRST_DAY, [{"source": "johndoe", "target": "jane.roe", "platform": "facebook"}], "mixed")
+    store = ResolutionStore(path)
+    store.save(builder.resolver)
+    store.close()
+
+    resolver = IdentityResolver()
+    ResolutionStore(path).load(resolver)
+    resumed = GraphBuilder(resolver)
+    assert set(resumed.graph.nodes) == set(builder.graph.nodes)
+    resumed.add_data_source(FIRST_DAY, [{"source": "johndoe", "target": "jane.roe", "platform": "facebook"}], "mixed")
+    assert set(resumed.graph.nodes) == set(builder.graph.nodes)
+    assert resumed.graph.number_of_edges() == 1
+
+def test_store_rewrites_replaced_stub(tmp_path):
+    path = str(tmp_path / "identities.db")
+    stub = PlatformIdentity(platform="twitter", handle="bob.poe", display_name="bob.poe", profile_url="",
+                            numeric_id=None, title=None, company=None, verified=False, raw_data={"stub": True})
+    resolver = IdentityResolver()
+    resolver.resolve_incremental(FIRST_DAY + [stub])
+    store = ResolutionStore(path)
+    store.save(resolver)
+
+    resolver.resolve_incremental(SECOND_DAY)
+    assert store.save(resolver) == 1
+    index = resolver.index_of["twitter:bob.poe"]
+    keys = [key for key, in store.connection.execute("SELECT key FROM blocking_keys WHERE idx = ?", (index,))]
+    store.close()
+
+    restored = IdentityResolver()
+    assert ResolutionStore(path).load(restored) == 6
+    assert _state(restored) == _state(resolver)
+    bob = restored.identities[restored.index_of["twitter:bob.poe"]]
+    assert bob.display_name == "Bob Poe" and not bob.raw_data.get("stub")
+    assert {e.canonical_name for e in restored.entities()} >= {"Bob Poe"}
+    # The row keeps its index; its blocking keys are the profile's
+    assert keys == resolver.blocking.keys(bob) and restored.index_of["twitter:bob.poe"] == index
+
+def test_store_rewritten_after_full_resolve(tmp_path):
+    path = str(tmp_path / "identities.db")
+    facebook = _person("facebook", "1", "Bob Poe", "Acme")
+    linkedin = _person("linkedin", "bob", "Bob Poe", "Acme")
+    twitter = _person("twitter", "1", "Ann Lee")
+    resolver = IdentityResolver()
+    resolver.resolve_incremental([facebook, linkedin])
+    store = ResolutionStore(path)
+    store.save(resolver)
+
+    # resolve() (as in GraphBuilder.rebuild()) renumbers every identity
+    resolver.resolve([twitter, linkedin, facebook])
+    store.save(resolver)
+    keys = [key for key, in store.connection.execute("SELECT key FROM identities")]
+    store.close()
+
+    assert sorted(keys) == sorted(resolver.index_of)
+    restored = IdentityResolver()
+    assert ResolutionStore(path).load(restored) == 3
+    assert _state(restored) == _state(resolver)
+    assert restored.review_queue == resolver.review_queue
+
+def test_store_rejects_used_resolver(tmp_path):
+    resolver = IdentityResolver()
+    resolver.resolve(FIRST_DAY)
+    with pytest.raises(ValueError):
+        ResolutionStore(str(tmp_path / "identities.db")).load(resolver)
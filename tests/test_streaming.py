@@ -0,0 +1,74 @@
+import itertools
+import pytest
+from network_intelligence.data_sources.facebook import FacebookLoader
+from network_intelligence.graph.builder import GraphBuilder
+from network_intelligence.graph.streaming import stream_edge_list
+from network_intelligence.identity.resolver import IdentityResolver
+from network_intelligence.identity.store import ResolutionStore
+
+EDGES = [(0, 1), (0, 2), (1, 2), (2, 3), (3, 4), (4, 5), (5, 0), (6, 7), (7, 3)]
+
+@pytest.fixture
+def snap_file(tmp_path):
+    path = tmp_path / "edges.txt"
+    path.write_text("# SNAP header\n" + "".join(f"{u} {v}\n" for u, v in EDGES))
+    return str(path)
+
+class InterruptedLoader(FacebookLoader):
+    """Stops (as a crash would) after a number of chunks."""
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def load_chunked(self, *args, **kwargs):
+        yield from itertools.islice(super().load_chunked(*args, **kwargs), self.chunks)
+        raise KeyboardInterrupt
+
+def _shape(G):
+    return sorted(G.nodes), sorted(tuple(sorted(e)) for e in G.edges())
+
+def test_chunks_resume_by_offset(snap_file):
+    loader = FacebookLoader()
+    _, edges = loader.load_edge_list(snap_file)
+    chunks = list(loader.load_chunked(snap_file, chunk_size=4))
+    assert [len(chunk_edges) for _, chunk_edges, _ in chunks] == [4, 4, 1]
+    assert [e for _, chunk_edges, _ in chunks for e in chunk_edges] == edges
+
+    resumed = list(loader.load_chunked(snap_file, chunk_size=4, resume_from=chunks[0][2]))
+    assert [e for _, chunk_edges, _ in resumed for e in chunk_edges] == edges[4:]
+    # A chunk carries identities for its own nodes
+    assert {i.handle for i in resumed[0][0]} == {"0", "3", "4", "5", "6", "7"}
+
+def test_stream_matches_batch_load(snap_file):
+    nodes, edges = FacebookLoader().load_edge_list(snap_file)
+    batch = GraphBuilder(IdentityResolver())
+    batch.add_data_source(nodes, edges, "facebook")
+
+    streamed = GraphBuilder(IdentityResolver())
+    stats = stream_edge_list(streamed, snap_file, chunk_size=2, progress_interval=3)
+    assert stats["edges"] == len(EDGES) and stats["resumed_from"] == 0
+    assert _shape(streamed.graph) == _shape(batch.graph)
+    assert streamed.all_edges == []
+
+def test_stream_resumes_from_checkpoint(snap_file, tmp_path):
+    checkpoint = str(tmp_path / "checkpoint.json")
+    store_path = str(tmp_path / "identities.db")
+    reference = GraphBuilder(IdentityResolver())
+    stream_edge_list(reference, snap_file, chunk_size=4)
+
+    store = ResolutionStore(store_path)
+    with pytest.raises(KeyboardInterrupt):
+        stream_edge_list(GraphBuilder(IdentityResolver()), snap_file, checkpoint, store, chunk_size=4,
+                         loader=InterruptedLoader(1))
+    store.close()
+
+    resolver = IdentityResolver()
+    store = ResolutionStore(store_path)
+    store.load(resolver)
+    builder = GraphBuilder(resolver)
+    stats = stream_edge_list(builder, snap_file, checkpoint, store, chunk_size=4)
+    assert stats["resumed_from"] > 0 and stats["edges"] == len(EDGES)
+    assert _shape(builder.graph) == _shape(reference.graph)
+
+    # Without a store the checkpoint cannot restore the graph: start over
+    stats = stream_edge_list(GraphBuilder(IdentityResolver()), snap_file, checkpoint, chunk_size=4)
+    assert stats["resumed_from"] == 0